@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Literal, Optional, Union, cast
 
 from pydantic import Field, field_validator
 
@@ -6,13 +6,16 @@ from pipelex.cogt.imgg.imgg_handle import ImggHandle
 from pipelex.cogt.imgg.imgg_job_components import ImggJobConfig, ImggJobParams, ImggJobParamsDefaults
 from pipelex.cogt.llm.llm_job_components import LLMJobConfig
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.ocr.ocr_job_components import OcrPageChunkingConfig
 from pipelex.tools.config.models import ConfigModel
+from pipelex.tools.exceptions import ConfigValidationError
 
 
 class OcrConfig(ConfigModel):
     ocr_handles: List[str]
     page_output_text_file_name: str
     default_page_views_dpi: int
+    page_chunking_config: OcrPageChunkingConfig
 
 
 class ImggConfig(ConfigModel):
@@ -29,10 +32,38 @@ class InstructorConfig(ConfigModel):
     is_openai_structured_output_enabled: bool
 
 
+class LLMResponseCacheConfig(ConfigModel):
+    is_enabled: bool
+    store_path: str
+    ttl_seconds: Union[int, Literal["unlimited"]]
+    max_nb_entries: Union[int, Literal["unlimited"]]
+
+    @field_validator("ttl_seconds", "max_nb_entries")
+    def validate_positive_or_unlimited(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise ConfigValidationError("llm_response_cache_config.ttl_seconds and max_nb_entries must be positive integers or 'unlimited'")
+        return value
+
+    @property
+    def applied_ttl_seconds(self) -> Optional[int]:
+        if self.ttl_seconds == "unlimited":
+            return None
+        else:
+            return self.ttl_seconds
+
+    @property
+    def applied_max_nb_entries(self) -> Optional[int]:
+        if self.max_nb_entries == "unlimited":
+            return None
+        else:
+            return self.max_nb_entries
+
+
 class LLMConfig(ConfigModel):
     preferred_platforms: Dict[str, LLMPlatform]
     instructor_config: InstructorConfig
     llm_job_config: LLMJobConfig
+    llm_response_cache_config: LLMResponseCacheConfig
 
     default_max_images: int
 
@@ -54,6 +85,14 @@ class LLMConfig(ConfigModel):
         return self.preferred_platforms.get(llm_name)
 
 
+class InferenceRetryConfig(ConfigModel):
+    max_attempts: int = Field(..., ge=1)
+    initial_delay_seconds: float = Field(..., gt=0)
+    max_delay_seconds: float = Field(..., gt=0)
+    backoff_multiplier: float = Field(..., ge=1)
+    max_retry_after_seconds: float = Field(..., ge=0)
+
+
 class InferenceManagerConfig(ConfigModel):
     is_auto_setup_preset_llm: bool
     is_auto_setup_preset_imgg: bool
@@ -62,6 +101,7 @@ class InferenceManagerConfig(ConfigModel):
 
 class Cogt(ConfigModel):
     inference_manager_config: InferenceManagerConfig
+    inference_retry_config: InferenceRetryConfig
     llm_config: LLMConfig
     imgg_config: ImggConfig
     ocr_config: OcrConfig
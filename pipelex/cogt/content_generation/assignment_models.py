@@ -1,6 +1,6 @@
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Mapping, Optional, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, SkipValidation
 from typing_extensions import override
 
 from pipelex import log
@@ -118,7 +118,8 @@ class ImggAssignment(BaseModel):
 
 
 class Jinja2Assignment(BaseModel):
-    context: Dict[str, Any]
+    # not validated, so that a lazy mapping such as LazyStuffArtefactDict is not consumed
+    context: SkipValidation[Mapping[str, Any]]
     jinja2_name: Optional[str] = None
     jinja2: Optional[str] = None
     prompting_style: Optional[PromptingStyle] = None
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type, cast
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Type, cast
 
 from typing_extensions import override
 
@@ -15,7 +15,7 @@ from pipelex.cogt.content_generation.assignment_models import (
 from pipelex.cogt.content_generation.content_generator_protocol import ContentGeneratorProtocol, update_job_metadata
 from pipelex.cogt.content_generation.imgg_generate import imgg_gen_image_list, imgg_gen_single_image
 from pipelex.cogt.content_generation.jinja2_generate import jinja2_gen_text
-from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text
+from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text, llm_gen_text_stream
 from pipelex.cogt.content_generation.ocr_generate import ocr_gen_extract_pages
 from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.imgg.imgg_handle import ImggHandle
@@ -57,6 +57,25 @@ class ContentGenerator(ContentGeneratorProtocol):
         log.verbose(f"{self.__class__.__name__} generated text: {generated_text}")
         return generated_text
 
+    @override
+    async def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]:
+        job_metadata.update(updated_metadata=JobMetadata(content_generation_job_id="make_llm_text_stream"))
+        log.verbose(f"{self.__class__.__name__} make_llm_text_stream: {llm_prompt_for_text}")
+        log.verbose(f"llm_setting_main: {llm_setting_main}")
+        llm_assignment = LLMAssignment(
+            job_metadata=job_metadata,
+            llm_setting=llm_setting_main,
+            llm_prompt=llm_prompt_for_text,
+        )
+        log.verbose(llm_assignment.desc, title="llm_assignment")
+        async for text_chunk in llm_gen_text_stream(llm_assignment=llm_assignment):
+            yield text_chunk
+
     @override
     @update_job_metadata
     async def make_object_direct(  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -244,7 +263,7 @@ class ContentGenerator(ContentGeneratorProtocol):
     @override
     async def make_jinja2_text(
         self,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         jinja2_name: Optional[str] = None,
         jinja2: Optional[str] = None,
         prompting_style: Optional[PromptingStyle] = None,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Type
 
 from polyfactory.factories.pydantic_factory import ModelFactory
 from typing_extensions import override
@@ -47,6 +47,19 @@ class ContentGeneratorDry(ContentGeneratorProtocol):
         generated_text = f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
         return generated_text
 
+    @override
+    async def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]:
+        func_name = "make_llm_text_stream"
+        job_metadata.update(updated_metadata=JobMetadata(content_generation_job_id=func_name))
+        log.dev(f"🤡 DRY RUN: {self.__class__.__name__}.{func_name}")
+        prompt_truncated = llm_prompt_for_text.desc(truncate_text_length=self._text_gen_truncate_length)
+        yield f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
+
     @override
     @update_job_metadata
     async def make_object_direct(  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -180,7 +193,7 @@ class ContentGeneratorDry(ContentGeneratorProtocol):
     @override
     async def make_jinja2_text(
         self,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         jinja2_name: Optional[str] = None,
         jinja2: Optional[str] = None,
         prompting_style: Optional[PromptingStyle] = None,
@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, ParamSpec, Protocol, Type, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Mapping, Optional, ParamSpec, Protocol, Type, TypeVar
 
 from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.imgg.imgg_handle import ImggHandle
@@ -51,6 +51,13 @@ class ContentGeneratorProtocol(Protocol):
         llm_prompt_for_text: LLMPrompt,
     ) -> str: ...
 
+    def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]: ...
+
     async def make_object_direct(
         self,
         job_metadata: JobMetadata,
@@ -110,7 +117,7 @@ class ContentGeneratorProtocol(Protocol):
 
     async def make_jinja2_text(
         self,
-        context: Dict[str, Any],
+        context: Mapping[str, Any],
         jinja2_name: Optional[str] = None,
         jinja2: Optional[str] = None,
         prompting_style: Optional[PromptingStyle] = None,
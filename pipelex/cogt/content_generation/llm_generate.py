@@ -1,11 +1,29 @@
-from typing import List
+import asyncio
+from typing import AsyncIterator, List, Optional, Type
 
 from pydantic import BaseModel
 
 from pipelex import log
 from pipelex.cogt.content_generation.assignment_models import LLMAssignment, ObjectAssignment
+from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_response_cache import LLMResponseKind, llm_response_cache, make_llm_response_cache_key
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.hub import get_class_registry, get_llm_worker
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+
+async def _make_text_cache_key(llm_worker: LLMWorkerAbstract, llm_job: LLMJob) -> Optional[str]:
+    if not llm_response_cache.is_enabled:
+        return None
+    # the key hashes the local image files of the prompt, which are read off the event loop
+    return await asyncio.to_thread(
+        make_llm_response_cache_key,
+        response_kind=LLMResponseKind.TEXT,
+        llm_engine_tag=llm_worker.llm_engine.tag,
+        llm_job_params=llm_job.job_params,
+        llm_prompt=llm_job.llm_prompt,
+    )
 
 
 async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
@@ -15,24 +33,75 @@ async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
         llm_prompt=llm_assignment.llm_prompt,
         llm_job_params=llm_assignment.llm_job_params,
     )
+    if (cache_key := await _make_text_cache_key(llm_worker=llm_worker, llm_job=llm_job)) is not None:
+        if (cached_text := await llm_response_cache.get_text(cache_key=cache_key)) is not None:
+            log.verbose(cached_text, title="llm_gen_text from cache")
+            return cached_text
     generated_text = await llm_worker.gen_text(llm_job=llm_job)
     log.verbose(generated_text, title="llm_gen_text")
+    if cache_key is not None:
+        await llm_response_cache.set_text(cache_key=cache_key, text=generated_text)
     return generated_text
 
 
-async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
-    llm_assignment = object_assignment.llm_assignment_for_object
-    log.verbose(f"llm_gen_object to generate a: '{object_assignment.object_class_name}'")
+async def llm_gen_text_stream(llm_assignment: LLMAssignment) -> AsyncIterator[str]:
     llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
     llm_job = LLMJobFactory.make_llm_job(
         job_metadata=llm_assignment.job_metadata,
         llm_prompt=llm_assignment.llm_prompt,
         llm_job_params=llm_assignment.llm_job_params,
     )
+    if (cache_key := await _make_text_cache_key(llm_worker=llm_worker, llm_job=llm_job)) is not None:
+        if (cached_text := await llm_response_cache.get_text(cache_key=cache_key)) is not None:
+            log.verbose(cached_text, title="llm_gen_text_stream from cache")
+            yield cached_text
+            return
+    text_chunks: List[str] = []
+    async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job):
+        text_chunks.append(text_chunk)
+        yield text_chunk
+    generated_text = "".join(text_chunks)
+    log.verbose(generated_text, title="llm_gen_text_stream")
+    if cache_key is not None:
+        await llm_response_cache.set_text(cache_key=cache_key, text=generated_text)
+
+
+async def _llm_gen_object_with_cache(llm_assignment: LLMAssignment, schema: Type[BaseModelTypeVar]) -> BaseModelTypeVar:
+    llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
+    llm_job = LLMJobFactory.make_llm_job(
+        job_metadata=llm_assignment.job_metadata,
+        llm_prompt=llm_assignment.llm_prompt,
+        llm_job_params=llm_assignment.llm_job_params,
+    )
+    cache_key: Optional[str] = None
+    if llm_response_cache.is_enabled:
+        cache_key = await asyncio.to_thread(
+            make_llm_response_cache_key,
+            response_kind=LLMResponseKind.OBJECT,
+            llm_engine_tag=llm_worker.llm_engine.tag,
+            llm_job_params=llm_job.job_params,
+            llm_prompt=llm_job.llm_prompt,
+            schema=schema,
+        )
+        if (cached_object := await llm_response_cache.get_object(cache_key=cache_key, schema=schema)) is not None:
+            log.verbose(f"llm_gen_object: '{schema.__name__}' from cache")
+            return cached_object
+    generated_object = await llm_worker.gen_object(
+        llm_job=llm_job,
+        schema=schema,
+    )
+    if cache_key is not None:
+        await llm_response_cache.set_object(cache_key=cache_key, obj=generated_object)
+    return generated_object
+
+
+async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
+    llm_assignment = object_assignment.llm_assignment_for_object
+    log.verbose(f"llm_gen_object to generate a: '{object_assignment.object_class_name}'")
     content_class_name = object_assignment.object_class_name
     content_class = get_class_registry().get_required_base_model(name=content_class_name)
-    generated_object: BaseModel = await llm_worker.gen_object(
-        llm_job=llm_job,
+    generated_object: BaseModel = await _llm_gen_object_with_cache(
+        llm_assignment=llm_assignment,
         schema=content_class,
     )
     return generated_object
@@ -41,20 +110,14 @@ async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
 async def llm_gen_object_list(object_assignment: ObjectAssignment) -> List[BaseModel]:
     llm_assignment = object_assignment.llm_assignment_for_object
     log.verbose(f"llm_gen_object_list to generate a list of '{object_assignment.object_class_name}'")
-    llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
-    llm_job = LLMJobFactory.make_llm_job(
-        job_metadata=llm_assignment.job_metadata,
-        llm_prompt=llm_assignment.llm_prompt,
-        llm_job_params=llm_assignment.llm_job_params,
-    )
     item_class_name = object_assignment.object_class_name
     item_class = get_class_registry().get_required_class(name=item_class_name)
 
     class ListSchema(BaseModel):
         items: List[item_class]  # type: ignore
 
-    wrapped_list: ListSchema = await llm_worker.gen_object(
-        llm_job=llm_job,
+    wrapped_list: ListSchema = await _llm_gen_object_with_cache(
+        llm_assignment=llm_assignment,
         schema=ListSchema,
     )
     generated_list: List[BaseModel] = wrapped_list.items  # pyright: ignore[reportUnknownMemberType]
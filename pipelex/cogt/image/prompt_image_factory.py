@@ -7,7 +7,7 @@ from pipelex.tools.misc.base_64_utils import (
     load_binary_as_base64_async,
 )
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
-from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.misc.path_utils import InterpretedPathOrUrl, clarify_path_or_url, interpret_path_or_url
 
 
 class PromptImageFactory:
@@ -32,6 +32,8 @@ class PromptImageFactory:
         cls,
         uri: str,
     ) -> PromptImage:
+        if interpret_path_or_url(path_or_uri=uri) == InterpretedPathOrUrl.BASE_64:
+            return PromptImageFactory.make_prompt_image(base_64=uri.split(",", 1)[1].encode())
         file_path, url = clarify_path_or_url(path_or_uri=uri)
         return PromptImageFactory.make_prompt_image(
             file_path=file_path,
@@ -49,11 +49,14 @@ class ImggWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         imgg_job.job_metadata.unit_job_id = UnitJobId.IMGG_TEXT_TO_IMAGE
 
-        # Prepare job
-        imgg_job.imgg_job_before_start(imgg_engine=self.imgg_engine)
+        async def make_attempt() -> GeneratedImage:
+            # Prepare job
+            imgg_job.imgg_job_before_start(imgg_engine=self.imgg_engine)
 
-        # Execute job
-        result = await self._gen_image(imgg_job=imgg_job)
+            # Execute job
+            return await self._gen_image(imgg_job=imgg_job)
+
+        result = await self._run_with_retry(inference_job=imgg_job, make_attempt=make_attempt)
 
         # Report job
         imgg_job.imgg_job_after_complete()
@@ -85,11 +88,14 @@ class ImggWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         imgg_job.job_metadata.unit_job_id = UnitJobId.IMGG_TEXT_TO_IMAGE
 
-        # Prepare job
-        imgg_job.imgg_job_before_start(imgg_engine=self.imgg_engine)
+        async def make_attempt() -> List[GeneratedImage]:
+            # Prepare job
+            imgg_job.imgg_job_before_start(imgg_engine=self.imgg_engine)
+
+            # Execute job
+            return await self._gen_image_list(imgg_job=imgg_job, nb_images=nb_images)
 
-        # Execute job
-        result = await self._gen_image_list(imgg_job=imgg_job, nb_images=nb_images)
+        result = await self._run_with_retry(inference_job=imgg_job, make_attempt=make_attempt)
 
         # Report job
         imgg_job.imgg_job_after_complete()
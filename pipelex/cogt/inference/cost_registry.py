@@ -1,84 +1,107 @@
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
-from pydantic import Field, RootModel
+from pydantic import BaseModel, Field
 from rich import box
 from rich.console import Console
 from rich.table import Table
 
 from pipelex import log
 from pipelex.cogt.exceptions import CostRegistryError
-from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokenCostReportField, LLMTokensUsage, model_cost_per_token
-from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokensUsage, model_cost_per_token
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory, TokenCostsByCategoryDict
 
-CostRegistryRoot = List[LLMTokenCostReport]
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-class CostRegistry(RootModel[CostRegistryRoot]):
-    root: CostRegistryRoot = Field(default_factory=list)
+class CostTotals(BaseModel):
+    """Running totals of the tokens and costs of LLM jobs, by token category."""
+
+    nb_cost_reports: int = 0
+    nb_tokens_by_category: NbTokensByCategoryDict = Field(default_factory=dict)
+    costs_by_token_category: TokenCostsByCategoryDict = Field(default_factory=dict)
+
+    def add_cost_report(self, cost_report: LLMTokenCostReport):
+        self.nb_cost_reports += 1
+        for token_category, nb_tokens in cost_report.nb_tokens_by_category.items():
+            self.nb_tokens_by_category[token_category] = self.nb_tokens_by_category.get(token_category, 0) + nb_tokens
+        for token_category, cost in cost_report.costs_by_token_category.items():
+            self.costs_by_token_category[token_category] = self.costs_by_token_category.get(token_category, 0.0) + cost
+
+    def get_nb_tokens(self, token_category: TokenCategory) -> int:
+        return self.nb_tokens_by_category.get(token_category, 0)
+
+    def get_cost(self, token_category: TokenCategory) -> float:
+        return self.costs_by_token_category.get(token_category, 0.0)
+
+    @property
+    def total_cost(self) -> float:
+        return CostRegistry.compute_total_cost(
+            input_non_cached_cost=self.get_cost(TokenCategory.INPUT_NON_CACHED),
+            input_cached_cost=self.get_cost(TokenCategory.INPUT_CACHED),
+            output_cost=self.get_cost(TokenCategory.OUTPUT),
+        )
+
+
+class CostRegistry(BaseModel):
+    """
+    Cost reports of the LLM jobs of a pipeline run, with their running totals overall and by LLM model.
+
+    The totals are updated as each cost report is added, so generating the report does not go through all the jobs again.
+    pandas is only imported to export the cost reports to a file.
+    """
+
+    cost_reports: List[LLMTokenCostReport] = Field(default_factory=list)
+    totals: CostTotals = Field(default_factory=CostTotals)
+    totals_by_llm_name: Dict[str, CostTotals] = Field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.cost_reports
+
+    def add_cost_report(self, cost_report: LLMTokenCostReport):
+        self.cost_reports.append(cost_report)
+        self.totals.add_cost_report(cost_report=cost_report)
+        if cost_report.llm_name not in self.totals_by_llm_name:
+            self.totals_by_llm_name[cost_report.llm_name] = CostTotals()
+        self.totals_by_llm_name[cost_report.llm_name].add_cost_report(cost_report=cost_report)
+
+    def add_tokens_usage(self, llm_tokens_usage: LLMTokensUsage) -> LLMTokenCostReport:
+        cost_report = self.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+        self.add_cost_report(cost_report=cost_report)
+        return cost_report
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
 
-    def to_dataframe(self) -> pd.DataFrame:
         records: List[Dict[str, Any]] = []
-        for token_cost_report in self.root:
+        for token_cost_report in self.cost_reports:
             record_dict = token_cost_report.as_flat_dictionary()
             records.append(record_dict)
         df = pd.DataFrame(records)
         return df
 
-    @classmethod
-    def generate_report(
-        cls,
-        pipeline_run_id: str,
-        llm_tokens_usages: List[LLMTokensUsage],
-        unit_scale: float,
-        cost_report_file_path: Optional[str] = None,
-    ):
-        if not llm_tokens_usages:
-            if pipeline_run_id != "untitled":
-                log.warning(f"No report to generate for pipeline '{pipeline_run_id}'")
-            else:
-                log.verbose(f"No report to generate for pipeline '{pipeline_run_id}'")
-            return
-        cost_registry = CostRegistry()
-        for llm_tokens_usage in llm_tokens_usages:
-            cost_report = cls.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
-            cost_registry.root.append(cost_report)
-
-        cost_registry_df = cost_registry.to_dataframe()
-
-        # Calculate total costs overall
-        total_nb_tokens_input_cached = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_nb_tokens_input_non_cached = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_nb_tokens_input_joined = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_nb_tokens_output = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_OUTPUT].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_cost_input_cached = cost_registry_df[LLMTokenCostReportField.COST_INPUT_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_cost_input_non_cached = cost_registry_df[LLMTokenCostReportField.COST_INPUT_NON_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_cost_input_joined = cost_registry_df[LLMTokenCostReportField.COST_INPUT_JOINED].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_cost_output = cost_registry_df[LLMTokenCostReportField.COST_OUTPUT].sum()  # pyright: ignore[reportUnknownMemberType]
-        total_cost = cls.compute_total_cost(
-            input_non_cached_cost=total_cost_input_non_cached,
-            input_cached_cost=total_cost_input_cached,
-            output_cost=total_cost_output,
+    def export_to_excel(self, file_path: str):
+        self.to_dataframe().to_excel(  # pyright: ignore[reportUnknownMemberType]
+            file_path,
+            index=False,
         )
 
-        # Calculate costs per LLM model
-        llm_group = cost_registry_df.groupby(LLMTokenCostReportField.LLM_NAME)  # pyright: ignore[reportUnknownMemberType]
-        agg_by_llm_name = llm_group.agg(  # pyright: ignore[reportUnknownMemberType]
-            {
-                LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED: "sum",
-                LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED: "sum",
-                LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED: "sum",
-                LLMTokenCostReportField.NB_TOKENS_OUTPUT: "sum",
-                LLMTokenCostReportField.COST_INPUT_CACHED: "sum",
-                LLMTokenCostReportField.COST_INPUT_NON_CACHED: "sum",
-                LLMTokenCostReportField.COST_INPUT_JOINED: "sum",
-                LLMTokenCostReportField.COST_OUTPUT: "sum",
-            }
-        ).reset_index()
-        if agg_by_llm_name is None or agg_by_llm_name.empty:  # pyright: ignore[reportUnnecessaryComparison]
-            raise CostRegistryError("Empty report aggregation by LLM name")
-
-        console = Console()
+    @classmethod
+    def _make_cost_table_row(cls, cost_totals: CostTotals, unit_scale: float) -> List[str]:
+        return [
+            f"{cost_totals.get_nb_tokens(TokenCategory.INPUT_CACHED):,}",
+            f"{cost_totals.get_nb_tokens(TokenCategory.INPUT_NON_CACHED):,}",
+            f"{cost_totals.get_nb_tokens(TokenCategory.INPUT_JOINED):,}",
+            f"{cost_totals.get_nb_tokens(TokenCategory.OUTPUT):,}",
+            f"{cost_totals.get_cost(TokenCategory.INPUT_CACHED) / unit_scale:.4f}",
+            f"{cost_totals.get_cost(TokenCategory.INPUT_NON_CACHED) / unit_scale:.4f}",
+            f"{cost_totals.get_cost(TokenCategory.INPUT_JOINED) / unit_scale:.4f}",
+            f"{cost_totals.get_cost(TokenCategory.OUTPUT) / unit_scale:.4f}",
+            f"{cost_totals.total_cost / unit_scale:.4f}",
+        ]
+
+    def make_cost_table(self, pipeline_run_id: str, unit_scale: float) -> Table:
         title = "Costs by LLM model"
         title += f" for pipeline '{pipeline_run_id}'"
         table = Table(title=title, box=box.ROUNDED)
@@ -100,50 +123,37 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         table.add_column(f"Output Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Total Cost ({scale_str}$)", justify="right", style="bold yellow")
 
-        for _, row in agg_by_llm_name.iterrows():  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-            llm_name = row[LLMTokenCostReportField.LLM_NAME]  # pyright: ignore[reportUnknownVariableType]
-            row_total_cost = cls.compute_total_cost(
-                input_non_cached_cost=row[LLMTokenCostReportField.COST_INPUT_NON_CACHED],  # pyright: ignore[reportUnknownArgumentType]
-                input_cached_cost=row[LLMTokenCostReportField.COST_INPUT_CACHED],  # pyright: ignore[reportUnknownArgumentType]
-                output_cost=row[LLMTokenCostReportField.COST_OUTPUT],  # pyright: ignore[reportUnknownArgumentType]
-            )
-            table.add_row(
-                llm_name,  # pyright: ignore[reportUnknownArgumentType]
-                f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED]:,}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED]:,}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED]:,}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.NB_TOKENS_OUTPUT]:,}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.COST_INPUT_CACHED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.COST_INPUT_NON_CACHED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.COST_INPUT_JOINED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row[LLMTokenCostReportField.COST_OUTPUT] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
-                f"{row_total_cost / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
-            )
+        for llm_name, llm_totals in sorted(self.totals_by_llm_name.items()):
+            table.add_row(llm_name, *self._make_cost_table_row(cost_totals=llm_totals, unit_scale=unit_scale))
 
         # add total row
         footer_style = "bold"
         table.add_row(
             "Total",
-            f"{total_nb_tokens_input_cached:,}",
-            f"{total_nb_tokens_input_non_cached:,}",
-            f"{total_nb_tokens_input_joined:,}",
-            f"{total_nb_tokens_output:,}",
-            f"{total_cost_input_cached / unit_scale:.4f}",
-            f"{total_cost_input_non_cached / unit_scale:.4f}",
-            f"{total_cost_input_joined / unit_scale:.4f}",
-            f"{total_cost_output / unit_scale:.4f}",
-            f"{total_cost / unit_scale:.4f}",
+            *self._make_cost_table_row(cost_totals=self.totals, unit_scale=unit_scale),
             style=footer_style,
             end_section=True,
         )
+        return table
+
+    def generate_report(
+        self,
+        pipeline_run_id: str,
+        unit_scale: float,
+        cost_report_file_path: Optional[str] = None,
+    ):
+        if self.is_empty:
+            if pipeline_run_id != "untitled":
+                log.warning(f"No report to generate for pipeline '{pipeline_run_id}'")
+            else:
+                log.verbose(f"No report to generate for pipeline '{pipeline_run_id}'")
+            return
 
-        console.print(table)
+        console = Console()
+        console.print(self.make_cost_table(pipeline_run_id=pipeline_run_id, unit_scale=unit_scale))
 
         if cost_report_file_path:
-            cost_registry_df.to_excel(  # pyright: ignore[reportUnknownMemberType]
-                cost_report_file_path,
-                index=False,
-            )
+            self.export_to_excel(file_path=cost_report_file_path)
 
     @classmethod
     def compute_total_cost(cls, input_non_cached_cost: float, input_cached_cost: float, output_cost: float) -> float:
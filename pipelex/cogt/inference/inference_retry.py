@@ -0,0 +1,241 @@
+import asyncio
+import functools
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, TypeVar, cast
+
+import httpx
+import openai
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.cogt.config_cogt import InferenceRetryConfig
+from pipelex.types import StrEnum
+
+InferenceResultType = TypeVar("InferenceResultType")
+
+# Error codes of botocore's ClientError, which carries a response dict instead of a status code attribute
+BOTOCORE_RATE_LIMIT_ERROR_CODES = {"ThrottlingException", "TooManyRequestsException", "Throttling"}
+BOTOCORE_OVERLOAD_ERROR_CODES = {"ServiceUnavailableException", "ModelNotReadyException"}
+BOTOCORE_TIMEOUT_ERROR_CODES = {"ModelTimeoutException", "RequestTimeout"}
+BOTOCORE_SERVER_ERROR_CODES = {"InternalServerException", "InternalFailure"}
+
+
+class RetryableErrorKind(StrEnum):
+    RATE_LIMIT = "rate_limit"
+    OVERLOAD = "overload"
+    TIMEOUT = "timeout"
+    CONNECTION = "connection"
+    SERVER_ERROR = "server_error"
+
+
+class InferenceAttempt(BaseModel):
+    """A failed attempt of an inference job, followed by a retry after delay_seconds."""
+
+    attempt_number: int
+    error_kind: RetryableErrorKind
+    error_message: str
+    retry_after_seconds: Optional[float] = None
+    delay_seconds: float
+
+
+def _iter_exception_chain(exc: BaseException) -> Iterator[BaseException]:
+    # Workers often wrap the provider's error in one of ours with "raise ... from", so the provider's error is looked up in the causes too.
+    # The implicit __context__ is not followed: an error raised while handling another one is not caused by it.
+    seen: Set[int] = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = current.__cause__
+
+
+@functools.cache
+def _get_transient_error_types() -> Tuple[Tuple[Type[BaseException], ...], Tuple[Type[BaseException], ...]]:
+    """Get the exception types of timeouts and of connection errors, including those of the optional provider SDKs that are installed."""
+    timeout_error_types: List[Type[BaseException]] = [TimeoutError, asyncio.TimeoutError, httpx.TimeoutException, openai.APITimeoutError]
+    connection_error_types: List[Type[BaseException]] = [ConnectionError, httpx.NetworkError, httpx.RemoteProtocolError, openai.APIConnectionError]
+    try:
+        import anthropic
+
+        timeout_error_types.append(anthropic.APITimeoutError)
+        connection_error_types.append(anthropic.APIConnectionError)
+    except ImportError:
+        pass
+    try:
+        from botocore import exceptions as botocore_exceptions
+
+        timeout_error_types += [botocore_exceptions.ReadTimeoutError, botocore_exceptions.ConnectTimeoutError]
+        connection_error_types += [botocore_exceptions.EndpointConnectionError, botocore_exceptions.ConnectionClosedError]
+    except ImportError:
+        pass
+    return tuple(timeout_error_types), tuple(connection_error_types)
+
+
+def _get_botocore_response(exc: BaseException) -> Optional[Dict[str, Any]]:
+    response: Any = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return cast(Dict[str, Any], response)
+
+
+def _get_status_code(exc: BaseException) -> Optional[int]:
+    status_code: Any = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    if botocore_response := _get_botocore_response(exc):
+        status_code = botocore_response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    else:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code
+    return None
+
+
+def _get_botocore_error_code(exc: BaseException) -> Optional[str]:
+    if not (botocore_response := _get_botocore_response(exc)):
+        return None
+    error_code: Any = botocore_response.get("Error", {}).get("Code")
+    return error_code if isinstance(error_code, str) else None
+
+
+def _classify_status_code(status_code: int) -> Optional[RetryableErrorKind]:
+    if status_code == 429:
+        return RetryableErrorKind.RATE_LIMIT
+    elif status_code in (503, 529):
+        return RetryableErrorKind.OVERLOAD
+    elif status_code in (408, 504):
+        return RetryableErrorKind.TIMEOUT
+    elif status_code >= 500:
+        return RetryableErrorKind.SERVER_ERROR
+    else:
+        return None
+
+
+def _classify_single_error(exc: BaseException) -> Optional[RetryableErrorKind]:
+    if error_code := _get_botocore_error_code(exc):
+        if error_code in BOTOCORE_RATE_LIMIT_ERROR_CODES:
+            return RetryableErrorKind.RATE_LIMIT
+        elif error_code in BOTOCORE_OVERLOAD_ERROR_CODES:
+            return RetryableErrorKind.OVERLOAD
+        elif error_code in BOTOCORE_TIMEOUT_ERROR_CODES:
+            return RetryableErrorKind.TIMEOUT
+        elif error_code in BOTOCORE_SERVER_ERROR_CODES:
+            return RetryableErrorKind.SERVER_ERROR
+    if (status_code := _get_status_code(exc)) is not None:
+        return _classify_status_code(status_code=status_code)
+    # timeouts are checked first, as some SDKs derive them from their connection error, e.g. openai.APITimeoutError
+    timeout_error_types, connection_error_types = _get_transient_error_types()
+    if isinstance(exc, timeout_error_types):
+        return RetryableErrorKind.TIMEOUT
+    if isinstance(exc, connection_error_types):
+        return RetryableErrorKind.CONNECTION
+    return None
+
+
+def classify_retryable_error(exc: BaseException) -> Optional[RetryableErrorKind]:
+    """Tell whether an inference error is transient and worth a retry, and why. Returns None for errors that would fail again."""
+    for chained_exc in _iter_exception_chain(exc):
+        if error_kind := _classify_single_error(chained_exc):
+            return error_kind
+    return None
+
+
+def _parse_retry_after(header_value: str) -> Optional[float]:
+    try:
+        return max(0.0, float(header_value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def get_retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Read the delay requested by the provider in the Retry-After (or retry-after-ms) header of the error's HTTP response, if any."""
+    for chained_exc in _iter_exception_chain(exc):
+        headers: Any = getattr(getattr(chained_exc, "response", None), "headers", None)
+        if headers is None:
+            continue
+        if (retry_after_ms := headers.get("retry-after-ms")) is not None:
+            try:
+                return max(0.0, float(retry_after_ms) / 1000)
+            except ValueError:
+                pass
+        if (retry_after := headers.get("retry-after")) is not None:
+            return _parse_retry_after(header_value=str(retry_after))
+    return None
+
+
+class InferenceRetryPolicy:
+    """
+    Retries the transient failures of inference calls (rate limits, overloads, timeouts, server errors)
+    with an exponential backoff and full jitter, or after the delay requested by the provider's Retry-After header.
+
+    Until it is set up with the [cogt.inference_retry_config], calls are attempted only once.
+    """
+
+    def __init__(self, retry_config: Optional[InferenceRetryConfig] = None, rng: Optional[random.Random] = None):
+        self.retry_config = retry_config
+        self._rng = rng or random.Random()
+
+    def setup(self, retry_config: InferenceRetryConfig) -> None:
+        self.retry_config = retry_config
+
+    def teardown(self) -> None:
+        self.retry_config = None
+
+    def compute_delay(self, retry_config: InferenceRetryConfig, attempt_number: int, retry_after_seconds: Optional[float] = None) -> float:
+        """Compute the delay before the retry following a failed attempt (attempt numbers start at 1)."""
+        if retry_after_seconds is not None:
+            # Add some jitter to the requested delay so that the calls throttled together don't all retry at the same time
+            return retry_after_seconds + self._rng.uniform(0, retry_config.initial_delay_seconds)
+        backoff = min(
+            retry_config.max_delay_seconds,
+            retry_config.initial_delay_seconds * retry_config.backoff_multiplier ** (attempt_number - 1),
+        )
+        return self._rng.uniform(0, backoff)
+
+    async def run(
+        self,
+        make_attempt: Callable[[], Awaitable[InferenceResultType]],
+        job_desc: str,
+        on_retry: Optional[Callable[[InferenceAttempt], None]] = None,
+    ) -> InferenceResultType:
+        attempt_number = 1
+        while True:
+            try:
+                return await make_attempt()
+            except Exception as exc:
+                retry_config = self.retry_config
+                if retry_config is None or attempt_number >= retry_config.max_attempts:
+                    raise
+                if (error_kind := classify_retryable_error(exc)) is None:
+                    raise
+                retry_after_seconds = get_retry_after_seconds(exc)
+                if retry_after_seconds is not None and retry_after_seconds > retry_config.max_retry_after_seconds:
+                    log.warning(f"{job_desc} failed ({error_kind}) and the provider asked to retry after {retry_after_seconds:.1f}s, giving up")
+                    raise
+                inference_attempt = InferenceAttempt(
+                    attempt_number=attempt_number,
+                    error_kind=error_kind,
+                    error_message=str(exc),
+                    retry_after_seconds=retry_after_seconds,
+                    delay_seconds=self.compute_delay(
+                        retry_config=retry_config, attempt_number=attempt_number, retry_after_seconds=retry_after_seconds
+                    ),
+                )
+            if on_retry:
+                on_retry(inference_attempt)
+            log.debug(
+                f"{job_desc} attempt {attempt_number} failed ({inference_attempt.error_kind}), "
+                f"retrying in {inference_attempt.delay_seconds:.2f}s: {inference_attempt.error_message}"
+            )
+            await asyncio.sleep(inference_attempt.delay_seconds)
+            attempt_number += 1
+
+
+inference_retry_policy = InferenceRetryPolicy()
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
+from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.inference.inference_retry import InferenceAttempt, InferenceResultType, inference_retry_policy
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 
 
@@ -15,3 +18,24 @@ class InferenceWorkerAbstract(ABC):
     @abstractmethod
     def desc(self) -> str:
         pass
+
+    async def _run_with_retry(
+        self,
+        inference_job: InferenceJobAbstract,
+        make_attempt: Callable[[], Awaitable[InferenceResultType]],
+    ) -> InferenceResultType:
+        """Run the attempts of the job, retried on transient provider errors, each failed attempt being reported."""
+
+        def on_retry(inference_attempt: InferenceAttempt):
+            if self.reporting_delegate:
+                self.reporting_delegate.report_inference_attempt(inference_job=inference_job, inference_attempt=inference_attempt)
+
+        async def make_timed_attempt() -> InferenceResultType:
+            with pipe_span_tracer.time_inference_attempt():
+                return await make_attempt()
+
+        return await inference_retry_policy.run(
+            make_attempt=make_timed_attempt,
+            job_desc=f"Inference job '{inference_job.job_metadata.unit_job_id}'",
+            on_retry=on_retry,
+        )
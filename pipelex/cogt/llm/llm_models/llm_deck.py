@@ -71,7 +71,7 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
 
     @override
     def get_llm_setting_for_object(self, override: Optional[LLMSettingChoices] = None) -> LLMSetting:
-        log.debug(f"Getting LLM setting for object with provided_override: {override}")
+        log.debug(lambda: f"Getting LLM setting for object with provided_override: {override}")
         llm_setting: LLMSettingOrPresetId
         if replacement := self.llm_choice_overrides.for_object:
             log.warning(f"General llm setting override for object, '{self.llm_choice_defaults.for_object}' -> '{replacement}'")
@@ -87,7 +87,7 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
 
     @override
     def get_llm_setting_for_object_direct(self, override: Optional[LLMSettingChoices] = None) -> LLMSetting:
-        log.debug(f"Getting LLM preset for object direct with provided_override: {override}")
+        log.debug(lambda: f"Getting LLM preset for object direct with provided_override: {override}")
         llm_setting: LLMSettingOrPresetId
         if replacement := self.llm_choice_overrides.for_object_direct:
             log.warning(f"General choice override for LLM preset for structured, '{self.llm_choice_defaults.for_object_direct}' -> '{replacement}'")
@@ -68,6 +68,9 @@ class LLMModelLibrary(LLMModelProviderAbstract, RootModel[LLMModelLibraryRoot]):
             raise LLMModelLibraryError(f"LLM model library path `{libraries_path}` not found. Please run `pipelex init-libraries` to create it.")
         llm_library: LLMModelLibraryDict = {}
         for library_file_name in sorted(os.listdir(libraries_path)):
+            if library_file_name == LibraryConfig.llm_rate_limits_file_name:
+                # the rate limits are loaded by the LLM rate limiter
+                continue
             library_path = os.path.join(libraries_path, library_file_name)
             llm_families: LLMModelLibraryDict = load_toml_from_path(library_path)
             llm_library.update(llm_families)
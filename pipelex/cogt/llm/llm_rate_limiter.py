@@ -0,0 +1,140 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, RootModel, ValidationError
+
+from pipelex import log
+from pipelex.cogt.exceptions import CogtError
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.libraries.library_config import LibraryConfig
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
+from pipelex.tools.misc.token_bucket import TokenBucket, acquire_from_buckets
+from pipelex.tools.misc.toml_utils import load_toml_from_path
+from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
+
+# Rough estimates used to reserve tokens before the prompt is sent, the reservation is settled with the actual usage afterwards
+ESTIMATED_NB_CHARS_PER_TOKEN = 4
+ESTIMATED_NB_TOKENS_PER_IMAGE = 1000
+
+
+class LLMRateLimitsError(CogtError):
+    pass
+
+
+class LLMRateLimit(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    requests_per_minute: Optional[int] = Field(default=None, ge=1)
+    tokens_per_minute: Optional[int] = Field(default=None, ge=1)
+
+
+class LLMPlatformRateLimit(LLMRateLimit):
+    models: Dict[str, LLMRateLimit] = Field(default_factory=dict)
+
+
+LLMRateLimitsRoot = Dict[LLMPlatform, LLMPlatformRateLimit]
+
+
+class LLMRateLimits(RootModel[LLMRateLimitsRoot]):
+    root: LLMRateLimitsRoot = Field(default_factory=dict)
+
+    def get_rate_limits(self, llm_platform: LLMPlatform, llm_name: str) -> List[Tuple[str, LLMRateLimit]]:
+        """List the rate limits applying to a model on a platform, with the name of their buckets."""
+        platform_rate_limit = self.root.get(llm_platform)
+        if platform_rate_limit is None:
+            return []
+        rate_limits: List[Tuple[str, LLMRateLimit]] = [(llm_platform, platform_rate_limit)]
+        if model_rate_limit := platform_rate_limit.models.get(llm_name):
+            rate_limits.append((f"{llm_platform}/{llm_name}", model_rate_limit))
+        return rate_limits
+
+
+def estimate_llm_job_nb_tokens(llm_job: LLMJob) -> int:
+    """Estimate the tokens counted by the provider for the job: prompt tokens plus the max tokens of the completion if set."""
+    llm_prompt = llm_job.llm_prompt
+    nb_chars = len(llm_prompt.system_text or "") + len(llm_prompt.user_text or "")
+    nb_tokens = nb_chars // ESTIMATED_NB_CHARS_PER_TOKEN + len(llm_prompt.user_images) * ESTIMATED_NB_TOKENS_PER_IMAGE
+    return nb_tokens + (llm_job.job_params.max_tokens or 0)
+
+
+class LLMRateLimitReservation:
+    def __init__(self, token_buckets: List[TokenBucket], nb_tokens_reserved: int):
+        self.token_buckets = token_buckets
+        self.nb_tokens_reserved = nb_tokens_reserved
+
+    def settle(self, llm_job: LLMJob) -> None:
+        """Adjust the token buckets to the tokens actually used by the job, if the worker reported them."""
+        if not self.token_buckets or not (llm_tokens_usage := llm_job.job_report.llm_tokens_usage):
+            return
+        nb_tokens_by_category = llm_tokens_usage.nb_tokens_by_category
+        nb_tokens_used = nb_tokens_by_category.get(TokenCategory.INPUT, 0) + nb_tokens_by_category.get(TokenCategory.OUTPUT, 0)
+        if not nb_tokens_used:
+            return
+        for token_bucket in self.token_buckets:
+            token_bucket.give_back(amount=min(self.nb_tokens_reserved, token_bucket.capacity) - nb_tokens_used)
+
+
+class LLMRateLimiter:
+    """
+    Throttles LLM calls with requests-per-minute and tokens-per-minute token buckets, per platform and per model on a platform.
+
+    The limits are set in the rate limits TOML file of the LLM integrations library. Without limits, calls are never delayed.
+    """
+
+    def __init__(self) -> None:
+        self.rate_limits = LLMRateLimits()
+        self._request_buckets: Dict[str, TokenBucket] = {}
+        self._token_buckets: Dict[str, TokenBucket] = {}
+
+    def setup(self) -> None:
+        rate_limits_path = LibraryConfig.get_llm_rate_limits_path()
+        if not os.path.exists(rate_limits_path):
+            log.debug(f"No LLM rate limits file at '{rate_limits_path}', LLM calls are not rate limited")
+            return
+        try:
+            self.rate_limits = LLMRateLimits.model_validate(load_toml_from_path(path=rate_limits_path))
+        except ValidationError as exc:
+            error_msg = format_pydantic_validation_error(exc)
+            raise LLMRateLimitsError(f"Invalid LLM rate limits in '{rate_limits_path}': {error_msg}") from exc
+        self._request_buckets = {}
+        self._token_buckets = {}
+        log.debug(f"Loaded LLM rate limits for platforms: {list(self.rate_limits.root.keys())}")
+
+    def teardown(self) -> None:
+        self.rate_limits = LLMRateLimits()
+        self._request_buckets = {}
+        self._token_buckets = {}
+
+    def _get_buckets(self, llm_engine: LLMEngine) -> Tuple[List[TokenBucket], List[TokenBucket]]:
+        request_buckets: List[TokenBucket] = []
+        token_buckets: List[TokenBucket] = []
+        for bucket_name, rate_limit in self.rate_limits.get_rate_limits(llm_platform=llm_engine.llm_platform, llm_name=llm_engine.llm_model.llm_name):
+            if requests_per_minute := rate_limit.requests_per_minute:
+                if bucket_name not in self._request_buckets:
+                    self._request_buckets[bucket_name] = TokenBucket(capacity=requests_per_minute)
+                request_buckets.append(self._request_buckets[bucket_name])
+            if tokens_per_minute := rate_limit.tokens_per_minute:
+                if bucket_name not in self._token_buckets:
+                    self._token_buckets[bucket_name] = TokenBucket(capacity=tokens_per_minute)
+                token_buckets.append(self._token_buckets[bucket_name])
+        return request_buckets, token_buckets
+
+    async def acquire(self, llm_engine: LLMEngine, llm_job: LLMJob) -> LLMRateLimitReservation:
+        """Wait until the job fits in all the rate limits of its platform and model, then reserve its request and estimated tokens."""
+        request_buckets, token_buckets = self._get_buckets(llm_engine=llm_engine)
+        if not request_buckets and not token_buckets:
+            return LLMRateLimitReservation(token_buckets=[], nb_tokens_reserved=0)
+        nb_tokens = estimate_llm_job_nb_tokens(llm_job=llm_job)
+        reservations = [(request_bucket, 1.0) for request_bucket in request_buckets]
+        reservations += [(token_bucket, float(nb_tokens)) for token_bucket in token_buckets]
+        waited = await acquire_from_buckets(reservations=reservations)
+        if waited > 0:
+            pipe_span_tracer.record_queue_wait(wait_seconds=waited)
+            log.debug(f"LLM call to '{llm_engine.tag}' was rate limited for {waited:.2f}s")
+        return LLMRateLimitReservation(token_buckets=token_buckets, nb_tokens_reserved=nb_tokens)
+
+
+llm_rate_limiter = LLMRateLimiter()
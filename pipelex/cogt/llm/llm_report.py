@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 from pydantic import BaseModel
 
@@ -72,10 +72,22 @@ class LLMTokenCostReport(BaseModel):
         return the_dict
 
 
+# the cost is computed for every LLM job, so a missing cost is warned about only once per model
+_models_with_missing_cost_warned: Set[str] = set()
+
+
+def _warn_missing_cost_once(model: str, message: str):
+    if model in _models_with_missing_cost_warned:
+        return
+    _models_with_missing_cost_warned.add(model)
+    log.warning(message)
+
+
 def model_cost_per_token(llm_engine: LLMEngine, token_type: TokenCategory) -> float:
     # cost_per_million_tokens_usd should be missing only for models that we run on our own GPUs
     if not llm_engine.llm_model.cost_per_million_tokens_usd:
-        log.warning(f"cost_per_million_tokens_usd is not set for model {llm_engine.llm_model.name_and_version}")
+        model = llm_engine.llm_model.name_and_version
+        _warn_missing_cost_once(model=model, message=f"cost_per_million_tokens_usd is not set for model {model}")
         return 0.0
     # all token types are not used for all models
     if token_type == TokenCategory.INPUT_CACHED:
@@ -86,7 +98,10 @@ def model_cost_per_token(llm_engine: LLMEngine, token_type: TokenCategory) -> fl
             return 0.5 * cost_per_million_tokens / 1000000
         else:
             model = llm_engine.llm_model.name_and_version
-            log.warning(f"cost is not set for model {model} neither for {TokenCategory.INPUT} nor {TokenCategory.INPUT_CACHED}")
+            _warn_missing_cost_once(
+                model=model,
+                message=f"cost is not set for model {model} neither for {TokenCategory.INPUT} nor {TokenCategory.INPUT_CACHED}",
+            )
             return 0.0
     elif token_type == TokenCategory.INPUT_NON_CACHED:
         return model_cost_per_token(llm_engine=llm_engine, token_type=TokenCategory.INPUT)
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from pipelex import log
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBytes, PromptImagePath, PromptImageUrl
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.config import get_config
+from pipelex.tools.storage.sqlite_cache_store import SqliteCacheStore, SqliteCacheStoreError
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+from pipelex.types import StrEnum
+
+# image files are hashed by chunks, so that a large image is not read into memory at once
+IMAGE_FILE_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class LLMResponseKind(StrEnum):
+    TEXT = "text"
+    OBJECT = "object"
+
+
+def make_prompt_image_digest(prompt_image: PromptImage) -> str:
+    if isinstance(prompt_image, PromptImageBytes):
+        return f"bytes:{hashlib.sha256(prompt_image.base_64).hexdigest()}"
+    elif isinstance(prompt_image, PromptImagePath):
+        try:
+            file_hash = hashlib.sha256()
+            with open(prompt_image.file_path, "rb") as image_file:
+                while file_chunk := image_file.read(IMAGE_FILE_HASH_CHUNK_SIZE):
+                    file_hash.update(file_chunk)
+            return f"path:{file_hash.hexdigest()}"
+        except OSError:
+            # the LLM worker will report the unreadable file
+            return f"path:{prompt_image.file_path}"
+    elif isinstance(prompt_image, PromptImageUrl):
+        return f"url:{prompt_image.url}"
+    else:
+        return f"{prompt_image.__class__.__name__}:{prompt_image.model_dump_json()}"
+
+
+def make_llm_response_cache_key(
+    response_kind: LLMResponseKind,
+    llm_engine_tag: str,
+    llm_job_params: LLMJobParams,
+    llm_prompt: LLMPrompt,
+    schema: Optional[Type[BaseModel]] = None,
+) -> str:
+    """
+    Hash everything that determines the response of the LLM: the prompt, the LLM engine, its settings and the output schema.
+
+    The local image files of the prompt are read to be hashed, so call it from a worker thread rather than on the event loop.
+    """
+    key_dict: Dict[str, Any] = {
+        "response_kind": response_kind,
+        "llm_engine_tag": llm_engine_tag,
+        "llm_job_params": llm_job_params.model_dump(),
+        "system_text": llm_prompt.system_text,
+        "user_text": llm_prompt.user_text,
+        "user_images": [make_prompt_image_digest(prompt_image=prompt_image) for prompt_image in llm_prompt.user_images],
+        "schema": schema.model_json_schema() if schema else None,
+    }
+    return hashlib.sha256(json.dumps(key_dict, sort_keys=True).encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Optional cache of LLM responses, persisted in a local SQLite store set up in [cogt.llm_config.llm_response_cache_config].
+
+    Cache errors are logged and never prevent the generation: the LLM is called as if the cache was disabled.
+    The SQLite queries and the (de)serialization of the objects run in a worker thread, off the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._store: Optional[SqliteCacheStore] = None
+
+    def teardown(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return get_config().cogt.llm_config.llm_response_cache_config.is_enabled
+
+    def _get_store(self) -> SqliteCacheStore:
+        if self._store is None:
+            cache_config = get_config().cogt.llm_config.llm_response_cache_config
+            self._store = SqliteCacheStore(
+                db_path=cache_config.store_path,
+                ttl_seconds=cache_config.applied_ttl_seconds,
+                max_nb_entries=cache_config.applied_max_nb_entries,
+            )
+        return self._store
+
+    def _get_text(self, cache_key: str) -> Optional[str]:
+        try:
+            return self._get_store().get(key=cache_key)
+        except SqliteCacheStoreError as exc:
+            log.warning(f"LLM response cache lookup failed: {exc}")
+            return None
+
+    def _set_text(self, cache_key: str, text: str) -> None:
+        try:
+            self._get_store().set(key=cache_key, value=text)
+        except SqliteCacheStoreError as exc:
+            log.warning(f"LLM response cache update failed: {exc}")
+
+    def _get_object(self, cache_key: str, schema: Type[BaseModelTypeVar]) -> Optional[BaseModelTypeVar]:
+        if (cached_json := self._get_text(cache_key=cache_key)) is None:
+            return None
+        try:
+            return schema.model_validate_json(cached_json)
+        except ValidationError as exc:
+            log.warning(f"LLM response cache entry does not match schema '{schema.__name__}', it is discarded: {exc}")
+            return None
+
+    def _set_object(self, cache_key: str, obj: BaseModel) -> None:
+        self._set_text(cache_key=cache_key, text=obj.model_dump_json())
+
+    async def get_text(self, cache_key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_text, cache_key)
+
+    async def set_text(self, cache_key: str, text: str) -> None:
+        await asyncio.to_thread(self._set_text, cache_key, text)
+
+    async def get_object(self, cache_key: str, schema: Type[BaseModelTypeVar]) -> Optional[BaseModelTypeVar]:
+        return await asyncio.to_thread(self._get_object, cache_key, schema)
+
+    async def set_object(self, cache_key: str, obj: BaseModel) -> None:
+        await asyncio.to_thread(self._set_object, cache_key, obj)
+
+
+llm_response_cache = LLMResponseCache()
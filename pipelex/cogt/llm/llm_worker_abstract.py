@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Tuple, Type
 
 from instructor.exceptions import InstructorRetryException
 from typing_extensions import override
@@ -9,6 +9,7 @@ from pipelex.cogt.exceptions import LLMCapabilityError, LLMCompletionError
 from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbstract
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimitReservation, llm_rate_limiter
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.pipeline.job_metadata import UnitJobId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
@@ -61,6 +62,10 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         self,
         llm_job: LLMJob,
     ) -> str:
+        if llm_job.job_config.is_streaming_enabled:
+            text_chunks: List[str] = [text_chunk async for text_chunk in self.gen_text_stream(llm_job=llm_job)]
+            return "".join(text_chunks)
+
         log.debug("LLM Worker gen_text")
         log.verbose(f"\n{self.llm_engine.desc}")
         log.verbose(llm_job.params_desc)
@@ -77,10 +82,19 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         # metadata
         llm_job.job_metadata.unit_job_id = UnitJobId.LLM_GEN_TEXT
 
-        # Prepare job
-        llm_job.llm_job_before_start(llm_engine=self.llm_engine)
+        async def make_attempt() -> str:
+            # Wait for the rate limits
+            rate_limit_reservation = await llm_rate_limiter.acquire(llm_engine=self.llm_engine, llm_job=llm_job)
+
+            # Prepare job
+            llm_job.llm_job_before_start(llm_engine=self.llm_engine)
 
-        result = await self._gen_text(llm_job=llm_job)
+            # Execute job
+            attempt_result = await self._gen_text(llm_job=llm_job)
+            rate_limit_reservation.settle(llm_job=llm_job)
+            return attempt_result
+
+        result = await self._run_with_retry(inference_job=llm_job, make_attempt=make_attempt)
 
         # Cleanup result (Instructor adds the client's response as a _raw_response attribute, we don't want to pass it along)
         if hasattr(result, "_raw_response"):
@@ -100,6 +114,75 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
     ) -> str:
         pass
 
+    async def gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate text and yield it in chunks as they are received from the LLM.
+
+        Failures before the first chunk are retried like for gen_text, failures after it are raised to the caller.
+        The job is reported once the stream is over, even if it failed or was not consumed to the end.
+        """
+        log.debug("LLM Worker gen_text_stream")
+        log.verbose(f"\n{self.llm_engine.desc}")
+        log.verbose(llm_job.params_desc)
+
+        # Verify that the job is valid
+        llm_job.validate_before_execution()
+
+        # Verify feasibility
+        self._check_can_perform_job(llm_job=llm_job)
+
+        # metadata
+        llm_job.job_metadata.unit_job_id = UnitJobId.LLM_GEN_TEXT
+
+        async def make_attempt() -> Tuple[LLMRateLimitReservation, AsyncIterator[str], Optional[str]]:
+            # Wait for the rate limits
+            rate_limit_reservation = await llm_rate_limiter.acquire(llm_engine=self.llm_engine, llm_job=llm_job)
+
+            # Prepare job
+            llm_job.llm_job_before_start(llm_engine=self.llm_engine)
+
+            # Execute job until the first chunk
+            text_chunks = self._gen_text_stream(llm_job=llm_job).__aiter__()
+            try:
+                first_text_chunk = await text_chunks.__anext__()
+            except StopAsyncIteration:
+                first_text_chunk = None
+            except BaseException:
+                # release the connection of the failed attempt before it is retried
+                await self._close_text_stream(text_chunks=text_chunks)
+                raise
+            return rate_limit_reservation, text_chunks, first_text_chunk
+
+        rate_limit_reservation, text_chunks, first_text_chunk = await self._run_with_retry(inference_job=llm_job, make_attempt=make_attempt)
+        try:
+            if first_text_chunk is not None:
+                yield first_text_chunk
+                async for text_chunk in text_chunks:
+                    yield text_chunk
+        finally:
+            await self._close_text_stream(text_chunks=text_chunks)
+            rate_limit_reservation.settle(llm_job=llm_job)
+
+            # Report job
+            llm_job.llm_job_after_complete()
+            if self.reporting_delegate:
+                self.reporting_delegate.report_inference_job(inference_job=llm_job)
+
+    @staticmethod
+    async def _close_text_stream(text_chunks: AsyncIterator[str]) -> None:
+        if isinstance(text_chunks, AsyncGenerator):
+            await text_chunks.aclose()
+
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        """Yield the generated text in chunks. Override this in workers of platforms supporting streaming, by default the whole text is one chunk."""
+        yield await self._gen_text(llm_job=llm_job)
+
     async def gen_object(
         self,
         llm_job: LLMJob,
@@ -123,12 +206,20 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         # metadata
         llm_job.job_metadata.unit_job_id = UnitJobId.LLM_GEN_OBJECT
 
-        # Prepare job
-        llm_job.llm_job_before_start(llm_engine=self.llm_engine)
+        async def make_attempt() -> BaseModelTypeVar:
+            # Wait for the rate limits
+            rate_limit_reservation = await llm_rate_limiter.acquire(llm_engine=self.llm_engine, llm_job=llm_job)
+
+            # Prepare job
+            llm_job.llm_job_before_start(llm_engine=self.llm_engine)
+
+            # Execute job
+            attempt_result = await self._gen_object(llm_job=llm_job, schema=schema)
+            rate_limit_reservation.settle(llm_job=llm_job)
+            return attempt_result
 
-        # Execute job
         try:
-            result = await self._gen_object(llm_job=llm_job, schema=schema)
+            result = await self._run_with_retry(inference_job=llm_job, make_attempt=make_attempt)
         except InstructorRetryException as exc:
             raise LLMCompletionError(
                 f"""Instructor failed to generate object: {schema} after retry with llm '{self.llm_engine.tag}'
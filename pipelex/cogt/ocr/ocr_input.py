@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, model_validator
 from typing_extensions import Self
@@ -14,6 +14,8 @@ class OcrInputError(CogtError):
 class OcrInput(BaseModel):
     image_uri: Optional[str] = None
     pdf_uri: Optional[str] = None
+    # 0-based indices of the PDF pages to OCR, all the pages if None
+    page_indices: Optional[List[int]] = None
 
     @model_validator(mode="after")
     def validate_at_exactly_one_input(self) -> Self:
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from pipelex.tools.config.models import ConfigModel
 
@@ -21,8 +21,16 @@ class OcrJobParams(BaseModel):
         )
 
 
+class OcrPageChunkingConfig(ConfigModel):
+    is_enabled: bool
+    min_nb_pages: int = Field(..., ge=1)
+    nb_pages_per_chunk: int = Field(..., ge=1)
+    max_concurrent_chunks: int = Field(..., ge=1)
+
+
 class OcrJobConfig(ConfigModel):
-    pass
+    # set from the [cogt.ocr_config.page_chunking_config] by the OcrJobFactory if None
+    page_chunking_config: Optional[OcrPageChunkingConfig] = None
 
 
 ########################################################################
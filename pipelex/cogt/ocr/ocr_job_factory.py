@@ -3,6 +3,7 @@ from typing import Optional
 from pipelex.cogt.ocr.ocr_input import OcrInput
 from pipelex.cogt.ocr.ocr_job import OcrJob
 from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig, OcrJobParams, OcrJobReport
+from pipelex.config import get_config
 from pipelex.pipeline.job_metadata import JobCategory, JobMetadata
 
 
@@ -22,6 +23,8 @@ class OcrJobFactory:
         )
         job_params = ocr_job_params or OcrJobParams.make_default_ocr_job_params()
         job_config = ocr_job_config or OcrJobConfig()
+        if job_config.page_chunking_config is None:
+            job_config = job_config.model_copy(update={"page_chunking_config": get_config().cogt.ocr_config.page_chunking_config})
         job_report = OcrJobReport()
 
         return OcrJob(
@@ -3,23 +3,38 @@ from typing import Dict, List, Optional
 from pydantic import Field
 
 from pipelex import log
-from pipelex.tools.misc.base_64_utils import save_base64_to_binary_file
-from pipelex.tools.misc.file_utils import ensure_directory_exists, save_text_to_path
+from pipelex.tools.misc.base_64_utils import decode_base64
+from pipelex.tools.misc.file_utils import ensure_directory_exists, save_bytes_to_binary_file, save_text_to_path
+from pipelex.tools.storage.payload_storage import payload_storage
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel
 
 
 class ExtractedImage(CustomBaseModel):
+    """
+    An image extracted by OCR. Its payload is either inline in base_64 or, when a storage provider is set up,
+    referenced by blob_uri so that it is not copied along with the OCR output.
+    """
+
     image_id: str
     base_64: Optional[str] = None
+    blob_uri: Optional[str] = None
     caption: Optional[str] = None
 
+    def get_bytes(self) -> Optional[bytes]:
+        if blob_uri := self.blob_uri:
+            return payload_storage.load(uri=blob_uri)
+        elif base_64 := self.base_64:
+            return decode_base64(b64=base_64)
+        else:
+            return None
+
     def save_to_directory(self, directory: str):
         ensure_directory_exists(directory)
         log.debug(f"Saving image to directory: {directory}")
-        if base_64 := self.base_64:
+        if image_bytes := self.get_bytes():
             filename = self.image_id
             file_path = f"{directory}/{filename}"
-            save_base64_to_binary_file(b64=base_64, file_path=file_path)
+            save_bytes_to_binary_file(file_path=file_path, byte_data=image_bytes)
 
 
 class ExtractedImageFromPage(ExtractedImage):
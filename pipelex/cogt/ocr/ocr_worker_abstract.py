@@ -1,15 +1,29 @@
+import asyncio
+import time
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbstract
 from pipelex.cogt.ocr.ocr_engine import OcrEngine
+from pipelex.cogt.ocr.ocr_input import OcrInput
 from pipelex.cogt.ocr.ocr_job import OcrJob
 from pipelex.cogt.ocr.ocr_output import OcrOutput
 from pipelex.pipeline.job_metadata import UnitJobId
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
 from pipelex.reporting.reporting_protocol import ReportingProtocol
+from pipelex.tools.misc.path_utils import InterpretedPathOrUrl, interpret_path_or_url
+from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
+
+
+def reindex_chunk_pages(chunk_output: OcrOutput, page_indices: List[int]) -> OcrOutput:
+    """Make sure the pages of a chunk are keyed by their index in the whole document, even if the provider numbered them within the chunk."""
+    if set(chunk_output.pages.keys()) <= set(page_indices):
+        return chunk_output
+    chunk_pages = [chunk_output.pages[chunk_page_index] for chunk_page_index in sorted(chunk_output.pages.keys())]
+    return OcrOutput(pages=dict(zip(page_indices, chunk_pages)))
 
 
 class OcrWorkerAbstract(InferenceWorkerAbstract):
@@ -50,11 +64,10 @@ class OcrWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         ocr_job.job_metadata.unit_job_id = UnitJobId.OCR_EXTRACT_PAGES
 
-        # Prepare job
-        ocr_job.ocr_job_before_start(ocr_engine=self.ocr_engine)
-
-        # Execute job
-        result = await self._ocr_extract_pages(ocr_job=ocr_job)
+        if page_chunks := await self._make_page_chunks(ocr_job=ocr_job):
+            result = await self._ocr_extract_page_chunks(ocr_job=ocr_job, page_chunks=page_chunks)
+        else:
+            result = await self._ocr_extract_pages_with_retry(ocr_job=ocr_job)
 
         # Report job
         ocr_job.ocr_job_after_complete()
@@ -63,6 +76,87 @@ class OcrWorkerAbstract(InferenceWorkerAbstract):
 
         return result
 
+    async def _ocr_extract_pages_with_retry(self, ocr_job: OcrJob) -> OcrOutput:
+        async def make_attempt() -> OcrOutput:
+            # Prepare job
+            ocr_job.ocr_job_before_start(ocr_engine=self.ocr_engine)
+
+            # Execute job
+            return await self._ocr_extract_pages(ocr_job=ocr_job)
+
+        return await self._run_with_retry(inference_job=ocr_job, make_attempt=make_attempt)
+
+    #########################################################
+    # Page chunking
+    #########################################################
+
+    @property
+    def is_page_selection_supported(self) -> bool:
+        """Whether the worker honors the page_indices of its OcrInput, which is required to OCR a PDF in page chunks."""
+        return False
+
+    async def _prepare_pdf_uri_for_page_chunks(self, pdf_uri: str) -> str:
+        """Override to turn the PDF URI into one the chunks can share, e.g. to upload a local file only once."""
+        return pdf_uri
+
+    async def _count_pdf_pages_for_page_chunks(self, pdf_uri: str) -> Optional[int]:
+        """
+        Count the pages of the PDF to split it in page chunks, or return None to OCR it in a single request.
+
+        Only the local PDFs are counted: counting the pages of a remote PDF would download all of it before the provider fetches it again.
+        Override to take the page count from the provider.
+        """
+        if interpret_path_or_url(path_or_uri=pdf_uri) == InterpretedPathOrUrl.URL:
+            log.debug("The pages of a remote PDF are not counted, it is not OCRed in page chunks")
+            return None
+        return await pypdfium2_renderer.count_pages_from_uri(pdf_uri=pdf_uri)
+
+    async def _make_page_chunks(self, ocr_job: OcrJob) -> Optional[List[List[int]]]:
+        chunking_config = ocr_job.job_config.page_chunking_config
+        pdf_uri = ocr_job.ocr_input.pdf_uri
+        if chunking_config is None or not chunking_config.is_enabled or not self.is_page_selection_supported:
+            return None
+        if pdf_uri is None or ocr_job.ocr_input.page_indices is not None:
+            return None
+        nb_pages = await self._count_pdf_pages_for_page_chunks(pdf_uri=pdf_uri)
+        if nb_pages is None or nb_pages < chunking_config.min_nb_pages:
+            return None
+        page_chunks = [
+            list(range(start_index, min(start_index + chunking_config.nb_pages_per_chunk, nb_pages)))
+            for start_index in range(0, nb_pages, chunking_config.nb_pages_per_chunk)
+        ]
+        log.debug(f"OCR of a PDF of {nb_pages} pages split in {len(page_chunks)} chunks")
+        return page_chunks
+
+    async def _ocr_extract_page_chunks(self, ocr_job: OcrJob, page_chunks: List[List[int]]) -> OcrOutput:
+        """
+        OCR the page chunks of a PDF concurrently and merge them into a single OcrOutput.
+
+        Each chunk is retried on its own, so a transient failure only costs the pages of its chunk.
+        """
+        # both checked when making the page chunks
+        assert ocr_job.ocr_input.pdf_uri is not None
+        assert ocr_job.job_config.page_chunking_config is not None
+        shared_pdf_uri = await self._prepare_pdf_uri_for_page_chunks(pdf_uri=ocr_job.ocr_input.pdf_uri)
+        semaphore = asyncio.Semaphore(ocr_job.job_config.page_chunking_config.max_concurrent_chunks)
+
+        async def extract_page_chunk(page_indices: List[int]) -> OcrOutput:
+            chunk_job = ocr_job.model_copy(update={"ocr_input": OcrInput(pdf_uri=shared_pdf_uri, page_indices=page_indices)})
+            queued_at = time.perf_counter()
+            async with semaphore:
+                pipe_span_tracer.record_queue_wait(wait_seconds=time.perf_counter() - queued_at)
+                chunk_output = await self._ocr_extract_pages_with_retry(ocr_job=chunk_job)
+            return reindex_chunk_pages(chunk_output=chunk_output, page_indices=page_indices)
+
+        chunk_tasks = [asyncio.create_task(extract_page_chunk(page_indices=page_indices)) for page_indices in page_chunks]
+        try:
+            chunk_outputs = await asyncio.gather(*chunk_tasks)
+        except BaseException:
+            for chunk_task in chunk_tasks:
+                chunk_task.cancel()
+            raise
+        return OcrOutput(pages={page_index: page for chunk_output in chunk_outputs for page_index, page in chunk_output.pages.items()})
+
     @abstractmethod
     async def _ocr_extract_pages(
         self,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
 
 from pydantic import Field, RootModel
 
@@ -60,6 +60,13 @@ class PluginHandle(StrEnum):
                 return PluginHandle.OPENAI_SDK
 
 
+@runtime_checkable
+class PluginSdkTeardownProtocol(Protocol):
+    """SDK instances holding resources (e.g. connections or threads) implement teardown() to release them."""
+
+    def teardown(self) -> None: ...
+
+
 PluginManagerRoot = Dict[str, Any]
 
 
@@ -69,6 +76,12 @@ class PluginManager(RootModel[PluginManagerRoot]):
     def reset(self):
         self.root.clear()
 
+    def teardown(self):
+        for sdk_instance in self.root.values():
+            if isinstance(sdk_instance, PluginSdkTeardownProtocol):
+                sdk_instance.teardown()
+        self.reset()
+
     def get_llm_sdk_instance(self, llm_sdk_handle: PluginHandle) -> Optional[Any]:
         return self.root.get(llm_sdk_handle)
 
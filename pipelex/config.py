@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Literal, Optional, Union, cast
 
 import shortuuid
 from pydantic import Field, field_validator
@@ -8,11 +8,14 @@ from pipelex.cogt.llm.llm_models.llm_prompting_target import LLMPromptingTarget
 from pipelex.exceptions import PipelexConfigError, StaticValidationErrorType
 from pipelex.hub import get_required_config
 from pipelex.libraries.library_config import LibraryConfig
+from pipelex.pipeline.telemetry.telemetry_config import TelemetryConfig
 from pipelex.pipeline.track.tracker_config import TrackerConfig
 from pipelex.plugins.plugins_config import PluginsConfig
 from pipelex.tools.aws.aws_config import AwsConfig
 from pipelex.tools.config.models import ConfigModel, ConfigRoot
 from pipelex.tools.log.log_config import LogConfig
+from pipelex.tools.misc.http_client_config import HttpClientConfig
+from pipelex.tools.pdf.pdf_renderer_config import PdfRendererConfig
 from pipelex.tools.templating.templating_models import PromptingStyle
 from pipelex.types import StrEnum
 
@@ -40,8 +43,100 @@ class StaticValidationConfig(ConfigModel):
         return the_dict
 
 
+class BatchCheckpointConfig(ConfigModel):
+    is_enabled: bool
+    store_path: str
+    ttl_seconds: Union[int, Literal["unlimited"]]
+
+    @field_validator("ttl_seconds")
+    def validate_ttl_seconds(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError("batch_checkpoint_config.ttl_seconds must be a positive integer or 'unlimited'")
+        return value
+
+    @property
+    def applied_ttl_seconds(self) -> Optional[int]:
+        if self.ttl_seconds == "unlimited":
+            return None
+        else:
+            return self.ttl_seconds
+
+
+class FuncExecutionMode(StrEnum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class FuncExecutionConfig(ConfigModel):
+    default_execution_mode: FuncExecutionMode = Field(strict=False)
+    max_thread_workers: int = Field(ge=1)
+    max_process_workers: int = Field(ge=1)
+
+
+class BlobStoreConfig(ConfigModel):
+    is_enabled: bool
+    store_dir: str
+    ttl_seconds: Union[int, Literal["unlimited"]]
+
+    @field_validator("ttl_seconds")
+    def validate_ttl_seconds(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError("blob_store_config.ttl_seconds must be a positive integer or 'unlimited'")
+        return value
+
+    @property
+    def applied_ttl_seconds(self) -> Optional[int]:
+        if self.ttl_seconds == "unlimited":
+            return None
+        else:
+            return self.ttl_seconds
+
+
 class PipeRunConfig(ConfigModel):
     pipe_stack_limit: int
+    batch_max_concurrency: Union[int, Literal["unlimited"]]
+    batch_checkpoint_config: BatchCheckpointConfig
+    func_execution_config: FuncExecutionConfig
+
+    @field_validator("batch_max_concurrency")
+    def validate_batch_max_concurrency(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError("pipe_run_config.batch_max_concurrency must be a positive integer or 'unlimited'")
+        return value
+
+    @property
+    def applied_batch_max_concurrency(self) -> Optional[int]:
+        if self.batch_max_concurrency == "unlimited":
+            return None
+        else:
+            return self.batch_max_concurrency
+
+
+class PipelineRetentionConfig(ConfigModel):
+    max_nb_open_runs: Union[int, Literal["unlimited"]]
+    idle_ttl_seconds: Union[int, Literal["unlimited"]]
+    is_report_generated_on_eviction: bool
+
+    @field_validator("max_nb_open_runs", "idle_ttl_seconds")
+    def validate_limits(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError("pipeline_retention_config limits must be positive integers or 'unlimited'")
+        return value
+
+    @property
+    def applied_max_nb_open_runs(self) -> Optional[int]:
+        if self.max_nb_open_runs == "unlimited":
+            return None
+        else:
+            return self.max_nb_open_runs
+
+    @property
+    def applied_idle_ttl_seconds(self) -> Optional[int]:
+        if self.idle_ttl_seconds == "unlimited":
+            return None
+        else:
+            return self.idle_ttl_seconds
 
 
 class DryRunConfig(ConfigModel):
@@ -98,16 +193,21 @@ class Pipelex(ConfigModel):
     feature_config: FeatureConfig
     log_config: LogConfig
     aws_config: AwsConfig
+    http_client_config: HttpClientConfig
+    blob_store_config: BlobStoreConfig
+    pdf_renderer_config: PdfRendererConfig
 
     library_config: LibraryConfig
     static_validation_config: StaticValidationConfig
     generic_template_names: GenericTemplateNames
     tracker_config: TrackerConfig
+    telemetry_config: TelemetryConfig
     structure_config: StructureConfig
     prompting_config: PromptingConfig
 
     dry_run_config: DryRunConfig
     pipe_run_config: PipeRunConfig
+    pipeline_retention_config: PipelineRetentionConfig
     reporting_config: ReportingConfig
 
 
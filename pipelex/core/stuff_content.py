@@ -14,11 +14,12 @@ from yattag import Doc
 
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.ocr.ocr_output import ExtractedImage
-from pipelex.tools.misc.base_64_utils import save_base64_to_binary_file
-from pipelex.tools.misc.file_utils import ensure_directory_exists, get_incremental_file_path, save_text_to_path
-from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64
+from pipelex.tools.misc.base_64_utils import decode_base64
+from pipelex.tools.misc.file_utils import ensure_directory_exists, get_incremental_file_path, save_bytes_to_binary_file, save_text_to_path
+from pipelex.tools.misc.filetype_utils import detect_file_type_from_bytes
 from pipelex.tools.misc.markdown_utils import convert_to_markdown
 from pipelex.tools.misc.path_utils import InterpretedPathOrUrl, interpret_path_or_url
+from pipelex.tools.storage.payload_storage import payload_storage
 from pipelex.tools.templating.templating_models import TextFormat
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel, clean_model_to_dict
 
@@ -186,6 +187,7 @@ class ImageContent(StuffContentInitableFromStr):
     source_prompt: Optional[str] = None
     caption: Optional[str] = None
     base_64: Optional[str] = None
+    blob_uri: Optional[str] = None
 
     @property
     @override
@@ -193,6 +195,28 @@ class ImageContent(StuffContentInitableFromStr):
         url_desc = interpret_path_or_url(path_or_uri=self.url).desc
         return f"{url_desc} or an image"
 
+    def get_bytes(self) -> Optional[bytes]:
+        """Get the image payload held by this content, if any, loading it from the payload storage if it was offloaded there."""
+        if blob_uri := self.blob_uri:
+            return payload_storage.load(uri=blob_uri)
+        elif base_64 := self.base_64:
+            return decode_base64(b64=base_64)
+        else:
+            return None
+
+    def get_base_64(self) -> Optional[str]:
+        if blob_uri := self.blob_uri:
+            return base64.b64encode(payload_storage.load(uri=blob_uri)).decode("utf-8")
+        return self.base_64
+
+    def get_resolved_url(self) -> str:
+        """Get the url of the image, a blob reference being resolved to a data URL holding the payload loaded from the payload storage."""
+        if interpret_path_or_url(path_or_uri=self.url) != InterpretedPathOrUrl.BLOB:
+            return self.url
+        image_bytes = payload_storage.load(uri=self.url)
+        file_type = detect_file_type_from_bytes(buf=image_bytes)
+        return f"data:{file_type.mime};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+
     @classmethod
     @override
     def make_from_str(cls, str_value: str) -> "ImageContent":
@@ -205,13 +229,13 @@ class ImageContent(StuffContentInitableFromStr):
     @override
     def rendered_html(self) -> str:
         doc = Doc()
-        doc.stag("img", src=self.url, klass="msg-img")
+        doc.stag("img", src=self.get_resolved_url(), klass="msg-img")
 
         return doc.getvalue()
 
     @override
     def rendered_markdown(self, level: int = 1, is_pretty: bool = False) -> str:
-        return f"![{self.url}]({self.url})"
+        return f"![{self.url}]({self.get_resolved_url()})"
 
     @override
     def rendered_json(self) -> str:
@@ -222,6 +246,7 @@ class ImageContent(StuffContentInitableFromStr):
         return cls(
             url=extracted_image.image_id,
             base_64=extracted_image.base_64,
+            blob_uri=extracted_image.blob_uri,
             caption=extracted_image.caption,
         )
 
@@ -229,6 +254,9 @@ class ImageContent(StuffContentInitableFromStr):
     def make_from_image(cls, image: Image.Image) -> Self:
         buffer = BytesIO()
         image.save(buffer, format="PNG")
+        # the stuff holds only the blob reference, resolved by get_bytes(), get_base_64() and get_resolved_url()
+        if blob_uri := payload_storage.store(data=buffer.getvalue()):
+            return cls(url=blob_uri, blob_uri=blob_uri)
         base_64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
         return cls(
             url=f"data:image/png;base64,{base_64}",
@@ -238,7 +266,7 @@ class ImageContent(StuffContentInitableFromStr):
     def save_to_directory(self, directory: str, base_name: Optional[str] = None, extension: Optional[str] = None):
         ensure_directory_exists(directory)
         base_name = base_name or "img"
-        if base_64 := self.base_64:
+        if image_bytes := self.get_bytes():
             if not extension:
                 match interpret_path_or_url(path_or_uri=self.url):
                     case InterpretedPathOrUrl.FILE_NAME:
@@ -246,7 +274,7 @@ class ImageContent(StuffContentInitableFromStr):
                         base_name = parts[0]
                         extension = parts[1]
                     case _:
-                        file_type = detect_file_type_from_base64(b64=base_64)
+                        file_type = detect_file_type_from_bytes(buf=image_bytes)
                         base_name = base_name or "img"
                         extension = file_type.extension
                 file_path = get_incremental_file_path(
@@ -255,7 +283,7 @@ class ImageContent(StuffContentInitableFromStr):
                     extension=extension,
                     avoid_suffix_if_possible=True,
                 )
-                save_base64_to_binary_file(b64=base_64, file_path=file_path)
+                save_bytes_to_binary_file(file_path=file_path, byte_data=image_bytes)
 
         if caption := self.caption:
             caption_file_path = get_incremental_file_path(
@@ -1,8 +1,8 @@
 from operator import attrgetter
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Set, Type
 
 from pydantic import BaseModel, Field, model_validator
-from typing_extensions import Self
+from typing_extensions import Self, override
 
 from pipelex import log, pretty_print
 from pipelex.core.concept_native import NativeConcept
@@ -35,6 +35,71 @@ StuffDict = Dict[str, Stuff]
 StuffArtefactDict = Dict[str, StuffArtefact]
 
 
+class LazyStuffArtefactDict(MutableMapping[str, Any]):
+    """
+    A mapping of stuff names to their StuffArtefact, which are only made when accessed, then kept.
+
+    Making an artefact dumps the whole stuff content, which is costly for images, PDFs or long lists:
+    when used as a jinja2 context, only the variables actually referenced by the template get dumped.
+    Values set explicitly (e.g. extra context) are stored as is.
+    """
+
+    def __init__(self, stuffs: StuffDict, aliases: Dict[str, str]):
+        self._stuffs = stuffs.copy()
+        self._aliases = aliases.copy()
+        self._values: Dict[str, Any] = {}
+
+    @override
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        # aliases share the artefact of their target
+        name = self._aliases.get(key, key)
+        if name not in self._stuffs:
+            raise KeyError(key)
+        artefact = self._values.get(name)
+        if artefact is None:
+            artefact = self._stuffs[name].make_artefact()
+            self._values[name] = artefact
+        self._values[key] = artefact
+        return artefact
+
+    @override
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._stuffs.pop(key, None)
+        self._aliases.pop(key, None)
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._stuffs or key in self._aliases
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._list_keys())
+
+    @override
+    def __len__(self) -> int:
+        return len(self._list_keys())
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={self._list_keys()})"
+
+    def _list_keys(self) -> List[str]:
+        return list(dict.fromkeys([*self._stuffs.keys(), *self._aliases.keys(), *self._values.keys()]))
+
+    @property
+    def nb_made_artefacts(self) -> int:
+        return len([name for name in self._stuffs if name in self._values])
+
+
 class WorkingMemory(BaseModel):
     root: StuffDict = Field(default_factory=dict)
     aliases: Dict[str, str] = Field(default_factory=dict)
@@ -64,18 +129,25 @@ class WorkingMemory(BaseModel):
     def make_deep_copy(self) -> Self:
         return self.model_copy(deep=True)
 
+    def make_branch_copy(self) -> Self:
+        """
+        Make a copy-on-write copy of the working memory, to run a branch (PipeBatch item, PipeParallel branch) in isolation.
+
+        The branch gets its own name and alias mappings but shares the Stuff objects of its parent, which are
+        never mutated once stored: adding, replacing or removing stuffs in the branch only affects the branch.
+        The cost is proportional to the number of names, not to the size of the contents (images, PDFs, lists...).
+        Use make_deep_copy() if you need to mutate the stuffs themselves.
+        """
+        return self.model_copy(update={"root": self.root.copy(), "aliases": self.aliases.copy()})
+
     def generate_full_stuff_dict(self) -> StuffDict:
         full_stuff_dict: StuffDict = self.root.copy()
         full_stuff_dict.update({alias: self.root[target] for alias, target in self.aliases.items()})
         return full_stuff_dict
 
-    def generate_stuff_artefact_dict(self) -> StuffArtefactDict:
-        artefact_dict: StuffArtefactDict = {}
-        for name, stuff in self.root.items():
-            artefact_dict[name] = stuff.make_artefact()
-        for alias, target in self.aliases.items():
-            artefact_dict[alias] = artefact_dict[target]
-        return artefact_dict
+    def generate_stuff_artefact_dict(self) -> LazyStuffArtefactDict:
+        """Make a lazy mapping of all names and aliases to their stuff artefacts, which are only made when accessed."""
+        return LazyStuffArtefactDict(stuffs=self.root, aliases=self.aliases)
 
     def get_optional_stuff(self, name: str) -> Optional[Stuff]:
         if named_stuff := self.root.get(name):
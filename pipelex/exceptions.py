@@ -169,6 +169,10 @@ class PipeStackOverflowError(PipeExecutionError):
     pass
 
 
+class PipeFuncError(PipeExecutionError):
+    pass
+
+
 class PipeConditionError(PipelexError):
     pass
 
@@ -235,7 +239,11 @@ class ConceptDomainError(ConceptError):
     pass
 
 
-class PipelineManagerNotFoundError(PipelexError):
+class PipelineManagerError(PipelexError):
+    pass
+
+
+class PipelineManagerNotFoundError(PipelineManagerError):
     pass
 
 
@@ -5,6 +5,9 @@ from pipelex.tools.misc.file_utils import copy_file_from_package, copy_folder_fr
 
 
 class LibraryConfig(ConfigModel):
+    is_library_snapshot_enabled: bool
+    library_snapshot_dir: str
+
     # Class variables
     package_name: ClassVar[str] = "pipelex"
     internal_library_root: ClassVar[str] = "libraries"
@@ -16,6 +19,7 @@ class LibraryConfig(ConfigModel):
     test_pipelines_path: ClassVar[str] = "tests/test_pipelines"
     internal_llm_integrations_path: ClassVar[str] = f"{internal_library_root}/llm_integrations"
     exported_llm_integrations_path: ClassVar[str] = f"{exported_library_root}/llm_integrations"
+    llm_rate_limits_file_name: ClassVar[str] = "rate_limits.toml"
     internal_llm_deck_path: ClassVar[str] = f"{internal_library_root}/llm_deck"
     exported_llm_deck_path: ClassVar[str] = f"{exported_library_root}/llm_deck"
     internal_templates_path: ClassVar[str] = f"{internal_library_root}/templates"
@@ -31,6 +35,14 @@ class LibraryConfig(ConfigModel):
     def get_templates_paths(cls) -> List[str]:
         return [str(path) for path in find_files_in_dir(dir_path=cls.exported_templates_path, pattern="*.toml", is_recursive=True)]
 
+    @classmethod
+    def get_llm_integrations_paths(cls) -> List[str]:
+        return [str(path) for path in find_files_in_dir(dir_path=cls.exported_llm_integrations_path, pattern="*.toml", is_recursive=True)]
+
+    @classmethod
+    def get_llm_rate_limits_path(cls) -> str:
+        return f"{cls.exported_llm_integrations_path}/{cls.llm_rate_limits_file_name}"
+
     @classmethod
     def export_libraries(cls, overwrite: bool = False) -> None:
         """Duplicate pipelex libraries files in the client project, preserving directory structure."""
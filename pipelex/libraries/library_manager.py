@@ -1,13 +1,15 @@
 import os
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional, Type
 
 from kajson.exceptions import ClassRegistryInheritanceError, ClassRegistryNotFoundError
 from kajson.kajson_manager import KajsonManager
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from pipelex import log
 from pipelex.cogt.llm.llm_models.llm_deck import LLMDeck
+from pipelex.config import get_config
 from pipelex.core.concept_factory import ConceptFactory
 from pipelex.core.concept_library import ConceptLibrary
 from pipelex.core.domain import Domain
@@ -24,9 +26,11 @@ from pipelex.exceptions import (
     StaticValidationError,
 )
 from pipelex.libraries.library_config import LibraryConfig
+from pipelex.libraries.library_snapshot import LibrarySnapshot, LibrarySnapshotError, LibrarySnapshotStore, compute_library_snapshot_key
 from pipelex.tools.class_registry_utils import ClassRegistryUtils
 from pipelex.tools.misc.file_utils import find_files_in_dir
 from pipelex.tools.misc.json_utils import deep_update
+from pipelex.tools.misc.timing_utils import PhaseTimer
 from pipelex.tools.misc.toml_utils import load_toml_from_path
 from pipelex.tools.runtime_manager import runtime_manager
 from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
@@ -50,6 +54,15 @@ class LibraryComponent(StrEnum):
                 return PipeLibraryError
 
 
+class ParsedLibraryFile(BaseModel):
+    toml_path: Path
+    library_dict: Dict[str, Any]
+
+    @property
+    def library_name(self) -> str:
+        return self.toml_path.stem
+
+
 class LibraryManager:
     allowed_root_attributes: ClassVar[List[str]] = [
         "domain",
@@ -59,37 +72,55 @@ class LibraryManager:
         "prompt_template_to_structure",
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, phase_timer: Optional[PhaseTimer] = None) -> None:
+        self.phase_timer = phase_timer or PhaseTimer()
         # TODO : avoid having an Option LLMDeck: regroup with model provider
         self.llm_deck: Optional[LLMDeck] = None
         self.domain_library = DomainLibrary()
         self.concept_library = ConceptLibrary()
         self.pipe_library = PipeLibrary()
+        self._library_snapshot_key: Optional[str] = None
 
     def teardown(self) -> None:
         self.llm_deck = None
+        self._library_snapshot_key = None
         self.pipe_library.teardown()
         self.concept_library.teardown()
         self.domain_library.teardown()
 
-    def load_libraries(self):
-        log.debug("LibraryManager loading separate libraries")
-
-        ClassRegistryUtils.register_classes_in_folder(
-            folder_path=LibraryConfig.loaded_pipelines_path,
-        )
+    @classmethod
+    def get_library_paths(cls) -> List[str]:
         library_paths = [LibraryConfig.loaded_pipelines_path]
         if runtime_manager.is_unit_testing:
-            log.debug("Registering test pipeline structures for unit testing")
+            library_paths += [LibraryConfig.test_pipelines_path]
+        return library_paths
+
+    def load_libraries(self, library_snapshot: Optional[LibrarySnapshot] = None):
+        """
+        Load the libraries from their TOML files, or from a library snapshot if one is provided.
+
+        The structure classes of the libraries are registered in both cases because they are needed at runtime.
+        """
+        log.debug("LibraryManager loading separate libraries")
+
+        with self.phase_timer.phase("library_classes"):
             ClassRegistryUtils.register_classes_in_folder(
-                folder_path=LibraryConfig.test_pipelines_path,
+                folder_path=LibraryConfig.loaded_pipelines_path,
             )
-            library_paths += [LibraryConfig.test_pipelines_path]
+            if runtime_manager.is_unit_testing:
+                log.debug("Registering test pipeline structures for unit testing")
+                ClassRegistryUtils.register_classes_in_folder(
+                    folder_path=LibraryConfig.test_pipelines_path,
+                )
+
+        if library_snapshot is not None:
+            self._restore_library_snapshot(library_snapshot=library_snapshot)
+            return
 
         native_concepts = ConceptFactory.list_native_concepts()
         self.concept_library.add_concepts(concepts=native_concepts)
 
-        self._load_combo_libraries(library_paths=library_paths)
+        self._load_combo_libraries(library_paths=self.get_library_paths())
 
     def load_deck(self) -> LLMDeck:
         llm_deck_paths = LibraryConfig.get_llm_deck_paths()
@@ -123,61 +154,76 @@ class LibraryManager:
                 log.warning(f"No TOML files found in library path: {libraries_path}")
             toml_file_paths.extend(found_file_paths)
 
+        # Parse each file once, all passes below share the parsed library files
+        with self.phase_timer.phase("library_parsing"):
+            library_files = [
+                ParsedLibraryFile(toml_path=toml_path, library_dict=load_toml_from_path(path=str(toml_path))) for toml_path in toml_file_paths
+            ]
+
         # First pass: load all domains
-        for toml_path in toml_file_paths:
-            library_dict = load_toml_from_path(path=str(toml_path))
-            library_name = toml_path.stem
-            domain_code = library_dict.get("domain")
-            if domain_code is None:
-                raise LibraryParsingError(
-                    f"Error loading library '{library_name}' which has no domain set at '{toml_path}'. "
-                    "Just write 'domain = \"my_domain\"' at the top of the file."
+        with self.phase_timer.phase("library_domains"):
+            for library_file in library_files:
+                library_dict = library_file.library_dict
+                domain_code = library_dict.get("domain")
+                if domain_code is None:
+                    raise LibraryParsingError(
+                        f"Error loading library '{library_file.library_name}' which has no domain set at '{library_file.toml_path}'. "
+                        "Just write 'domain = \"my_domain\"' at the top of the file."
+                    )
+                domain_definition = library_dict.get("definition")
+                system_prompt = library_dict.get("system_prompt")
+                system_prompt_to_structure = library_dict.get("system_prompt_to_structure")
+                prompt_template_to_structure = library_dict.get("prompt_template_to_structure")
+                domain = Domain(
+                    code=domain_code,
+                    definition=domain_definition,
+                    system_prompt=system_prompt,
+                    system_prompt_to_structure=system_prompt_to_structure,
+                    prompt_template_to_structure=prompt_template_to_structure,
                 )
-            domain_definition = library_dict.get("definition")
-            system_prompt = library_dict.get("system_prompt")
-            system_prompt_to_structure = library_dict.get("system_prompt_to_structure")
-            prompt_template_to_structure = library_dict.get("prompt_template_to_structure")
-            domain = Domain(
-                code=domain_code,
-                definition=domain_definition,
-                system_prompt=system_prompt,
-                system_prompt_to_structure=system_prompt_to_structure,
-                prompt_template_to_structure=prompt_template_to_structure,
-            )
-            self.domain_library.add_domain_details(domain=domain)
+                self.domain_library.add_domain_details(domain=domain)
 
         # Second pass: load all concepts
-        for toml_path in toml_file_paths:
-            nb_concepts_before = len(self.concept_library.root)
-            library_dict = load_toml_from_path(path=str(toml_path))
-            library_name = toml_path.stem
-            try:
-                self._load_library_dict(library_name=library_name, library_dict=library_dict, component_type=LibraryComponent.CONCEPT)
-            except ConceptLibraryError as exc:
-                raise LibraryError(f"Error loading concepts from library '{library_name}' at '{toml_path}': {exc}") from exc
-            nb_concepts_loaded = len(self.concept_library.root) - nb_concepts_before
-            log.verbose(f"Loaded {nb_concepts_loaded} concepts from '{toml_path.name}'")
+        with self.phase_timer.phase("library_concepts"):
+            for library_file in library_files:
+                nb_concepts_before = len(self.concept_library.root)
+                try:
+                    self._load_library_dict(
+                        library_name=library_file.library_name,
+                        library_dict=library_file.library_dict,
+                        component_type=LibraryComponent.CONCEPT,
+                    )
+                except ConceptLibraryError as exc:
+                    raise LibraryError(
+                        f"Error loading concepts from library '{library_file.library_name}' at '{library_file.toml_path}': {exc}"
+                    ) from exc
+                nb_concepts_loaded = len(self.concept_library.root) - nb_concepts_before
+                log.verbose(f"Loaded {nb_concepts_loaded} concepts from '{library_file.toml_path.name}'")
 
         # Third pass: load all pipes
-        for toml_path in toml_file_paths:
-            nb_pipes_before = len(self.pipe_library.root)
-            library_dict = load_toml_from_path(path=str(toml_path))
-            library_name = toml_path.stem
-            try:
-                self._load_library_dict(library_name=library_name, library_dict=library_dict, component_type=LibraryComponent.PIPE)
-            except StaticValidationError as static_validation_error:
-                static_validation_error.file_path = str(toml_path)
-                log.error(static_validation_error.desc())
-                raise static_validation_error
-            except PipeLibraryError as pipe_library_error:
-                raise LibraryError(
-                    f"Error loading pipes from library '{library_name}' at '{toml_path}': {pipe_library_error}"
-                ) from pipe_library_error
-            nb_pipes_loaded = len(self.pipe_library.root) - nb_pipes_before
-            log.verbose(f"Loaded {nb_pipes_loaded} pipes from '{toml_path.name}'")
+        with self.phase_timer.phase("library_pipes"):
+            for library_file in library_files:
+                nb_pipes_before = len(self.pipe_library.root)
+                try:
+                    self._load_library_dict(
+                        library_name=library_file.library_name,
+                        library_dict=library_file.library_dict,
+                        component_type=LibraryComponent.PIPE,
+                    )
+                except StaticValidationError as static_validation_error:
+                    static_validation_error.file_path = str(library_file.toml_path)
+                    log.error(static_validation_error.desc())
+                    raise static_validation_error
+                except PipeLibraryError as pipe_library_error:
+                    raise LibraryError(
+                        f"Error loading pipes from library '{library_file.library_name}' at '{library_file.toml_path}': {pipe_library_error}"
+                    ) from pipe_library_error
+                nb_pipes_loaded = len(self.pipe_library.root) - nb_pipes_before
+                log.verbose(f"Loaded {nb_pipes_loaded} pipes from '{library_file.toml_path.name}'")
 
     def _load_library_dict(self, library_name: str, library_dict: Dict[str, Any], component_type: LibraryComponent):
-        if domain_code := library_dict.pop("domain", None):
+        # the library dict is shared by all the loading passes so it must not be modified
+        if domain_code := library_dict.get("domain"):
             # domain is set at the root of the library
             self._load_library_components_from_recursive_dict(
                 domain_code=domain_code,
@@ -226,7 +272,7 @@ class LibraryManager:
                 self.concept_library.add_new_concept(concept=concept_from_def)
             elif isinstance(concept_obj, dict):
                 # blueprint dict definition
-                concept_obj_dict: Dict[str, Any] = concept_obj
+                concept_obj_dict: Dict[str, Any] = concept_obj.copy()
                 try:
                     concept_from_dict = ConceptFactory.make_from_details_dict(
                         domain_code=domain_code, code=concept_code, details_dict=concept_obj_dict
@@ -256,14 +302,83 @@ class LibraryManager:
                     raise PipeLibraryError(f"Error loading pipe '{pipe_code}' because of: {error_msg}") from exc
                 self.pipe_library.add_new_pipe(pipe=pipe)
 
-    def validate_libraries(self):
-        log.debug("LibraryManager validating libraries")
+    def validate_llm_deck(self):
         if self.llm_deck is None:
             raise LibraryError("LLM deck is not loaded")
         LLMDeck.final_validate(deck=self.llm_deck)
-        self.concept_library.validate_with_libraries()
-        self.pipe_library.validate_with_libraries()
-        self.domain_library.validate_with_libraries()
+
+    def validate_libraries(self):
+        log.debug("LibraryManager validating libraries")
+        self.validate_llm_deck()
+        with self.phase_timer.phase("library_validation"):
+            self.concept_library.validate_with_libraries()
+            self.pipe_library.validate_with_libraries()
+            self.domain_library.validate_with_libraries()
+
+    def _compute_library_snapshot_key(self) -> Optional[str]:
+        """Compute the key of the library snapshot, or None if the installed version of the package is unknown, e.g. in a source checkout."""
+        try:
+            package_version = version(LibraryConfig.package_name)
+        except PackageNotFoundError:
+            log.debug(f"Library snapshot disabled: package '{LibraryConfig.package_name}' is not installed")
+            return None
+        file_paths: List[Path] = []
+        for library_path in self.get_library_paths():
+            file_paths += find_files_in_dir(dir_path=library_path, pattern="*.toml", is_recursive=True)
+            file_paths += find_files_in_dir(dir_path=library_path, pattern="*.py", is_recursive=True)
+        other_paths = LibraryConfig.get_templates_paths() + LibraryConfig.get_llm_deck_paths() + LibraryConfig.get_llm_integrations_paths()
+        file_paths += [Path(other_path) for other_path in other_paths]
+        fingerprints = [
+            f"{LibraryConfig.package_name}={package_version}",
+            get_config().model_dump_json(exclude={"session_id"}),
+        ]
+        return compute_library_snapshot_key(file_paths=file_paths, fingerprints=fingerprints)
+
+    def load_library_snapshot(self) -> Optional[LibrarySnapshot]:
+        """
+        Get the library snapshot matching the current library files, if library snapshots are enabled and one was saved.
+
+        The key computed here is kept so that save_library_snapshot() can save the snapshot once the libraries are validated.
+        """
+        library_config = get_config().pipelex.library_config
+        if not library_config.is_library_snapshot_enabled:
+            return None
+        self._library_snapshot_key = self._compute_library_snapshot_key()
+        if self._library_snapshot_key is None:
+            return None
+        return LibrarySnapshotStore(snapshot_dir=library_config.library_snapshot_dir).load(snapshot_key=self._library_snapshot_key)
+
+    def save_library_snapshot(self, templates: Dict[str, str]) -> Optional[str]:
+        """
+        Save a snapshot of the loaded and validated libraries, along with the given templates.
+
+        Failing to save the snapshot is not an error: it is logged and the next start will load the library files again.
+
+        Returns:
+            The path of the saved snapshot, or None if it was not saved
+        """
+        if self._library_snapshot_key is None:
+            return None
+        library_snapshot = LibrarySnapshot(
+            snapshot_key=self._library_snapshot_key,
+            domains=self.domain_library.root,
+            concepts=self.concept_library.root,
+            pipes=self.pipe_library.root,
+            templates=templates,
+        )
+        snapshot_store = LibrarySnapshotStore(snapshot_dir=get_config().pipelex.library_config.library_snapshot_dir)
+        try:
+            return snapshot_store.save(snapshot=library_snapshot)
+        except LibrarySnapshotError as exc:
+            log.warning(f"Library snapshot not saved: {exc}")
+            return None
+
+    def _restore_library_snapshot(self, library_snapshot: LibrarySnapshot):
+        log.debug(f"LibraryManager restoring libraries from snapshot '{library_snapshot.snapshot_key}'")
+        # the libraries are updated in place because the hub holds references to them
+        self.domain_library.root = dict(library_snapshot.domains)
+        self.concept_library.root = dict(library_snapshot.concepts)
+        self.pipe_library.root = dict(library_snapshot.pipes)
 
     @classmethod
     def make_pipe_from_details_dict(
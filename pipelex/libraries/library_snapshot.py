@@ -0,0 +1,107 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from pipelex import log
+from pipelex.core.concept import Concept
+from pipelex.core.domain import Domain
+from pipelex.core.pipe_abstract import PipeAbstract
+from pipelex.exceptions import LibraryError
+
+LIBRARY_SNAPSHOT_FILE_EXTENSION = "pkl"
+
+
+class LibrarySnapshotError(LibraryError):
+    pass
+
+
+class LibrarySnapshot(BaseModel):
+    """Validated content of the libraries, as it stands after loading and validating all the library files."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    snapshot_key: str
+    domains: Dict[str, Domain]
+    concepts: Dict[str, Concept]
+    pipes: Dict[str, PipeAbstract]
+    templates: Dict[str, str]
+
+
+def compute_library_snapshot_key(file_paths: Iterable[Path], fingerprints: Iterable[str]) -> str:
+    """
+    Hash the paths and contents of the given files together with the given fingerprints (versions, config...).
+
+    Any change to a library file, to the set of library files or to a fingerprint produces a different key.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"python={sys.version_info.major}.{sys.version_info.minor}".encode())
+    for fingerprint in fingerprints:
+        hasher.update(b"\0")
+        hasher.update(fingerprint.encode())
+    for file_path in sorted(set(file_paths)):
+        hasher.update(b"\0")
+        hasher.update(str(file_path).encode())
+        hasher.update(b"\0")
+        hasher.update(file_path.read_bytes())
+    return hasher.hexdigest()
+
+
+class LibrarySnapshotStore:
+    """
+    Stores library snapshots as pickle files named after their key, in a local directory.
+
+    The snapshots are unpickled, so the directory must only be writable by trusted users, just like the library files themselves.
+    """
+
+    def __init__(self, snapshot_dir: str):
+        self.snapshot_dir = snapshot_dir
+
+    def get_snapshot_path(self, snapshot_key: str) -> str:
+        return os.path.join(self.snapshot_dir, f"library_{snapshot_key}.{LIBRARY_SNAPSHOT_FILE_EXTENSION}")
+
+    def load(self, snapshot_key: str) -> Optional[LibrarySnapshot]:
+        """Load the snapshot for this key, or return None if there is none or if it can't be used."""
+        snapshot_path = self.get_snapshot_path(snapshot_key=snapshot_key)
+        if not os.path.isfile(snapshot_path):
+            log.debug(f"No library snapshot found at '{snapshot_path}'")
+            return None
+        try:
+            with open(snapshot_path, "rb") as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+        except Exception as exc:
+            # a snapshot written by another version of the code or truncated: it will be rebuilt
+            log.warning(f"Could not load library snapshot from '{snapshot_path}', it will be rebuilt: {exc}")
+            return None
+        if not isinstance(snapshot, LibrarySnapshot) or snapshot.snapshot_key != snapshot_key:
+            log.warning(f"Library snapshot at '{snapshot_path}' does not match its key, it will be rebuilt")
+            return None
+        log.debug(f"Loaded library snapshot from '{snapshot_path}'")
+        return snapshot
+
+    def save(self, snapshot: LibrarySnapshot) -> str:
+        """
+        Save the snapshot atomically so that concurrent processes never read a partial file.
+
+        Raises:
+            LibrarySnapshotError: If the snapshot could not be written
+        """
+        snapshot_path = self.get_snapshot_path(snapshot_key=snapshot.snapshot_key)
+        tmp_path: Optional[str] = None
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(mode="wb", dir=self.snapshot_dir, suffix=".tmp", delete=False) as tmp_file:
+                tmp_path = tmp_file.name
+                pickle.dump(snapshot, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise LibrarySnapshotError(f"Could not save library snapshot to '{snapshot_path}': {exc}") from exc
+        log.debug(f"Saved library snapshot to '{snapshot_path}'")
+        return snapshot_path
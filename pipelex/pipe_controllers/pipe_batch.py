@@ -1,33 +1,52 @@
-import asyncio
-from typing import Any, Coroutine, List, Optional, Set, cast
+from typing import List, Optional, Set, cast
 
 import shortuuid
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.config import get_config
+from pipelex.core.concept_native import NativeConcept
 from pipelex.core.pipe_output import PipeOutput
-from pipelex.core.pipe_run_params import BatchParams, PipeRunParams
+from pipelex.core.pipe_run_params import BatchParams, PipeRunMode, PipeRunParams
 from pipelex.core.stuff import Stuff
 from pipelex.core.stuff_content import ListContent, StuffContent
 from pipelex.core.stuff_factory import StuffFactory
 from pipelex.core.working_memory import MAIN_STUFF_NAME, WorkingMemory
 from pipelex.exceptions import PipeInputError, PipeInputNotFoundError, WorkingMemoryStuffNotFoundError
-from pipelex.hub import get_pipe_router, get_pipeline_tracker, get_required_pipe
+from pipelex.hub import get_activity_manager, get_pipe_router, get_pipeline_tracker, get_required_pipe
+from pipelex.pipe_controllers.pipe_batch_checkpoint import make_batch_checkpoint_key, pipe_batch_checkpoint_store
+from pipelex.pipe_controllers.pipe_batch_models import BatchItemActivity, BatchItemErrorContent
 from pipelex.pipe_controllers.pipe_controller import PipeController
+from pipelex.pipeline.activity.activity_models import ActivityReport
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.pipeline_models import SpecialPipelineId
+from pipelex.tools.misc.async_utils import BoundedTaskPool, TaskFactory
 
 
 class PipeBatch(PipeController):
-    """Runs a PipeSequence in parallel for each item in a list."""
+    """
+    Runs a PipeSequence in parallel for each item in a list, with at most max_concurrency branches running at once.
+
+    When batch checkpoints are enabled, the output of each branch is saved as soon as it completes,
+    and a run restarted with the same pipeline_run_id reuses it instead of running the branch again.
+
+    Each branch is reported to the activity manager as soon as it completes. If is_failure_tolerant is set,
+    a failed branch doesn't abort the batch: the output list holds the outputs of the other branches
+    and the failures are recorded in the errors stuff, named after the output.
+    """
 
     branch_pipe_code: str
     batch_params: Optional[BatchParams] = None
+    max_concurrency: Optional[int] = None
+    is_failure_tolerant: bool = False
 
     @override
     def pipe_dependencies(self) -> Set[str]:
         return set([self.branch_pipe_code])
 
+    def make_errors_stuff_name(self, output_name: Optional[str]) -> str:
+        return f"{output_name or self.code}_errors"
+
     @override
     async def _run_controller_pipe(
         self,
@@ -69,11 +88,10 @@ class PipeBatch(PipeController):
         pipe_router = get_pipe_router()
         # TODO: Make commented code work when inputing images named "a.b.c"
         sub_pipe = get_required_pipe(pipe_code=self.branch_pipe_code)
+        required_variables = sub_pipe.required_variables()
         nb_history_items_limit = get_config().pipelex.tracker_config.applied_nb_items_limit
         batch_output_stuff_code = shortuuid.uuid()
-        tasks: List[Coroutine[Any, Any, PipeOutput]] = []
         item_stuffs: List[Stuff] = []
-        required_stuff_lists: List[List[Stuff]] = []
         branch_output_item_codes: List[str] = []
         for branch_index, item in enumerate(input_content.items):
             branch_output_item_code = f"{batch_output_stuff_code}-branch-{branch_index}"
@@ -88,33 +106,87 @@ class PipeBatch(PipeController):
                 name=input_item_stuff_name,
             )
             item_stuffs.append(item_input_stuff)
-            branch_memory = working_memory.make_deep_copy()
-            branch_memory.set_new_main_stuff(stuff=item_input_stuff, name=input_item_stuff_name)
 
-            required_variables = sub_pipe.required_variables()
+        required_stuff_lists: List[List[Stuff]] = [[] for _ in item_stuffs]
+        # checkpoints are only meaningful within an identified run, which can be restarted with the same pipeline_run_id
+        is_checkpointing = (
+            pipe_batch_checkpoint_store.is_enabled
+            and pipe_run_params.run_mode == PipeRunMode.LIVE
+            and job_metadata.pipeline_run_id != SpecialPipelineId.UNTITLED
+        )
+
+        nb_branches = len(item_stuffs)
+        error_records: List[BatchItemErrorContent] = []
+
+        async def run_branch_pipe(branch_index: int) -> Stuff:
+            # the branch memory is only created when a worker picks up the branch, so that at most
+            # max_concurrency branch memories are alive at any given time
+            branch_memory = working_memory.make_branch_copy()
+            branch_memory.set_new_main_stuff(stuff=item_stuffs[branch_index], name=input_item_stuff_name)
+
             required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
             required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
-            required_stuff_lists.append(required_stuffs)
-            branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_code)
-            tasks.append(
-                pipe_router.run_pipe_code(
-                    pipe_code=self.branch_pipe_code,
-                    job_metadata=job_metadata,
-                    working_memory=branch_memory,
-                    output_name=f"Batch result {branch_index + 1} of {output_name}",
-                    pipe_run_params=branch_pipe_run_params,
+            required_stuff_lists[branch_index] = required_stuffs
+
+            checkpoint_key: Optional[str] = None
+            if is_checkpointing:
+                checkpoint_key = make_batch_checkpoint_key(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    pipe_code=self.code,
+                    output_name=output_name,
+                    branch_index=branch_index,
+                    item=item_stuffs[branch_index].content,
                 )
+                if checkpointed_stuff := await pipe_batch_checkpoint_store.get_output_stuff(checkpoint_key=checkpoint_key):
+                    log.debug(f"PipeBatch '{self.code}' branch {branch_index} restored from checkpoint")
+                    return checkpointed_stuff.model_copy(update={"stuff_code": branch_output_item_codes[branch_index]})
+
+            branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_codes[branch_index])
+            pipe_output: PipeOutput = await pipe_router.run_pipe_code(
+                pipe_code=self.branch_pipe_code,
+                job_metadata=job_metadata,
+                working_memory=branch_memory,
+                output_name=f"Batch result {branch_index + 1} of {output_name}",
+                pipe_run_params=branch_pipe_run_params,
             )
+            branch_output_stuff = pipe_output.main_stuff
+            if checkpoint_key:
+                await pipe_batch_checkpoint_store.set_output_stuff(checkpoint_key=checkpoint_key, output_stuff=branch_output_stuff)
+            return branch_output_stuff
+
+        def dispatch_batch_item_activity(batch_item_activity: BatchItemActivity) -> None:
+            get_activity_manager().dispatch_activity(activity_report=ActivityReport(job_metadata=job_metadata, content=batch_item_activity))
+
+        def make_branch_task_factory(branch_index: int) -> TaskFactory[Optional[Stuff]]:
+            async def run_branch() -> Optional[Stuff]:
+                try:
+                    branch_output_stuff = await run_branch_pipe(branch_index=branch_index)
+                except Exception as exc:
+                    if not self.is_failure_tolerant:
+                        raise
+                    log.warning(f"PipeBatch '{self.code}' branch {branch_index} failed, the batch goes on without it: {exc}")
+                    error_record = BatchItemErrorContent(branch_index=branch_index, error_type=type(exc).__name__, error_message=str(exc))
+                    error_records.append(error_record)
+                    dispatch_batch_item_activity(
+                        BatchItemActivity(pipe_code=self.code, branch_index=branch_index, nb_branches=nb_branches, error=error_record)
+                    )
+                    return None
+                dispatch_batch_item_activity(
+                    BatchItemActivity(pipe_code=self.code, branch_index=branch_index, nb_branches=nb_branches, output_stuff=branch_output_stuff)
+                )
+                return branch_output_stuff
+
+            return run_branch
 
-        pipe_outputs = await asyncio.gather(*tasks)
+        max_concurrency = self.max_concurrency or get_config().pipelex.pipe_run_config.applied_batch_max_concurrency
+        task_pool: BoundedTaskPool[Optional[Stuff]] = BoundedTaskPool(max_concurrency=max_concurrency)
+        branch_output_stuffs = await task_pool.run(task_factories=[make_branch_task_factory(branch_index) for branch_index in range(nb_branches)])
+        log.debug(task_pool.stats, title=f"PipeBatch '{self.code}' pool stats with max_concurrency={max_concurrency}")
 
-        output_items: List[StuffContent] = []
-        output_stuffs: List[Stuff] = []
+        output_items: List[StuffContent] = [
+            branch_output_stuff.content for branch_output_stuff in branch_output_stuffs if branch_output_stuff is not None
+        ]
         output_stuff_code = shortuuid.uuid()[:5]
-        for branch_index, pipe_output in enumerate(pipe_outputs):
-            branch_output_stuff = pipe_output.main_stuff
-            output_stuffs.append(branch_output_stuff)
-            output_items.append(branch_output_stuff.content)
 
         list_content: ListContent[StuffContent] = ListContent(items=output_items)
         output_stuff = StuffFactory.make_stuff(
@@ -128,16 +200,20 @@ class PipeBatch(PipeController):
             required_stuff_list,
             item_input_stuff,
             item_output_stuff,
-        ) in enumerate(zip(required_stuff_lists, item_stuffs, output_stuffs)):
+        ) in enumerate(zip(required_stuff_lists, item_stuffs, branch_output_stuffs)):
             get_pipeline_tracker().add_batch_step(
+                pipeline_run_id=job_metadata.pipeline_run_id,
                 from_stuff=input_stuff,
                 to_stuff=item_input_stuff,
                 to_branch_index=branch_index,
                 pipe_layer=pipe_run_params.pipe_layers,
                 comment="PipeBatch.run_pipe() in zip",
             )
+            if item_output_stuff is None:
+                continue
             for required_stuff in required_stuff_list:
                 get_pipeline_tracker().add_pipe_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
                     from_stuff=required_stuff,
                     to_stuff=item_output_stuff,
                     pipe_code=self.branch_pipe_code,
@@ -147,9 +223,11 @@ class PipeBatch(PipeController):
                     is_with_edge=(required_stuff.stuff_name != MAIN_STUFF_NAME),
                 )
 
-        for branch_index, branch_output_stuff in enumerate(output_stuffs):
-            branch_output_item_code = branch_output_item_codes[branch_index]
+        for branch_output_stuff in branch_output_stuffs:
+            if branch_output_stuff is None:
+                continue
             get_pipeline_tracker().add_aggregate_step(
+                pipeline_run_id=job_metadata.pipeline_run_id,
                 from_stuff=branch_output_stuff,
                 to_stuff=output_stuff,
                 pipe_layer=pipe_run_params.pipe_layers,
@@ -160,6 +238,17 @@ class PipeBatch(PipeController):
             stuff=output_stuff,
             name=output_name,
         )
+        if self.is_failure_tolerant:
+            if error_records:
+                log.warning(f"PipeBatch '{self.code}' completed with {len(error_records)} failed branches out of {nb_branches}")
+            error_records.sort(key=lambda error_record: error_record.branch_index)
+            errors_stuff_name = self.make_errors_stuff_name(output_name=output_name)
+            errors_stuff = StuffFactory.make_stuff(
+                concept_str=NativeConcept.ANYTHING.code,
+                content=ListContent(items=error_records),
+                name=errors_stuff_name,
+            )
+            working_memory.set_stuff(name=errors_stuff_name, stuff=errors_stuff)
 
         return PipeOutput(
             working_memory=working_memory,
@@ -0,0 +1,111 @@
+import asyncio
+import hashlib
+import json
+from typing import Optional
+
+from kajson import kajson
+from kajson.exceptions import ClassRegistryNotFoundError, KajsonDecoderError, UnijsonEncoderError
+
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.core.stuff import Stuff
+from pipelex.core.stuff_content import StuffContent
+from pipelex.tools.storage.sqlite_cache_store import SqliteCacheStore, SqliteCacheStoreError
+
+
+def make_batch_checkpoint_key(
+    pipeline_run_id: str,
+    pipe_code: str,
+    output_name: Optional[str],
+    branch_index: int,
+    item: StuffContent,
+) -> str:
+    """
+    Identify the output of a PipeBatch branch within a pipeline run.
+
+    The output name tells apart the runs of the same PipeBatch within a run (e.g. nested in another batch)
+    and the item digest makes sure a checkpoint is not restored for an item that changed since.
+    """
+    key_dict = {
+        "pipe_code": pipe_code,
+        "output_name": output_name,
+        "branch_index": branch_index,
+        "item_digest": hashlib.sha256(item.model_dump_json().encode()).hexdigest(),
+    }
+    return f"{pipeline_run_id}/{hashlib.sha256(json.dumps(key_dict, sort_keys=True).encode()).hexdigest()}"
+
+
+class PipeBatchCheckpointStore:
+    """
+    Optional store of the PipeBatch branch outputs, persisted in a local SQLite store set up in
+    [pipelex.pipe_run_config.batch_checkpoint_config], so that a run restarted with the same pipeline_run_id
+    skips the branches that already succeeded.
+
+    Checkpoint errors are logged and never prevent the batch from running: the branch is run as if checkpoints were disabled.
+    The SQLite queries and the (de)serialization of the outputs run in a worker thread, off the event loop.
+    """
+
+    def __init__(self) -> None:
+        self._store: Optional[SqliteCacheStore] = None
+
+    def teardown(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return get_config().pipelex.pipe_run_config.batch_checkpoint_config.is_enabled
+
+    def _get_store(self) -> SqliteCacheStore:
+        if self._store is None:
+            checkpoint_config = get_config().pipelex.pipe_run_config.batch_checkpoint_config
+            self._store = SqliteCacheStore(
+                db_path=checkpoint_config.store_path,
+                ttl_seconds=checkpoint_config.applied_ttl_seconds,
+            )
+        return self._store
+
+    async def get_output_stuff(self, checkpoint_key: str) -> Optional[Stuff]:
+        return await asyncio.to_thread(self._get_output_stuff, checkpoint_key=checkpoint_key)
+
+    async def set_output_stuff(self, checkpoint_key: str, output_stuff: Stuff) -> None:
+        write_task = asyncio.ensure_future(asyncio.to_thread(self._set_output_stuff, checkpoint_key=checkpoint_key, output_stuff=output_stuff))
+        try:
+            await asyncio.shield(write_task)
+        except asyncio.CancelledError:
+            # the branch was cancelled (e.g. another branch failed) but its output is done: finish saving it before giving up
+            await write_task
+            raise
+
+    def _get_output_stuff(self, checkpoint_key: str) -> Optional[Stuff]:
+        try:
+            serialized_stuff = self._get_store().get(key=checkpoint_key)
+        except SqliteCacheStoreError as exc:
+            log.warning(f"PipeBatch checkpoint lookup failed: {exc}")
+            return None
+        if serialized_stuff is None:
+            return None
+        try:
+            output_stuff = kajson.loads(serialized_stuff)  # pyright: ignore[reportUnknownMemberType]
+        except (KajsonDecoderError, ClassRegistryNotFoundError, ValueError) as exc:
+            log.warning(f"PipeBatch checkpoint could not be restored, the branch will run again: {exc}")
+            return None
+        if not isinstance(output_stuff, Stuff):
+            log.warning(f"PipeBatch checkpoint is not a Stuff but a {type(output_stuff).__name__}, the branch will run again")
+            return None
+        return output_stuff
+
+    def _set_output_stuff(self, checkpoint_key: str, output_stuff: Stuff) -> None:
+        try:
+            serialized_stuff = kajson.dumps(output_stuff)  # pyright: ignore[reportUnknownMemberType]
+        except (UnijsonEncoderError, TypeError) as exc:
+            log.warning(f"PipeBatch checkpoint could not be serialized: {exc}")
+            return
+        try:
+            self._get_store().set(key=checkpoint_key, value=serialized_stuff)
+        except SqliteCacheStoreError as exc:
+            log.warning(f"PipeBatch checkpoint update failed: {exc}")
+
+
+pipe_batch_checkpoint_store = PipeBatchCheckpointStore()
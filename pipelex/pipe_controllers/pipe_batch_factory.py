@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 
+from pydantic import Field
 from typing_extensions import override
 
 from pipelex.core.pipe_blueprint import PipeBlueprint, PipeSpecificFactoryProtocol
@@ -13,6 +14,8 @@ class PipeBatchBlueprint(PipeBlueprint):
 
     input_list_name: Optional[str] = None
     input_item_name: Optional[str] = None
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+    is_failure_tolerant: bool = False
 
 
 class PipeBatchFactory(PipeSpecificFactoryProtocol[PipeBatchBlueprint, PipeBatch]):
@@ -36,6 +39,8 @@ class PipeBatchFactory(PipeSpecificFactoryProtocol[PipeBatchBlueprint, PipeBatch
             output_concept_code=pipe_blueprint.output,
             branch_pipe_code=pipe_blueprint.branch_pipe_code,
             batch_params=batch_params,
+            max_concurrency=pipe_blueprint.max_concurrency,
+            is_failure_tolerant=pipe_blueprint.is_failure_tolerant,
         )
 
     @classmethod
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from pipelex.core.stuff import Stuff
+from pipelex.core.stuff_content import StructuredContent
+
+
+class BatchItemErrorContent(StructuredContent):
+    """Error record of a PipeBatch branch which failed while the batch is failure tolerant."""
+
+    branch_index: int
+    error_type: str
+    error_message: str
+
+
+class BatchItemActivity(BaseModel):
+    """Content of the activity report dispatched by PipeBatch when one of its branches completes or fails."""
+
+    pipe_code: str
+    branch_index: int
+    nb_branches: int
+    output_stuff: Optional[Stuff] = None
+    error: Optional[BatchItemErrorContent] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
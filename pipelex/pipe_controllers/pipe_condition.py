@@ -133,6 +133,7 @@ class PipeCondition(PipeController):
 
         for required_stuff in required_stuffs:
             get_pipeline_tracker().add_condition_step(
+                pipeline_run_id=job_metadata.pipeline_run_id,
                 from_stuff=required_stuff,
                 to_condition=condition_details,
                 condition_expression=self.expression or self.applied_expression_jinja2,
@@ -149,6 +150,7 @@ class PipeCondition(PipeController):
             output_name=output_name,
         )
         get_pipeline_tracker().add_choice_step(
+            pipeline_run_id=job_metadata.pipeline_run_id,
             from_condition=condition_details,
             to_stuff=pipe_output.main_stuff,
             pipe_layer=pipe_run_params.pipe_layers,
@@ -8,6 +8,7 @@ from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import PipeRunParams
 from pipelex.core.working_memory import WorkingMemory
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
 
 
 class PipeController(PipeAbstract):
@@ -27,12 +28,16 @@ class PipeController(PipeAbstract):
         )
         job_metadata.update(updated_metadata=updated_metadata)
 
-        pipe_output = await self._run_controller_pipe(
-            job_metadata=job_metadata,
-            working_memory=working_memory,
-            pipe_run_params=pipe_run_params,
-            output_name=output_name,
-        )
+        with pipe_span_tracer.trace_pipe(pipe_code=self.code, pipe_class=self.class_name, pipeline_run_id=job_metadata.pipeline_run_id) as pipe_span:
+            pipe_output = await self._run_controller_pipe(
+                job_metadata=job_metadata,
+                working_memory=working_memory,
+                pipe_run_params=pipe_run_params,
+                output_name=output_name,
+            )
+            # a PipeParallel adding each output separately has no main stuff of its own
+            if pipe_span and (main_stuff := pipe_output.working_memory.get_optional_main_stuff()):
+                pipe_span_tracer.record_output(pipe_span=pipe_span, output=main_stuff.content)
 
         pipe_run_params.pop_pipe_from_stack(pipe_code=self.code)
 
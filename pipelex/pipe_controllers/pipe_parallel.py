@@ -52,7 +52,7 @@ class PipeParallel(PipeController):
                 sub_pipe.run(
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
-                    working_memory=working_memory.make_deep_copy(),
+                    working_memory=working_memory.make_branch_copy(),
                     sub_pipe_run_params=pipe_run_params.make_deep_copy(),
                 )
             )
@@ -95,6 +95,7 @@ class PipeParallel(PipeController):
             )
             for stuff in output_stuffs.values():
                 get_pipeline_tracker().add_aggregate_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
                     from_stuff=stuff,
                     to_stuff=combined_output_stuff,
                     pipe_layer=pipe_run_params.pipe_layers,
@@ -91,6 +91,7 @@ class SubPipe(BaseModel):
             new_output_stuff = pipe_output.main_stuff
             for stuff in required_stuffs:
                 get_pipeline_tracker().add_pipe_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
                     from_stuff=stuff,
                     to_stuff=new_output_stuff,
                     pipe_code=self.pipe_code,
@@ -3,11 +3,13 @@ from typing import List, Optional, cast
 from typing_extensions import override
 
 from pipelex import log
+from pipelex.config import FuncExecutionMode
 from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import PipeRunParams
 from pipelex.core.stuff_content import ListContent, StuffContent, TextContent
 from pipelex.core.stuff_factory import StuffFactory
 from pipelex.core.working_memory import WorkingMemory
+from pipelex.pipe_operators.pipe_func_runner import pipe_func_runner
 from pipelex.pipe_operators.pipe_operator import PipeOperator
 from pipelex.pipeline.job_metadata import JobMetadata
 from pipelex.tools.func_registry import func_registry
@@ -19,6 +21,7 @@ class PipeFuncOutput(PipeOutput):
 
 class PipeFunc(PipeOperator):
     function_name: str
+    execution_mode: Optional[FuncExecutionMode] = None
 
     @override
     async def _run_operator_pipe(
@@ -34,7 +37,12 @@ class PipeFunc(PipeOperator):
         if not callable(function):
             raise ValueError(f"Function '{self.function_name}' is not callable")
 
-        func_output_object = function(working_memory=working_memory)
+        func_output_object = await pipe_func_runner.run_function(
+            function_name=self.function_name,
+            function=function,
+            working_memory=working_memory,
+            execution_mode=self.execution_mode,
+        )
         the_content: StuffContent
         if isinstance(func_output_object, StuffContent):
             the_content = func_output_object
@@ -1,7 +1,8 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from typing_extensions import override
 
+from pipelex.config import FuncExecutionMode
 from pipelex.core.pipe_blueprint import PipeBlueprint, PipeSpecificFactoryProtocol
 from pipelex.core.pipe_input_spec import PipeInputSpec
 from pipelex.pipe_operators.pipe_func import PipeFunc
@@ -9,6 +10,7 @@ from pipelex.pipe_operators.pipe_func import PipeFunc
 
 class PipeFuncBlueprint(PipeBlueprint):
     function_name: str
+    execution_mode: Optional[FuncExecutionMode] = None
 
 
 class PipeFuncFactory(PipeSpecificFactoryProtocol[PipeFuncBlueprint, PipeFunc]):
@@ -27,6 +29,7 @@ class PipeFuncFactory(PipeSpecificFactoryProtocol[PipeFuncBlueprint, PipeFunc]):
             inputs=PipeInputSpec(root=pipe_blueprint.inputs or {}),
             output_concept_code=pipe_blueprint.output,
             function_name=pipe_blueprint.function_name,
+            execution_mode=pipe_blueprint.execution_mode,
         )
 
     @classmethod
@@ -0,0 +1,118 @@
+import asyncio
+import inspect
+import pickle
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from pipelex import log
+from pipelex.config import FuncExecutionConfig, FuncExecutionMode
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.exceptions import PipeFuncError
+from pipelex.tools.misc.async_utils import MeteredThreadPool, SpawnedProcessPool
+
+
+class PipeFuncRunner:
+    """
+    Runs the functions of PipeFunc without blocking the event loop shared by the other pipes of the process.
+
+    • Async functions are awaited on the event loop.
+
+    • Synchronous functions run according to their execution mode, set per pipe or by default in
+      [pipelex.pipe_run_config.func_execution_config]:
+        - "inline": called directly on the event loop, only for quick functions
+        - "thread": called in a dedicated thread pool, for blocking I/O or code releasing the GIL
+        - "process": called in a pool of spawned processes, for CPU-heavy pure Python code.
+          The function must be importable by name and the working memory and the result must be picklable.
+          The function receives a copy of the working memory, so changes it makes to it are lost.
+          The entry point of the program must be guarded by `if __name__ == "__main__":`, see SpawnedProcessPool.
+    """
+
+    def __init__(self) -> None:
+        self.func_execution_config: Optional[FuncExecutionConfig] = None
+        self._thread_pool: Optional[MeteredThreadPool] = None
+        self._process_pool = SpawnedProcessPool(pool_desc="PipeFunc process pool")
+
+    def setup(self, func_execution_config: FuncExecutionConfig) -> None:
+        self.func_execution_config = func_execution_config
+
+    def teardown(self) -> None:
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+        self._process_pool.shutdown()
+        self.func_execution_config = None
+
+    @property
+    def thread_pool(self) -> Optional[MeteredThreadPool]:
+        return self._thread_pool
+
+    def _get_thread_pool(self, func_execution_config: FuncExecutionConfig) -> MeteredThreadPool:
+        if self._thread_pool is None:
+            self._thread_pool = MeteredThreadPool(max_workers=func_execution_config.max_thread_workers, thread_name_prefix="pipe_func")
+        return self._thread_pool
+
+    async def run_function(
+        self,
+        function_name: str,
+        function: Callable[..., Any],
+        working_memory: WorkingMemory,
+        execution_mode: Optional[FuncExecutionMode] = None,
+    ) -> Any:
+        if inspect.iscoroutinefunction(function):
+            return await function(working_memory=working_memory)
+
+        func_execution_config = self.func_execution_config
+        if execution_mode is None:
+            # without setup, synchronous functions still run off the event loop, in its default executor
+            execution_mode = func_execution_config.default_execution_mode if func_execution_config else FuncExecutionMode.THREAD
+
+        func_output: Any
+        match execution_mode:
+            case FuncExecutionMode.INLINE:
+                func_output = function(working_memory=working_memory)
+            case FuncExecutionMode.THREAD:
+                if func_execution_config is None:
+                    func_output = await asyncio.to_thread(function, working_memory=working_memory)
+                else:
+                    thread_pool = self._get_thread_pool(func_execution_config=func_execution_config)
+                    func_output = await thread_pool.run(_call_with_working_memory, function, working_memory)
+            case FuncExecutionMode.PROCESS:
+                if func_execution_config is None:
+                    raise PipeFuncError(f"Can't run function '{function_name}' in a process: the PipeFunc runner is not set up")
+                func_output = await self._run_in_process(
+                    function_name=function_name,
+                    function=function,
+                    working_memory=working_memory,
+                    func_execution_config=func_execution_config,
+                )
+
+        # e.g. a functools.partial wrapping an async function
+        if inspect.isawaitable(func_output):
+            func_output = await func_output
+        return func_output
+
+    async def _run_in_process(
+        self,
+        function_name: str,
+        function: Callable[..., Any],
+        working_memory: WorkingMemory,
+        func_execution_config: FuncExecutionConfig,
+    ) -> Any:
+        try:
+            pickle.dumps(function)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            raise PipeFuncError(
+                f"Function '{function_name}' can't run in a process because it can't be pickled, define it at the top level of a module: {exc}"
+            ) from exc
+        try:
+            return await self._process_pool.run(func_execution_config.max_process_workers, _call_with_working_memory, function, working_memory)
+        except BrokenProcessPool as exc:
+            raise PipeFuncError(f"PipeFunc process pool is broken while running function '{function_name}': {exc}") from exc
+
+
+def _call_with_working_memory(function: Callable[..., Any], working_memory: WorkingMemory) -> Any:
+    # module-level so that it can be sent to the worker processes
+    return function(working_memory=working_memory)
+
+
+pipe_func_runner = PipeFuncRunner()
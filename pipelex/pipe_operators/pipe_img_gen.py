@@ -37,9 +37,9 @@ class PipeImgGenOutput(PipeOutput):
         content = self.main_stuff.content
         if isinstance(content, ListContent):
             items = self.main_stuff_as_items(item_type=ImageContent)
-            the_urls = [item.url for item in items]
+            the_urls = [item.get_resolved_url() for item in items]
         elif isinstance(content, ImageContent):
-            the_urls = [content.url]
+            the_urls = [content.get_resolved_url()]
         else:
             raise PipeRunParamsError(f"PipeImgGen output should be a ListContent or an ImageContent, got {type(content)}")
         return the_urls
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Dict, Optional, Set
+from typing import Any, ClassVar, Dict, MutableMapping, Optional, Set
 
 import shortuuid
 from jinja2 import TemplateSyntaxError
@@ -96,7 +96,7 @@ class PipeJinja2(PipeOperator):
                 f"PipeJinja2 does not suppport multiple outputs, got output_multiplicity = {pipe_run_params.output_multiplicity}"
             )
 
-        context: Dict[str, Any] = working_memory.generate_stuff_artefact_dict()
+        context: MutableMapping[str, Any] = working_memory.generate_stuff_artefact_dict()
         if pipe_run_params:
             context.update(**pipe_run_params.params)
         if self.extra_context:
@@ -1,3 +1,4 @@
+import asyncio
 from typing import ClassVar, List, Optional, Set, cast
 
 from pydantic import model_validator
@@ -145,7 +146,8 @@ class PipeLLMPrompt(PipeOperator):
                 except WorkingMemoryVariableError as exc:
                     raise PipeInputError(f"Could not find a valid user image named '{user_image_name}' in the working_memory: {exc}") from exc
 
-                if base_64 := prompt_image_content.base_64:
+                # the payload may be loaded from the payload storage, which reads a file
+                if base_64 := await asyncio.to_thread(prompt_image_content.get_base_64):
                     user_image = PromptImageFactory.make_prompt_image(base_64=base_64)
                 else:
                     image_uri = prompt_image_content.url
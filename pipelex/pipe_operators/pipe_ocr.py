@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional
 
 from pydantic import model_validator
@@ -131,6 +132,7 @@ class PipeOcr(PipeOperator):
     ) -> PipeOcrOutput:
         content_generator = content_generator or get_content_generator()
 
+        image_stuff: Optional[ImageContent] = None
         image_uri: Optional[str] = None
         pdf_uri: Optional[str] = None
         if self.image_stuff_name:
@@ -150,7 +152,8 @@ class PipeOcr(PipeOperator):
             page_views_dpi=self.page_views_dpi,
         )
         ocr_input = OcrInput(
-            image_uri=image_uri,
+            # the OCR workers can't read a blob reference, it is resolved to a data URL
+            image_uri=await asyncio.to_thread(image_stuff.get_resolved_url) if image_stuff else None,
             pdf_uri=pdf_uri,
         )
         ocr_output = await content_generator.make_ocr_extract_pages(
@@ -182,8 +185,10 @@ class PipeOcr(PipeOperator):
                     needs_to_generate_page_views = False
 
                 if needs_to_generate_page_views:
-                    page_views = await pypdfium2_renderer.render_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi)
-                    page_view_contents = [ImageContent.make_from_image(image=img) for img in page_views]
+                    # each page is encoded as soon as it is rendered, so that only a few rendered pages are held in memory at once
+                    page_view_contents = []
+                    async for rendered_page in pypdfium2_renderer.iter_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi):
+                        page_view_contents.append(await asyncio.to_thread(ImageContent.make_from_image, image=rendered_page))
             elif image_uri:
                 page_view_contents = [ImageContent.make_from_str(str_value=image_uri)]
 
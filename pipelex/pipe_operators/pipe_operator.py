@@ -11,6 +11,7 @@ from pipelex.core.working_memory import WorkingMemory
 from pipelex.hub import get_activity_manager
 from pipelex.pipeline.activity.activity_models import ActivityReport
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
 
 
 class PipeOperator(PipeAbstract):
@@ -30,21 +31,24 @@ class PipeOperator(PipeAbstract):
         )
         job_metadata.update(updated_metadata=updated_metadata)
 
-        match pipe_run_params.run_mode:
-            case PipeRunMode.LIVE:
-                pipe_output = await self._run_operator_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
-            case PipeRunMode.DRY:
-                pipe_output = await self._dry_run_operator_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
+        with pipe_span_tracer.trace_pipe(pipe_code=self.code, pipe_class=self.class_name, pipeline_run_id=job_metadata.pipeline_run_id) as pipe_span:
+            match pipe_run_params.run_mode:
+                case PipeRunMode.LIVE:
+                    pipe_output = await self._run_operator_pipe(
+                        job_metadata=job_metadata,
+                        working_memory=working_memory,
+                        pipe_run_params=pipe_run_params,
+                        output_name=output_name,
+                    )
+                case PipeRunMode.DRY:
+                    pipe_output = await self._dry_run_operator_pipe(
+                        job_metadata=job_metadata,
+                        working_memory=working_memory,
+                        pipe_run_params=pipe_run_params,
+                        output_name=output_name,
+                    )
+            if pipe_span:
+                pipe_span_tracer.record_output(pipe_span=pipe_span, output=pipe_output.main_stuff.content)
         get_activity_manager().dispatch_activity(
             activity_report=ActivityReport(
                 job_metadata=job_metadata,
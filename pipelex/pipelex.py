@@ -15,14 +15,19 @@ from pipelex.cogt.content_generation.content_generator_protocol import (
     ContentGeneratorProtocol,
 )
 from pipelex.cogt.inference.inference_manager import InferenceManager
+from pipelex.cogt.inference.inference_retry import inference_retry_policy
 from pipelex.cogt.llm.llm_models.llm_model import LATEST_VERSION_NAME
 from pipelex.cogt.llm.llm_models.llm_model_library import LLMModelLibrary
+from pipelex.cogt.llm.llm_rate_limiter import llm_rate_limiter
+from pipelex.cogt.llm.llm_response_cache import llm_response_cache
 from pipelex.cogt.plugin_manager import PluginManager
 from pipelex.config import PipelexConfig, get_config
 from pipelex.core.registry_models import PipelexRegistryModels
 from pipelex.exceptions import PipelexConfigError, PipelexSetupError
 from pipelex.hub import PipelexHub, set_pipelex_hub
 from pipelex.libraries.library_manager import LibraryManager
+from pipelex.pipe_controllers.pipe_batch_checkpoint import pipe_batch_checkpoint_store
+from pipelex.pipe_operators.pipe_func_runner import pipe_func_runner
 from pipelex.pipe_works.pipe_router import PipeRouter
 from pipelex.pipe_works.pipe_router_protocol import PipeRouterProtocol
 from pipelex.pipeline.activity.activity_manager import ActivityManager
@@ -31,6 +36,8 @@ from pipelex.pipeline.activity.activity_manager_protocol import (
     ActivityManagerProtocol,
 )
 from pipelex.pipeline.pipeline_manager import PipelineManager
+from pipelex.pipeline.telemetry.pipe_span_tracer import pipe_span_tracer
+from pipelex.pipeline.telemetry.span_exporter_abstract import SpanExporterAbstract
 from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
 from pipelex.pipeline.track.pipeline_tracker_protocol import (
     PipelineTrackerNoOp,
@@ -41,10 +48,16 @@ from pipelex.reporting.reporting_protocol import ReportingNoOp, ReportingProtoco
 from pipelex.test_extras.registry_test_models import PipelexTestModels
 from pipelex.tools.config.models import ConfigRoot
 from pipelex.tools.func_registry import func_registry
+from pipelex.tools.misc.file_fetch_utils import http_client_pool
+from pipelex.tools.misc.timing_utils import PhaseTimer
+from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
 from pipelex.tools.runtime_manager import runtime_manager
 from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
+from pipelex.tools.storage.local_blob_store import LocalBlobStore
+from pipelex.tools.storage.payload_storage import payload_storage
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+from pipelex.tools.templating.jinja2_template_cache import jinja2_template_cache
 from pipelex.tools.templating.template_library import TemplateLibrary
 from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
 
@@ -146,7 +159,8 @@ class Pipelex:
         self.pipelex_hub.set_report_delegate(self.reporting_delegate)
 
         # pipelex libraries
-        self.library_manager = LibraryManager()
+        self.startup_timer = PhaseTimer()
+        self.library_manager = LibraryManager(phase_timer=self.startup_timer)
         self.pipelex_hub.set_domain_provider(domain_provider=self.library_manager.domain_library)
         self.pipelex_hub.set_concept_provider(concept_provider=self.library_manager.concept_library)
         self.pipelex_hub.set_pipe_provider(pipe_provider=self.library_manager.pipe_library)
@@ -182,13 +196,25 @@ class Pipelex:
         pipe_router: Optional[PipeRouterProtocol] = None,
         structure_classes: Optional[List[Type[Any]]] = None,
         storage_provider: Optional[StorageProviderAbstract] = None,
+        span_exporter: Optional[SpanExporterAbstract] = None,
     ):
         # tools
         self.pipelex_hub.set_secrets_provider(secrets_provider or EnvSecretsProvider())
+        blob_store_config = get_config().pipelex.blob_store_config
+        if storage_provider is None and blob_store_config.is_enabled:
+            local_blob_store = LocalBlobStore(store_dir=blob_store_config.store_dir, ttl_seconds=blob_store_config.applied_ttl_seconds)
+            local_blob_store.evict_expired_blobs()
+            storage_provider = local_blob_store
         self.pipelex_hub.set_storage_provider(storage_provider)
+        payload_storage.setup(storage_provider=storage_provider)
+        http_client_pool.setup(http_client_config=get_config().pipelex.http_client_config)
+        pypdfium2_renderer.setup(pdf_renderer_config=get_config().pipelex.pdf_renderer_config)
+        pipe_func_runner.setup(func_execution_config=get_config().pipelex.pipe_run_config.func_execution_config)
+        pipe_span_tracer.setup(telemetry_config=get_config().pipelex.telemetry_config, span_exporter=span_exporter)
         # cogt
         self.pipelex_hub.set_content_generator(content_generator or ContentGenerator())
         self.reporting_delegate.setup()
+        inference_retry_policy.setup(retry_config=get_config().cogt.inference_retry_config)
         self.class_registry.register_classes(PipelexRegistryModels.get_all_models())
         if runtime_manager.is_unit_testing:
             log.debug("Registering test models for unit testing")
@@ -207,26 +233,44 @@ class Pipelex:
         log.debug(f"{PACKAGE_NAME} version {PACKAGE_VERSION} setup done for {get_config().project_name}")
 
     def finish_setup(self):
+        startup_timer = self.startup_timer
         try:
-            self.template_provider.setup()
-            self.llm_model_provider.setup()
-            llm_deck = self.library_manager.load_deck()
-            for llm_model in self.llm_model_provider.get_all_llm_models():
-                if llm_model.version == LATEST_VERSION_NAME:
-                    llm_deck.add_llm_handle_to_llm_engine_blueprint(
-                        llm_handle=llm_model.llm_name,
-                        llm_engine_default=llm_model.llm_name,
-                    )
-            llm_deck.validate_llm_presets()
-            self.library_manager.load_libraries()
+            with startup_timer.phase("library_snapshot"):
+                library_snapshot = self.library_manager.load_library_snapshot()
+            with startup_timer.phase("templates"):
+                if library_snapshot is not None:
+                    self.template_provider.root = dict(library_snapshot.templates)
+                else:
+                    self.template_provider.setup()
+            with startup_timer.phase("llm_models"):
+                self.llm_model_provider.setup()
+                llm_rate_limiter.setup()
+            with startup_timer.phase("llm_deck"):
+                llm_deck = self.library_manager.load_deck()
+                for llm_model in self.llm_model_provider.get_all_llm_models():
+                    if llm_model.version == LATEST_VERSION_NAME:
+                        llm_deck.add_llm_handle_to_llm_engine_blueprint(
+                            llm_handle=llm_model.llm_name,
+                            llm_engine_default=llm_model.llm_name,
+                        )
+                llm_deck.validate_llm_presets()
+            self.library_manager.load_libraries(library_snapshot=library_snapshot)
             if self.library_manager.llm_deck is None:
                 raise PipelexSetupError("LLM deck is not loaded")
 
             self.pipelex_hub.set_llm_deck_provider(llm_deck_provider=self.library_manager.llm_deck)
-            self.library_manager.validate_libraries()
+            if library_snapshot is not None:
+                # the snapshot was saved once its libraries were validated
+                with startup_timer.phase("llm_deck"):
+                    self.library_manager.validate_llm_deck()
+            else:
+                self.library_manager.validate_libraries()
+                with startup_timer.phase("library_snapshot"):
+                    self.library_manager.save_library_snapshot(templates=self.template_provider.root)
         except ValidationError as exc:
             error_msg = format_pydantic_validation_error(exc)
             raise PipelexSetupError(f"Error because of: {error_msg}") from exc
+        log.debug(startup_timer.make_breakdown_text(), title="Startup timing breakdown")
         log.debug(f"{PACKAGE_NAME} version {PACKAGE_VERSION} finish setup done for {get_config().project_name}")
 
     def teardown(self):
@@ -236,16 +280,27 @@ class Pipelex:
         self.library_manager.teardown()
         self.template_provider.teardown()
         self.activity_manager.teardown()
+        pipe_batch_checkpoint_store.teardown()
+        pipe_span_tracer.teardown()
 
         # cogt
         self.inference_manager.teardown()
+        self.plugin_manager.teardown()
         self.reporting_delegate.teardown()
         self.llm_model_provider.teardown()
+        llm_response_cache.teardown()
+        llm_rate_limiter.teardown()
+        inference_retry_policy.teardown()
 
         # tools
         self.kajson_manager.teardown()
         self.class_registry.teardown()
         func_registry.teardown()
+        jinja2_template_cache.teardown()
+        http_client_pool.teardown()
+        pypdfium2_renderer.teardown()
+        pipe_func_runner.teardown()
+        payload_storage.teardown()
 
         Pipelex._pipelex_instance = None
         project_name = get_config().project_name
@@ -14,6 +14,7 @@ from pipelex.core.stuff_content import (
     StuffContent,
     TextContent,
 )
+from pipelex.pipe_controllers.pipe_batch_models import BatchItemActivity
 from pipelex.pipeline.activity.activity_models import ActivityReport
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx
 from pipelex.tools.misc.file_utils import ensure_path, save_text_to_path
@@ -44,9 +45,19 @@ class ActivityHandlerForResultFiles:
             self.handle_stuff(stuff=the_stuff)
             if code := the_stuff.stuff_code:
                 self.already_handled_stuff.add(code)
+        elif isinstance(activity_report.content, BatchItemActivity):
+            # the branch outputs are already handled when the operator producing them reports its activity
+            batch_item_activity = activity_report.content
+            if batch_item_activity.error:
+                self._handle_batch_item_error(batch_item_activity=batch_item_activity)
         else:
             log.error(f"Unhandled activity_report: {activity_report}")
 
+    def _handle_batch_item_error(self, batch_item_activity: BatchItemActivity) -> None:
+        errors_dir = os.path.join(self.result_dir_path, f"{batch_item_activity.pipe_code}_errors")
+        ensure_path(errors_dir)
+        save_as_json_to_path(batch_item_activity.error, os.path.join(errors_dir, f"branch_{batch_item_activity.branch_index}.json"))
+
     def handle_stuff(self, stuff: Stuff) -> None:
         # Create a directory for this stuff using its code and name
         stuff_id = self._generate_stuff_id(stuff)
@@ -91,6 +102,9 @@ class ActivityHandlerForResultFiles:
             image_bytes: bytes = fetch_file_from_url_httpx(url=content.url, timeout=10)
             with open(image_path, "wb") as image_file:
                 image_file.write(image_bytes)
+        elif content.blob_uri and (blob_image_bytes := content.get_bytes()):
+            with open(image_path, "wb") as image_file:
+                image_file.write(blob_image_bytes)
         else:
             image_path = content.url
 
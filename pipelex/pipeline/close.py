@@ -0,0 +1,23 @@
+from pipelex.pipeline.pipeline_lifecycle import close_pipeline_run
+
+
+def close_pipeline(pipeline_run_id: str, should_generate_report: bool = True) -> None:
+    """Close a pipeline run and release what is held for it.
+
+    The usage of the run is flushed into its cost report, then its pipeline and its usage registry are released.
+    Close each run once you no longer need it, e.g. in a long-lived service: the runs that are never closed are only
+    evicted once idle, according to the ``[pipelex.pipeline_retention_config]``.
+
+    Parameters
+    ----------
+    pipeline_run_id:
+        The ``pipeline_run_id`` returned by *execute_pipeline* or *start_pipeline*.
+    should_generate_report:
+        Whether to generate the cost report of the run before releasing its usage registry.
+
+    Raises
+    ------
+    PipelineManagerError
+        If the run is still running.
+    """
+    close_pipeline_run(pipeline_run_id=pipeline_run_id, should_generate_report=should_generate_report)
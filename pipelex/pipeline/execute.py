@@ -5,9 +5,10 @@ from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import FORCE_DRY_RUN_MODE_ENV_KEY, PipeOutputMultiplicity, PipeRunMode
 from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
 from pipelex.core.working_memory import WorkingMemory
-from pipelex.hub import get_pipe_router, get_pipeline_manager, get_report_delegate, get_required_pipe
+from pipelex.hub import get_pipe_router, get_required_pipe
 from pipelex.pipe_works.pipe_job_factory import PipeJobFactory
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.pipeline_lifecycle import end_pipeline_run_job, open_pipeline_run
 from pipelex.tools.environment import get_optional_env
 
 
@@ -18,6 +19,7 @@ async def execute_pipeline(
     output_multiplicity: Optional[PipeOutputMultiplicity] = None,
     dynamic_output_concept_code: Optional[str] = None,
     pipe_run_mode: Optional[PipeRunMode] = None,
+    pipeline_run_id: Optional[str] = None,
 ) -> PipeOutput:
     """Execute a pipeline and wait for its completion.
 
@@ -42,6 +44,10 @@ async def execute_pipeline(
         If not specified, the pipe run mode is inferred from the environment variable
         ``PIPELEX_FORCE_DRY_RUN_MODE``. If the environment variable is not set,
         the pipe run mode is ``PipeRunMode.LIVE``.
+    pipeline_run_id:
+        Optional identity of the run. Pass the ``pipeline_run_id`` of a previous run to resume it:
+        the ``PipeBatch`` branches it completed are restored from their checkpoints if batch checkpoints are enabled.
+        If not specified, a new ``pipeline_run_id`` is generated.
 
     Returns
     -------
@@ -54,15 +60,8 @@ async def execute_pipeline(
         else:
             pipe_run_mode = PipeRunMode.LIVE
 
-    pipeline = get_pipeline_manager().add_new_pipeline()
-    pipeline_run_id = pipeline.pipeline_run_id
-    get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
     pipe = get_required_pipe(pipe_code=pipe_code)
 
-    job_metadata = JobMetadata(
-        pipeline_run_id=pipeline_run_id,
-    )
-
     pipe_run_params = PipeRunParamsFactory.make_run_params(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
@@ -73,6 +72,11 @@ async def execute_pipeline(
     if working_memory:
         working_memory.pretty_print_summary()
 
+    pipeline = open_pipeline_run(pipeline_run_id=pipeline_run_id)
+    job_metadata = JobMetadata(
+        pipeline_run_id=pipeline.pipeline_run_id,
+    )
+
     pipe_job = PipeJobFactory.make_pipe_job(
         pipe=pipe,
         pipe_run_params=pipe_run_params,
@@ -81,4 +85,7 @@ async def execute_pipeline(
         output_name=output_name,
     )
 
-    return await get_pipe_router().run_pipe_job(pipe_job)
+    try:
+        return await get_pipe_router().run_pipe_job(pipe_job)
+    finally:
+        end_pipeline_run_job(pipeline=pipeline)
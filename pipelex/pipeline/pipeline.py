@@ -1,5 +1,21 @@
-from pydantic import BaseModel
+import time
+
+from pydantic import BaseModel, Field
 
 
 class Pipeline(BaseModel):
     pipeline_run_id: str
+    last_active_at: float = Field(default_factory=time.monotonic)
+    nb_running_jobs: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self.nb_running_jobs > 0
+
+    def mark_job_started(self) -> None:
+        self.nb_running_jobs += 1
+        self.last_active_at = time.monotonic()
+
+    def mark_job_ended(self) -> None:
+        self.nb_running_jobs = max(0, self.nb_running_jobs - 1)
+        self.last_active_at = time.monotonic()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import shortuuid
 
 from pipelex.pipeline.pipeline import Pipeline
@@ -5,7 +7,7 @@ from pipelex.pipeline.pipeline import Pipeline
 
 class PipelineFactory:
     @classmethod
-    def make_pipeline(cls) -> Pipeline:
+    def make_pipeline(cls, pipeline_run_id: Optional[str] = None) -> Pipeline:
         return Pipeline(
-            pipeline_run_id=shortuuid.uuid(),
+            pipeline_run_id=pipeline_run_id or shortuuid.uuid(),
         )
@@ -0,0 +1,59 @@
+from typing import List, Optional
+
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.exceptions import PipelineManagerError
+from pipelex.hub import get_pipeline_manager, get_pipeline_tracker, get_report_delegate
+from pipelex.pipeline.pipeline import Pipeline
+
+
+def open_pipeline_run(pipeline_run_id: Optional[str] = None) -> Pipeline:
+    """
+    Get the pipeline of a run about to start a job, opening the pipeline and its usage registry if it is a new run.
+
+    The idle runs that exceed the [pipelex.pipeline_retention_config] are evicted first.
+    """
+    evict_stale_pipeline_runs()
+    pipeline_manager = get_pipeline_manager()
+    pipeline = pipeline_manager.get_optional_pipeline(pipeline_run_id=pipeline_run_id) if pipeline_run_id else None
+    if pipeline is None:
+        pipeline = pipeline_manager.add_new_pipeline(pipeline_run_id=pipeline_run_id)
+        get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
+    # else: resuming a run of this process, its pipeline and usage registry are still there
+    pipeline.mark_job_started()
+    return pipeline
+
+
+def end_pipeline_run_job(pipeline: Pipeline) -> None:
+    pipeline.mark_job_ended()
+    if not pipeline.is_running:
+        get_pipeline_tracker().finish_run(pipeline_run_id=pipeline.pipeline_run_id)
+
+
+def close_pipeline_run(pipeline_run_id: str, should_generate_report: bool) -> None:
+    pipeline_manager = get_pipeline_manager()
+    pipeline = pipeline_manager.get_optional_pipeline(pipeline_run_id=pipeline_run_id)
+    if pipeline is None:
+        log.debug(f"Pipeline run '{pipeline_run_id}' is already closed")
+        return
+    if pipeline.is_running:
+        raise PipelineManagerError(f"Pipeline run '{pipeline_run_id}' can't be closed while it is running")
+    report_delegate = get_report_delegate()
+    if should_generate_report:
+        report_delegate.generate_report(pipeline_run_id=pipeline_run_id)
+    report_delegate.close_registry(pipeline_run_id=pipeline_run_id)
+    pipeline_manager.close_pipeline(pipeline_run_id=pipeline_run_id)
+
+
+def evict_stale_pipeline_runs() -> List[str]:
+    """Close the idle pipeline runs that were never closed, beyond the limits of the [pipelex.pipeline_retention_config]."""
+    retention_config = get_config().pipelex.pipeline_retention_config
+    stale_pipeline_run_ids = get_pipeline_manager().get_stale_pipeline_run_ids(
+        max_nb_open_runs=retention_config.applied_max_nb_open_runs,
+        idle_ttl_seconds=retention_config.applied_idle_ttl_seconds,
+    )
+    for pipeline_run_id in stale_pipeline_run_ids:
+        close_pipeline_run(pipeline_run_id=pipeline_run_id, should_generate_report=retention_config.is_report_generated_on_eviction)
+    if stale_pipeline_run_ids:
+        log.debug(f"Evicted {len(stale_pipeline_run_ids)} idle pipeline runs")
+    return stale_pipeline_run_ids
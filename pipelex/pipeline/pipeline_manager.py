@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
 
 from pydantic import Field, RootModel
 from typing_extensions import override
@@ -38,7 +39,34 @@ class PipelineManager(PipelineManagerAbstract, RootModel[PipelineManagerRoot]):
         return pipeline
 
     @override
-    def add_new_pipeline(self) -> Pipeline:
-        pipeline = PipelineFactory.make_pipeline()
+    def add_new_pipeline(self, pipeline_run_id: Optional[str] = None) -> Pipeline:
+        pipeline = PipelineFactory.make_pipeline(pipeline_run_id=pipeline_run_id)
         self._set_pipeline(pipeline_run_id=pipeline.pipeline_run_id, pipeline=pipeline)
         return pipeline
+
+    @override
+    def close_pipeline(self, pipeline_run_id: str) -> Optional[Pipeline]:
+        return self.root.pop(pipeline_run_id, None)
+
+    @override
+    def get_stale_pipeline_run_ids(self, max_nb_open_runs: Optional[int], idle_ttl_seconds: Optional[int]) -> List[str]:
+        """
+        List the idle pipeline runs to evict: those idle for longer than idle_ttl_seconds,
+        then the least recently active ones beyond max_nb_open_runs. Running pipelines are never listed.
+        """
+        now = time.monotonic()
+        idle_pipelines = sorted(
+            (pipeline for pipeline in self.root.values() if not pipeline.is_running),
+            key=lambda pipeline: pipeline.last_active_at,
+        )
+        stale_pipeline_run_ids: List[str] = []
+        nb_kept_runs = len(self.root)
+        for pipeline in idle_pipelines:
+            is_expired = idle_ttl_seconds is not None and now - pipeline.last_active_at > idle_ttl_seconds
+            is_over_limit = max_nb_open_runs is not None and nb_kept_runs > max_nb_open_runs
+            if not is_expired and not is_over_limit:
+                # the next pipelines are more recently active
+                break
+            stale_pipeline_run_ids.append(pipeline.pipeline_run_id)
+            nb_kept_runs -= 1
+        return stale_pipeline_run_ids
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from pipelex.pipeline.pipeline import Pipeline
 
@@ -22,5 +22,13 @@ class PipelineManagerAbstract(ABC):
         pass
 
     @abstractmethod
-    def add_new_pipeline(self) -> Pipeline:
+    def add_new_pipeline(self, pipeline_run_id: Optional[str] = None) -> Pipeline:
+        pass
+
+    @abstractmethod
+    def close_pipeline(self, pipeline_run_id: str) -> Optional[Pipeline]:
+        pass
+
+    @abstractmethod
+    def get_stale_pipeline_run_ids(self, max_nb_open_runs: Optional[int], idle_ttl_seconds: Optional[int]) -> List[str]:
         pass
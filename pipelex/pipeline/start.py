@@ -6,9 +6,10 @@ from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import PipeOutputMultiplicity, PipeRunMode
 from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
 from pipelex.core.working_memory import WorkingMemory
-from pipelex.hub import get_pipe_router, get_pipeline_manager, get_report_delegate, get_required_pipe
+from pipelex.hub import get_pipe_router, get_required_pipe
 from pipelex.pipe_works.pipe_job_factory import PipeJobFactory
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.pipeline_lifecycle import end_pipeline_run_job, open_pipeline_run
 
 
 async def start_pipeline(
@@ -18,6 +19,7 @@ async def start_pipeline(
     output_multiplicity: Optional[PipeOutputMultiplicity] = None,
     dynamic_output_concept_code: Optional[str] = None,
     pipe_run_mode: PipeRunMode = PipeRunMode.LIVE,
+    pipeline_run_id: Optional[str] = None,
 ) -> asyncio.Task[PipeOutput]:
     """Start a pipeline in the background.
 
@@ -40,6 +42,8 @@ async def start_pipeline(
         Override the dynamic output concept code.
     pipe_run_mode:
         Pipe run mode: ``PipeRunMode.LIVE`` or ``PipeRunMode.DRY``.
+    pipeline_run_id:
+        Optional identity of the run, see *execute_pipeline*.
     Returns
     -------
     Tuple[str, asyncio.Task[PipeOutput]]
@@ -47,15 +51,8 @@ async def start_pipeline(
         can be awaited to get the pipe output.
     """
 
-    pipeline = get_pipeline_manager().add_new_pipeline()
-    pipeline_run_id = pipeline.pipeline_run_id
-    get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
     pipe = get_required_pipe(pipe_code=pipe_code)
 
-    job_metadata = JobMetadata(
-        pipeline_run_id=pipeline_run_id,
-    )
-
     pipe_run_params = PipeRunParamsFactory.make_run_params(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
@@ -66,6 +63,11 @@ async def start_pipeline(
     if working_memory:
         working_memory.pretty_print_summary()
 
+    pipeline = open_pipeline_run(pipeline_run_id=pipeline_run_id)
+    job_metadata = JobMetadata(
+        pipeline_run_id=pipeline.pipeline_run_id,
+    )
+
     pipe_job = PipeJobFactory.make_pipe_job(
         pipe=pipe,
         pipe_run_params=pipe_run_params,
@@ -76,5 +78,6 @@ async def start_pipeline(
 
     # Launch execution without awaiting the result.
     task: asyncio.Task[PipeOutput] = asyncio.create_task(get_pipe_router().run_pipe_job(pipe_job))
+    task.add_done_callback(lambda _: end_pipeline_run_job(pipeline=pipeline))
 
     return task
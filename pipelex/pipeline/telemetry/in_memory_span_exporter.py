@@ -0,0 +1,32 @@
+from collections import deque
+from typing import Deque, List, Optional
+
+from typing_extensions import override
+
+from pipelex.pipeline.telemetry.pipe_span import PipeSpan
+from pipelex.pipeline.telemetry.span_exporter_abstract import SpanExporterAbstract
+
+
+class InMemorySpanExporter(SpanExporterAbstract):
+    """Keep the exported spans in memory, the oldest ones being dropped beyond max_nb_spans."""
+
+    def __init__(self, max_nb_spans: Optional[int] = None):
+        self._spans: Deque[PipeSpan] = deque(maxlen=max_nb_spans)
+
+    @override
+    def export(self, spans: List[PipeSpan]) -> None:
+        self._spans.extend(spans)
+
+    @override
+    def shutdown(self) -> None:
+        self._spans.clear()
+
+    @property
+    def spans(self) -> List[PipeSpan]:
+        return list(self._spans)
+
+    def get_spans(self, pipeline_run_id: str) -> List[PipeSpan]:
+        return [span for span in self._spans if span.pipeline_run_id == pipeline_run_id]
+
+    def clear(self) -> None:
+        self._spans.clear()
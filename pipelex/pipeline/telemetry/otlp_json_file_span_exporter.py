@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List
+
+from typing_extensions import override
+
+from pipelex.pipeline.telemetry.pipe_span import PipeSpan, PipeSpanStatus
+from pipelex.pipeline.telemetry.span_exporter_abstract import SpanExporterAbstract
+from pipelex.tools.misc.file_utils import ensure_path
+
+SCOPE_NAME = "pipelex"
+# https://opentelemetry.io/docs/specs/otel/trace/api/#spankind
+SPAN_KIND_INTERNAL = 1
+# https://opentelemetry.io/docs/specs/otel/trace/api/#set-status
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+def make_trace_id(pipeline_run_id: str) -> str:
+    """All the spans of a pipeline run share a trace id, derived from the pipeline_run_id."""
+    return hashlib.md5(pipeline_run_id.encode()).hexdigest()
+
+
+def make_otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    elif isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"key": key, "value": {"intValue": str(value)}}
+    elif isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    else:
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def make_otlp_span(span: PipeSpan) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {
+        "pipelex.pipe.code": span.pipe_code,
+        "pipelex.pipe.class": span.pipe_class,
+        "pipelex.pipeline_run_id": span.pipeline_run_id,
+        "pipelex.queue_wait_seconds": span.queue_wait_seconds,
+        "pipelex.inference_seconds": span.inference_seconds,
+    }
+    if span.output_size_bytes is not None:
+        attributes["pipelex.output_size_bytes"] = span.output_size_bytes
+    otlp_span: Dict[str, Any] = {
+        "traceId": make_trace_id(pipeline_run_id=span.pipeline_run_id),
+        "spanId": span.span_id,
+        "name": span.pipe_code,
+        "kind": SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": str(span.started_at_ns),
+        "endTimeUnixNano": str(span.ended_at_ns or span.started_at_ns),
+        "attributes": [make_otlp_attribute(key=key, value=value) for key, value in attributes.items()],
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    match span.status:
+        case PipeSpanStatus.OK:
+            otlp_span["status"] = {"code": STATUS_CODE_OK}
+        case PipeSpanStatus.ERROR:
+            otlp_span["status"] = {"code": STATUS_CODE_ERROR, "message": span.error_message or ""}
+    return otlp_span
+
+
+class OtlpJsonFileSpanExporter(SpanExporterAbstract):
+    """
+    Append the spans to a local file in the OTLP/JSON format, one export request per line.
+
+    The file can be replayed to any OpenTelemetry collector, e.g. with its otlpjsonfile receiver.
+    """
+
+    def __init__(self, file_path: str, service_name: str):
+        self.file_path = file_path
+        self.service_name = service_name
+
+    def make_export_request(self, spans: List[PipeSpan]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [make_otlp_attribute(key="service.name", value=self.service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": SCOPE_NAME},
+                            "spans": [make_otlp_span(span=span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    @property
+    @override
+    def is_export_blocking(self) -> bool:
+        return True
+
+    @override
+    def export(self, spans: List[PipeSpan]) -> None:
+        if not spans:
+            return
+        if dir_path := os.path.dirname(self.file_path):
+            ensure_path(dir_path)
+        with open(self.file_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(self.make_export_request(spans=spans)) + "\n")
@@ -0,0 +1,59 @@
+import secrets
+import time
+from typing import Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from pipelex.types import StrEnum
+
+
+class PipeSpanStatus(StrEnum):
+    OK = "ok"
+    ERROR = "error"
+
+
+def make_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+class PipeSpan(BaseModel):
+    """
+    Timing of one run of a pipe, operator or controller.
+
+    The queue wait and the inference time are summed over the inference jobs run directly by the pipe:
+    they can exceed the duration of the span when jobs run concurrently, e.g. the page chunks of an OCR job.
+    """
+
+    span_id: str = Field(default_factory=make_span_id)
+    parent_span_id: Optional[str] = None
+    pipeline_run_id: str
+    pipe_code: str
+    pipe_class: str
+
+    started_at_ns: int = Field(default_factory=time.time_ns)
+    ended_at_ns: Optional[int] = None
+    duration_seconds: Optional[float] = None
+    queue_wait_seconds: float = 0.0
+    inference_seconds: float = 0.0
+    output_size_bytes: Optional[int] = None
+
+    status: PipeSpanStatus = PipeSpanStatus.OK
+    error_message: Optional[str] = None
+
+    _started_at_perf_counter: float = PrivateAttr(default_factory=time.perf_counter)
+
+    def record_output(self, output: BaseModel) -> None:
+        """Record the size of the output as its JSON serialization, leaving it unknown if the output can't be serialized."""
+        try:
+            self.output_size_bytes = len(output.model_dump_json().encode())
+        except Exception:
+            # whatever the output holds, telemetry must not fail the pipe
+            self.output_size_bytes = None
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = PipeSpanStatus.ERROR
+        self.error_message = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        self.duration_seconds = time.perf_counter() - self._started_at_perf_counter
+        self.ended_at_ns = time.time_ns()
@@ -0,0 +1,152 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.pipeline.telemetry.in_memory_span_exporter import InMemorySpanExporter
+from pipelex.pipeline.telemetry.otlp_json_file_span_exporter import OtlpJsonFileSpanExporter
+from pipelex.pipeline.telemetry.pipe_span import PipeSpan
+from pipelex.pipeline.telemetry.span_exporter_abstract import SpanExporterAbstract
+from pipelex.pipeline.telemetry.telemetry_config import SpanExporterType, TelemetryConfig
+
+
+class InferenceAttemptTiming:
+    def __init__(self) -> None:
+        self.queue_wait_seconds: float = 0.0
+
+
+_current_pipe_span: ContextVar[Optional[PipeSpan]] = ContextVar("current_pipe_span", default=None)
+_current_inference_attempt: ContextVar[Optional[InferenceAttemptTiming]] = ContextVar("current_inference_attempt", default=None)
+
+
+def make_span_exporter(telemetry_config: TelemetryConfig) -> Optional[SpanExporterAbstract]:
+    match telemetry_config.span_exporter_type:
+        case SpanExporterType.NONE:
+            return None
+        case SpanExporterType.IN_MEMORY:
+            return InMemorySpanExporter(max_nb_spans=telemetry_config.applied_max_nb_in_memory_spans)
+        case SpanExporterType.OTLP_JSON_FILE:
+            return OtlpJsonFileSpanExporter(file_path=telemetry_config.otlp_json_file_path, service_name=telemetry_config.service_name)
+
+
+class PipeSpanTracer:
+    """
+    Record a span for each run of a pipe and hand the ended spans over to the span exporter.
+
+    The current span is held in a context variable, so the pipes run concurrently by a controller get it as their parent,
+    and the inference workers can add their queue wait and inference time to the span of the pipe running them.
+    The ended spans are exported by batches, and when a root span ends.
+    Exporters doing blocking I/O are run in a single background thread, so that the batches are exported in order.
+    """
+
+    def __init__(self) -> None:
+        self._span_exporter: Optional[SpanExporterAbstract] = None
+        self._export_batch_size: int = 1
+        self._is_output_size_recorded: bool = False
+        self._ended_spans: List[PipeSpan] = []
+        self._export_executor: Optional[ThreadPoolExecutor] = None
+
+    def setup(self, telemetry_config: TelemetryConfig, span_exporter: Optional[SpanExporterAbstract] = None):
+        self._span_exporter = span_exporter or make_span_exporter(telemetry_config=telemetry_config)
+        self._export_batch_size = telemetry_config.export_batch_size
+        self._is_output_size_recorded = telemetry_config.is_output_size_recorded
+        if self._span_exporter is not None and self._span_exporter.is_export_blocking:
+            self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipe_span_export")
+
+    def teardown(self):
+        self.flush()
+        if self._export_executor is not None:
+            # wait for the pending exports
+            self._export_executor.shutdown(wait=True)
+            self._export_executor = None
+        if self._span_exporter is not None:
+            self._span_exporter.shutdown()
+            self._span_exporter = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._span_exporter is not None
+
+    @property
+    def span_exporter(self) -> Optional[SpanExporterAbstract]:
+        return self._span_exporter
+
+    @contextmanager
+    def trace_pipe(self, pipe_code: str, pipe_class: str, pipeline_run_id: str) -> Iterator[Optional[PipeSpan]]:
+        """Record the span of a pipe run, yielding None when tracing is disabled."""
+        if self._span_exporter is None:
+            yield None
+            return
+        parent_span = _current_pipe_span.get()
+        pipe_span = PipeSpan(
+            parent_span_id=parent_span.span_id if parent_span else None,
+            pipeline_run_id=pipeline_run_id,
+            pipe_code=pipe_code,
+            pipe_class=pipe_class,
+        )
+        token = _current_pipe_span.set(pipe_span)
+        try:
+            yield pipe_span
+        except BaseException as exc:
+            pipe_span.record_error(exc=exc)
+            raise
+        finally:
+            _current_pipe_span.reset(token)
+            pipe_span.end()
+            self._ended_spans.append(pipe_span)
+            if parent_span is None or len(self._ended_spans) >= self._export_batch_size:
+                self.flush()
+
+    def record_output(self, pipe_span: PipeSpan, output: BaseModel):
+        """Record the size of the output of a pipe if it is enabled by is_output_size_recorded, as it costs a JSON serialization."""
+        if self._is_output_size_recorded:
+            pipe_span.record_output(output=output)
+
+    def record_queue_wait(self, wait_seconds: float):
+        """Add time spent waiting for a rate limit or a concurrency slot to the span of the current pipe."""
+        pipe_span = _current_pipe_span.get()
+        if pipe_span is None:
+            return
+        pipe_span.queue_wait_seconds += wait_seconds
+        if inference_attempt := _current_inference_attempt.get():
+            inference_attempt.queue_wait_seconds += wait_seconds
+
+    @contextmanager
+    def time_inference_attempt(self) -> Iterator[None]:
+        """Add the duration of an inference attempt to the span of the current pipe, minus its queue wait."""
+        pipe_span = _current_pipe_span.get()
+        if pipe_span is None:
+            yield
+            return
+        inference_attempt = InferenceAttemptTiming()
+        token = _current_inference_attempt.set(inference_attempt)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            _current_inference_attempt.reset(token)
+            pipe_span.inference_seconds += max(0.0, time.perf_counter() - started_at - inference_attempt.queue_wait_seconds)
+
+    def flush(self):
+        if self._span_exporter is None or not self._ended_spans:
+            return
+        spans, self._ended_spans = self._ended_spans, []
+        if self._export_executor is not None:
+            self._export_executor.submit(self._export_spans, span_exporter=self._span_exporter, spans=spans)
+        else:
+            self._export_spans(span_exporter=self._span_exporter, spans=spans)
+
+    @staticmethod
+    def _export_spans(span_exporter: SpanExporterAbstract, spans: List[PipeSpan]):
+        try:
+            span_exporter.export(spans=spans)
+        except Exception as exc:
+            # losing spans must not fail the pipeline
+            log.error(f"Failed to export {len(spans)} pipe spans: {exc}")
+
+
+pipe_span_tracer = PipeSpanTracer()
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from pipelex.pipeline.telemetry.pipe_span import PipeSpan
+
+
+class SpanExporterAbstract(ABC):
+    @abstractmethod
+    def export(self, spans: List[PipeSpan]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    @property
+    def is_export_blocking(self) -> bool:
+        """Whether export() does blocking I/O, in which case the tracer runs it in a background thread, off the event loop."""
+        return False
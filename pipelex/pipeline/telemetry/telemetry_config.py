@@ -0,0 +1,35 @@
+from typing import Literal, Optional, Union
+
+from pydantic import Field, field_validator
+
+from pipelex.exceptions import PipelexConfigError
+from pipelex.tools.config.models import ConfigModel
+from pipelex.types import StrEnum
+
+
+class SpanExporterType(StrEnum):
+    NONE = "none"
+    IN_MEMORY = "in_memory"
+    OTLP_JSON_FILE = "otlp_json_file"
+
+
+class TelemetryConfig(ConfigModel):
+    span_exporter_type: SpanExporterType = Field(strict=False)
+    service_name: str
+    otlp_json_file_path: str
+    max_nb_in_memory_spans: Union[int, Literal["unlimited"]]
+    export_batch_size: int
+    is_output_size_recorded: bool
+
+    @field_validator("max_nb_in_memory_spans", "export_batch_size")
+    def validate_positive_limits(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError("telemetry_config limits must be positive integers")
+        return value
+
+    @property
+    def applied_max_nb_in_memory_spans(self) -> Optional[int]:
+        if self.max_nb_in_memory_spans == "unlimited":
+            return None
+        else:
+            return self.max_nb_in_memory_spans
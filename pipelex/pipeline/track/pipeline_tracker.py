@@ -2,6 +2,7 @@
 # pyright: reportUnknownArgumentType=false
 # pyright: reportUnknownMemberType=false
 # pyright: reportMissingTypeArgument=false
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 import networkx as nx
@@ -25,15 +26,36 @@ from pipelex.pipeline.track.tracker_models import (
 from pipelex.tools.misc.mermaid_utils import print_mermaid_url
 
 
-# TODO: manage a separate graph for each pipeline_run_id
+class TrackedRunGraph:
+    """The graph of the stuffs and pipe steps of one pipeline run, with a rough size estimate of its node attributes."""
+
+    def __init__(self) -> None:
+        self.nx_graph: nx.DiGraph = nx.DiGraph()
+        self.start_node: Optional[str] = None
+        self.nb_bytes: int = 0
+
+    def add_node(self, node: str, node_attributes: Dict[str, Any]) -> None:
+        self.nx_graph.add_node(node, **node_attributes)
+        self.nb_bytes += sum(len(value) for value in node_attributes.values() if isinstance(value, str))
+
+
 # TODO: restore disabled tracking functionality in PipeBatch
 class PipelineTracker(PipelineTrackerProtocol):
+    """
+    Tracks the graph of each pipeline run separately.
+
+    Finished runs are kept for flowchart output until they exceed the retention limits of the [pipelex.tracker_config]:
+    the oldest finished runs are then evicted, except the last one. Runs in progress are never evicted.
+    """
+
     def __init__(self, tracker_config: TrackerConfig):
         self._tracker_config = tracker_config
         self._is_debug_mode = tracker_config.is_debug_mode
         self.is_active: bool = False
-        self.nx_graph: nx.DiGraph = nx.DiGraph()
-        self.start_node: Optional[str] = None
+        self._run_graphs: Dict[str, TrackedRunGraph] = {}
+        # finished runs, oldest first
+        self._finished_run_ids: OrderedDict[str, None] = OrderedDict()
+        self._last_pipeline_run_id: Optional[str] = None
 
     @override
     def setup(self):
@@ -42,11 +64,52 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def teardown(self):
         self.is_active = False
-        self.nx_graph = nx.DiGraph()
-        self.start_node = None
+        self._run_graphs.clear()
+        self._finished_run_ids.clear()
+        self._last_pipeline_run_id = None
 
-    def _get_node_name(self, node: str) -> Optional[str]:
-        node_attributes = self.nx_graph.nodes[node]
+    @property
+    def nb_tracked_runs(self) -> int:
+        return len(self._run_graphs)
+
+    def get_optional_run_graph(self, pipeline_run_id: str) -> Optional[TrackedRunGraph]:
+        return self._run_graphs.get(pipeline_run_id)
+
+    def _get_run_graph(self, pipeline_run_id: str) -> TrackedRunGraph:
+        run_graph = self._run_graphs.get(pipeline_run_id)
+        if run_graph is None:
+            run_graph = TrackedRunGraph()
+            self._run_graphs[pipeline_run_id] = run_graph
+        elif pipeline_run_id in self._finished_run_ids:
+            # the run was resumed
+            del self._finished_run_ids[pipeline_run_id]
+        self._last_pipeline_run_id = pipeline_run_id
+        return run_graph
+
+    @override
+    def finish_run(self, pipeline_run_id: str):
+        if pipeline_run_id not in self._run_graphs:
+            return
+        self._finished_run_ids[pipeline_run_id] = None
+        self._finished_run_ids.move_to_end(pipeline_run_id)
+        self._evict_finished_runs()
+
+    def _evict_finished_runs(self) -> None:
+        max_nb_finished_runs = self._tracker_config.applied_max_nb_finished_runs
+        max_finished_runs_bytes = self._tracker_config.applied_max_finished_runs_bytes
+        finished_runs_bytes = sum(self._run_graphs[pipeline_run_id].nb_bytes for pipeline_run_id in self._finished_run_ids)
+        while len(self._finished_run_ids) > 1:
+            is_over_nb_limit = max_nb_finished_runs is not None and len(self._finished_run_ids) > max_nb_finished_runs
+            is_over_bytes_limit = max_finished_runs_bytes is not None and finished_runs_bytes > max_finished_runs_bytes
+            if not is_over_nb_limit and not is_over_bytes_limit:
+                break
+            pipeline_run_id, _ = self._finished_run_ids.popitem(last=False)
+            evicted_run_graph = self._run_graphs.pop(pipeline_run_id)
+            finished_runs_bytes -= evicted_run_graph.nb_bytes
+            log.debug(f"Evicted the tracker graph of finished pipeline run '{pipeline_run_id}'")
+
+    def _get_node_name(self, run_graph: TrackedRunGraph, node: str) -> Optional[str]:
+        node_attributes = run_graph.nx_graph.nodes[node]
         node_name = node_attributes[NodeAttributeKey.NAME]
         if isinstance(node_name, str):
             return node_name
@@ -56,14 +119,14 @@ class PipelineTracker(PipelineTrackerProtocol):
     def _pipe_layer_to_subgraph_name(self, pipe_layer: List[str]) -> str:
         return "-".join(pipe_layer)
 
-    def _add_start_node(self) -> str:
+    def _add_start_node(self, run_graph: TrackedRunGraph) -> str:
         node = SpecialNodeName.START
         node_attributes: Dict[str, Any] = {
             NodeAttributeKey.CATEGORY: NodeCategory.SPECIAL,
             NodeAttributeKey.TAG: "Start",
             NodeAttributeKey.NAME: "Start",
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        run_graph.add_node(node=node, node_attributes=node_attributes)
         return node
 
     def _make_stuff_node_tag(
@@ -86,18 +149,19 @@ class PipelineTracker(PipelineTrackerProtocol):
 
     def _add_stuff_node(
         self,
+        run_graph: TrackedRunGraph,
         stuff: Stuff,
         pipe_layer: List[str],
         comment: str,
         as_item_index: Optional[int] = None,
     ) -> str:
         node = stuff.stuff_code
-        is_existing = self.nx_graph.has_node(node)
+        is_existing = run_graph.nx_graph.has_node(node)
         if is_existing:
             if self._is_debug_mode:
-                existing_comment = self.nx_graph.nodes[node][NodeAttributeKey.COMMENT]
+                existing_comment = run_graph.nx_graph.nodes[node][NodeAttributeKey.COMMENT]
                 comment = f"{existing_comment}<br/>+ {comment}"
-                self.nx_graph.nodes[node][NodeAttributeKey.COMMENT] = comment
+                run_graph.nx_graph.nodes[node][NodeAttributeKey.COMMENT] = comment
             return node
 
         stuff_content_rendered = stuff.content.rendered_plain()[:250]
@@ -121,24 +185,25 @@ class PipelineTracker(PipelineTrackerProtocol):
             NodeAttributeKey.COMMENT: comment,
             NodeAttributeKey.SUBGRAPH: pipe_layer_str,
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        run_graph.add_node(node=node, node_attributes=node_attributes)
         return node
 
     def _add_edge(
         self,
+        run_graph: TrackedRunGraph,
         from_node: str,
         to_node: str,
         edge_category: EdgeCategory,
         attributes: Optional[Dict[str, Any]] = None,
     ):
         # Ensure both nodes exist with attributes
-        if not self.nx_graph.has_node(from_node):
+        if not run_graph.nx_graph.has_node(from_node):
             raise JobHistoryError(f"Source node '{from_node}' does not exist")
-        if not self.nx_graph.has_node(to_node):
+        if not run_graph.nx_graph.has_node(to_node):
             raise JobHistoryError(f"Target node '{to_node}' does not exist")
-        if not self.nx_graph.nodes[from_node]:
+        if not run_graph.nx_graph.nodes[from_node]:
             raise JobHistoryError(f"Source node '{from_node}' exists but has no attributes")
-        if not self.nx_graph.nodes[to_node]:
+        if not run_graph.nx_graph.nodes[to_node]:
             raise JobHistoryError(f"Target node '{to_node}' exists but has no attributes")
 
         edge_attributes: Dict[str, Any] = {
@@ -146,11 +211,12 @@ class PipelineTracker(PipelineTrackerProtocol):
         }
         if attributes:
             edge_attributes.update(attributes)
-        self.nx_graph.add_edge(from_node, to_node, **edge_attributes)
+        run_graph.nx_graph.add_edge(from_node, to_node, **edge_attributes)
 
     @override
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         pipe_code: str,
@@ -161,19 +227,22 @@ class PipelineTracker(PipelineTrackerProtocol):
     ):
         if not self.is_active:
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node: str
         if from_stuff:
             from_node = self._add_stuff_node(
+                run_graph=run_graph,
                 stuff=from_stuff,
                 as_item_index=as_item_index,
                 pipe_layer=pipe_layer,
                 comment=comment,
             )
         else:
-            from_node = self._add_start_node()
-        if self.start_node is None:
-            self.start_node = from_node
+            from_node = self._add_start_node(run_graph=run_graph)
+        if run_graph.start_node is None:
+            run_graph.start_node = from_node
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             as_item_index=as_item_index,
             pipe_layer=pipe_layer,
@@ -187,6 +256,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         }
         if is_with_edge:
             self._add_edge(
+                run_graph=run_graph,
                 from_node=from_node,
                 to_node=to_node,
                 edge_category=EdgeCategory.PIPE,
@@ -196,6 +266,7 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         to_branch_index: int,
@@ -204,24 +275,28 @@ class PipelineTracker(PipelineTrackerProtocol):
     ):
         if not self.is_active:
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node: str
         if from_stuff:
             from_node = self._add_stuff_node(
+                run_graph=run_graph,
                 stuff=from_stuff,
                 pipe_layer=pipe_layer,
                 comment=comment,
             )
         else:
-            from_node = self._add_start_node()
-        if self.start_node is None:
-            self.start_node = from_node
+            from_node = self._add_start_node(run_graph=run_graph)
+        if run_graph.start_node is None:
+            run_graph.start_node = from_node
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             as_item_index=to_branch_index,
             pipe_layer=pipe_layer,
             comment=comment,
         )
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.BATCH,
@@ -230,6 +305,7 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -237,23 +313,27 @@ class PipelineTracker(PipelineTrackerProtocol):
     ):
         if not self.is_active:
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=from_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.AGGREGATE,
         )
 
-    def _add_condition_node(self, condition: PipeConditionDetails, pipe_layer: List[str]) -> str:
+    def _add_condition_node(self, run_graph: TrackedRunGraph, condition: PipeConditionDetails, pipe_layer: List[str]) -> str:
         node = condition.code
         condition_node_tag = f"Condition:<br>**{condition.test_expression}<br>= {condition.evaluated_expression}**"
         pipe_layer_str = self._pipe_layer_to_subgraph_name(pipe_layer)
@@ -263,12 +343,13 @@ class PipelineTracker(PipelineTrackerProtocol):
             NodeAttributeKey.NAME: condition.code,
             NodeAttributeKey.SUBGRAPH: pipe_layer_str,
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        run_graph.add_node(node=node, node_attributes=node_attributes)
         return node
 
     @override
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
@@ -277,16 +358,19 @@ class PipelineTracker(PipelineTrackerProtocol):
     ):
         if not self.is_active:
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=from_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
-        to_node = self._add_condition_node(condition=to_condition, pipe_layer=pipe_layer)
+        to_node = self._add_condition_node(run_graph=run_graph, condition=to_condition, pipe_layer=pipe_layer)
         edge_attributes: Dict[str, Any] = {
             EdgeAttributeKey.CONDITION_EXPRESSION: condition_expression,
         }
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.CONDITION,
@@ -296,6 +380,7 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -303,7 +388,9 @@ class PipelineTracker(PipelineTrackerProtocol):
     ):
         if not self.is_active:
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
@@ -312,19 +399,20 @@ class PipelineTracker(PipelineTrackerProtocol):
             EdgeAttributeKey.CHOSEN_PIPE: from_condition.chosen_pipe_code,
         }
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_condition.code,
             to_node=to_node,
             edge_category=EdgeCategory.CHOICE,
             attributes=edge_attributes,
         )
 
-    def _print_mermaid_flowchart_code_and_url(self, title: Optional[str] = None, subtitle: Optional[str] = None):
-        if not self.nx_graph.nodes:
+    def _print_mermaid_flowchart_code_and_url(self, run_graph: TrackedRunGraph, title: Optional[str] = None, subtitle: Optional[str] = None):
+        if not run_graph.nx_graph.nodes:
             log.info("No nodes in the pipeline tracker")
             return
-        if self.start_node is None:
+        if run_graph.start_node is None:
             raise JobHistoryError("Start node is not set")
-        flowchart = PipelineFlowChart(nx_graph=self.nx_graph, start_node=self.start_node, tracker_config=self._tracker_config)
+        flowchart = PipelineFlowChart(nx_graph=run_graph.nx_graph, start_node=run_graph.start_node, tracker_config=self._tracker_config)
         mermaid_code, url = flowchart.generate_mermaid_flowchart(title=title, subtitle=subtitle)
         print(mermaid_code)
         title_to_print = "Mermaid flowchart URL"
@@ -332,13 +420,13 @@ class PipelineTracker(PipelineTrackerProtocol):
             title_to_print += f" for {title}"
         print_mermaid_url(url=url, title=title_to_print)
 
-    def _print_mermaid_flowchart_url(self, title: Optional[str] = None, subtitle: Optional[str] = None):
-        if not self.nx_graph.nodes:
+    def _print_mermaid_flowchart_url(self, run_graph: TrackedRunGraph, title: Optional[str] = None, subtitle: Optional[str] = None):
+        if not run_graph.nx_graph.nodes:
             log.info("No nodes in the pipeline tracker")
             return
-        if self.start_node is None:
+        if run_graph.start_node is None:
             raise JobHistoryError("Start node is not set")
-        flowchart = PipelineFlowChart(nx_graph=self.nx_graph, start_node=self.start_node, tracker_config=self._tracker_config)
+        flowchart = PipelineFlowChart(nx_graph=run_graph.nx_graph, start_node=run_graph.start_node, tracker_config=self._tracker_config)
         _, url = flowchart.generate_mermaid_flowchart(title=title, subtitle=subtitle)
         title_to_print = "Mermaid flowchart URL"
         if title:
@@ -351,8 +439,14 @@ class PipelineTracker(PipelineTrackerProtocol):
         title: Optional[str] = None,
         subtitle: Optional[str] = None,
         is_detailed: bool = False,
+        pipeline_run_id: Optional[str] = None,
     ):
+        pipeline_run_id = pipeline_run_id or self._last_pipeline_run_id
+        run_graph = self._run_graphs.get(pipeline_run_id) if pipeline_run_id else None
+        if run_graph is None:
+            log.info(f"No graph in the pipeline tracker for pipeline run '{pipeline_run_id}'")
+            return
         if is_detailed:
-            self._print_mermaid_flowchart_code_and_url(title=title, subtitle=subtitle)
+            self._print_mermaid_flowchart_code_and_url(run_graph=run_graph, title=title, subtitle=subtitle)
         else:
-            self._print_mermaid_flowchart_url(title=title, subtitle=subtitle)
+            self._print_mermaid_flowchart_url(run_graph=run_graph, title=title, subtitle=subtitle)
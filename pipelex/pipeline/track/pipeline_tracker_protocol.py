@@ -15,9 +15,11 @@ class PipelineTrackerProtocol(Protocol):
 
     def teardown(self): ...
 
-    # def reset(self): ...
+    def finish_run(self, pipeline_run_id: str): ...
+
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         pipe_code: str,
@@ -29,6 +31,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         to_branch_index: int,
@@ -38,6 +41,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -46,6 +50,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
@@ -55,6 +60,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -66,6 +72,7 @@ class PipelineTrackerProtocol(Protocol):
         title: Optional[str] = None,
         subtitle: Optional[str] = None,
         is_detailed: bool = False,
+        pipeline_run_id: Optional[str] = None,
     ): ...
 
 
@@ -82,9 +89,14 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     def teardown(self) -> None:
         pass
 
+    @override
+    def finish_run(self, pipeline_run_id: str) -> None:
+        pass
+
     @override
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         pipe_code: str,
@@ -98,6 +110,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Optional[Stuff],
         to_stuff: Stuff,
         to_branch_index: int,
@@ -109,6 +122,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -119,6 +133,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
@@ -130,6 +145,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: List[str],
@@ -143,5 +159,6 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
         title: Optional[str] = None,
         subtitle: Optional[str] = None,
         is_detailed: bool = False,
+        pipeline_run_id: Optional[str] = None,
     ) -> None:
         pass
@@ -11,6 +11,8 @@ class TrackerConfig(ConfigModel):
     layout: Union[str, Literal["auto"]]
     wrapping_width: Union[int, Literal["auto"]]
     nb_items_limit: Union[int, Literal["unlimited"]]
+    max_nb_finished_runs: Union[int, Literal["unlimited"]]
+    max_finished_runs_bytes: Union[int, Literal["unlimited"]]
     sub_graph_colors: List[str]
     pipe_edge_style: str
     branch_edge_style: str
@@ -45,3 +47,17 @@ class TrackerConfig(ConfigModel):
             return None
         else:
             return self.nb_items_limit
+
+    @property
+    def applied_max_nb_finished_runs(self) -> Optional[int]:
+        if self.max_nb_finished_runs == "unlimited":
+            return None
+        else:
+            return self.max_nb_finished_runs
+
+    @property
+    def applied_max_finished_runs_bytes(self) -> Optional[int]:
+        if self.max_finished_runs_bytes == "unlimited":
+            return None
+        else:
+            return self.max_finished_runs_bytes
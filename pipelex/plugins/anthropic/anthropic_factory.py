@@ -41,11 +41,12 @@ class AnthropicFactory:
         llm_platform: LLMPlatform,
     ) -> Union[AsyncAnthropic, AsyncAnthropicBedrock]:
         # TODO: also support Anthropic with VertexAI
+        # the SDK does not retry: the inference retry policy is the only one, see InferenceWorkerAbstract._run_with_retry
         match llm_platform:
             case LLMPlatform.ANTHROPIC:
                 anthropic_config = get_config().plugins.anthropic_config
                 api_key = anthropic_config.get_api_key(secrets_provider=get_secrets_provider())
-                return AsyncAnthropic(api_key=api_key)
+                return AsyncAnthropic(api_key=api_key, max_retries=0)
             case LLMPlatform.BEDROCK_ANTHROPIC:
                 aws_config = get_config().pipelex.aws_config
                 aws_access_key_id, aws_secret_access_key, aws_region = aws_config.get_aws_access_keys()
@@ -53,6 +54,7 @@ class AnthropicFactory:
                     aws_secret_key=aws_secret_access_key,
                     aws_access_key=aws_access_key_id,
                     aws_region=aws_region,
+                    max_retries=0,
                 )
             case _:
                 raise AnthropicFactoryError(f"Unsupported LLM platform for Anthropic sdk: '{llm_platform}'")
@@ -1,7 +1,8 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncIterator, Optional, Type, cast
 
 import instructor
-from anthropic import NOT_GIVEN, AsyncAnthropic, AsyncAnthropicBedrock
+from anthropic import NOT_GIVEN, AsyncAnthropic, AsyncAnthropicBedrock, AsyncStream
+from anthropic.types import RawMessageStreamEvent
 from typing_extensions import override
 
 from pipelex import log
@@ -60,7 +61,6 @@ class AnthropicLLMWorker(LLMWorkerAbstract):
     # Instance methods
     #########################################################
 
-    # TODO: implement streaming behind the scenes to avoid timeout/streaming errors with Claude 4 and high tokens
     def _adapt_max_tokens(self, max_tokens: Optional[int]) -> int:
         max_tokens = max_tokens or self.default_max_tokens
         if claude_4_tokens_limit := get_config().plugins.anthropic_config.claude_4_tokens_limit:
@@ -99,6 +99,42 @@ class AnthropicLLMWorker(LLMWorkerAbstract):
 
         return full_reply_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        message = await AnthropicFactory.make_user_message(llm_job=llm_job)
+        max_tokens = self._adapt_max_tokens(max_tokens=llm_job.job_params.max_tokens)
+        event_stream = cast(
+            AsyncStream[RawMessageStreamEvent],
+            await self.anthropic_async_client.messages.create(
+                messages=[message],
+                system=llm_job.llm_prompt.system_text or NOT_GIVEN,
+                model=self.llm_engine.llm_id,
+                temperature=llm_job.job_params.temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            ),
+        )
+        nb_input_tokens = 0
+        nb_output_tokens = 0
+        async with event_stream:
+            async for event in event_stream:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
+                elif event.type == "message_start":
+                    nb_input_tokens = event.message.usage.input_tokens
+                elif event.type == "message_delta":
+                    # the output tokens are counted cumulatively in the message deltas
+                    nb_output_tokens = event.usage.output_tokens
+
+        if llm_tokens_usage := llm_job.job_report.llm_tokens_usage:
+            llm_tokens_usage.nb_tokens_by_category = AnthropicFactory.make_nb_tokens_by_category_from_nb(
+                nb_input=nb_input_tokens,
+                nb_output=nb_output_tokens,
+            )
+
     @override
     async def _gen_object(
         self,
@@ -1,20 +1,56 @@
-from typing import Any, Dict, Optional, Tuple, cast
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, cast
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from types_aiobotocore_bedrock_runtime.client import BedrockRuntimeClient
 from types_aiobotocore_bedrock_runtime.type_defs import ConverseResponseTypeDef
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
-from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol
+from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol, read_converse_stream_event
 from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
+from pipelex.tools.misc.async_utils import LoopBoundResources
 
 
 class BedrockClientAioboto3(BedrockClientProtocol):
+    """
+    Bedrock client keeping a long-lived aioboto3 bedrock-runtime client, so that its connections are reused across calls.
+
+    The underlying client is bound to the event loop it was opened in, so one is opened per event loop, on the first call,
+    and closed on that loop when the loop shuts down or at teardown.
+    """
+
     def __init__(self, aws_region: str):
         log.verbose(f"Init BedrockClientAioboto3 with region '{aws_region}'")
         self.aws_region = aws_region
         self.session = aioboto3.Session()
+        self._clients: LoopBoundResources[BedrockRuntimeClient] = LoopBoundResources(
+            open_resource=self._open_client,
+            resource_desc=f"aioboto3 bedrock-runtime client for region '{aws_region}'",
+        )
+
+    async def _open_client(self, exit_stack: AsyncExitStack) -> BedrockRuntimeClient:
+        log.verbose(f"Opening aioboto3 bedrock-runtime client for region '{self.aws_region}'")
+        client: BedrockRuntimeClient = await exit_stack.enter_async_context(
+            self.session.client(  # pyright: ignore[reportUnknownMemberType]
+                "bedrock-runtime",
+                region_name=self.aws_region,
+                # a single attempt per call: the inference retry policy is the only one
+                config=AioConfig(retries={"total_max_attempts": 1}),
+            )
+        )
+        return client
+
+    async def _get_client(self) -> BedrockRuntimeClient:
+        return await self._clients.get()
+
+    @override
+    def teardown(self) -> None:
+        nb_clients = self._clients.nb_resources
+        self._clients.teardown()
+        log.verbose(f"Closed {nb_clients} aioboto3 bedrock-runtime client(s) for region '{self.aws_region}'")
 
     @override
     async def chat(
@@ -36,13 +72,40 @@ class BedrockClientAioboto3(BedrockClientProtocol):
         if system_text:
             params["system"] = [{"text": system_text}]
 
-        async with self.session.client("bedrock-runtime", region_name=self.aws_region) as aioboto3_session:  # type: ignore
-            conversation_response: ConverseResponseTypeDef = await aioboto3_session.converse(**params)
-            resp_dict: Dict[str, Any] = cast(Dict[str, Any], conversation_response)
-            usage_dict: Dict[str, Any] = resp_dict["usage"]
-            nb_tokens_by_category: NbTokensByCategoryDict = {
-                TokenCategory.INPUT: usage_dict["inputTokens"],
-                TokenCategory.OUTPUT: usage_dict["outputTokens"],
-            }
-            response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
-            return response_text, nb_tokens_by_category
+        bedrock_runtime_client = await self._get_client()
+        conversation_response: ConverseResponseTypeDef = await bedrock_runtime_client.converse(**params)
+        resp_dict: Dict[str, Any] = cast(Dict[str, Any], conversation_response)
+        usage_dict: Dict[str, Any] = resp_dict["usage"]
+        nb_tokens_by_category: NbTokensByCategoryDict = {
+            TokenCategory.INPUT: usage_dict["inputTokens"],
+            TokenCategory.OUTPUT: usage_dict["outputTokens"],
+        }
+        response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
+        return response_text, nb_tokens_by_category
+
+    @override
+    async def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: Optional[str],
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        params: Dict[str, Any] = {
+            "modelId": model,
+            "messages": messages,
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": max_tokens,
+            },
+        }
+        if system_text:
+            params["system"] = [{"text": system_text}]
+
+        bedrock_runtime_client = await self._get_client()
+        stream_response: Dict[str, Any] = cast(Dict[str, Any], await bedrock_runtime_client.converse_stream(**params))
+        async for event in stream_response["stream"]:
+            if text_chunk := read_converse_stream_event(event=event, nb_tokens_by_category=nb_tokens_by_category):
+                yield text_chunk
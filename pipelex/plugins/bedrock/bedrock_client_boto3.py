@@ -1,19 +1,35 @@
-import asyncio
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, cast
 
 import boto3
+from botocore.config import Config
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
-from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol
+from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol, read_converse_stream_event
 from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
+from pipelex.tools.misc.async_utils import MeteredThreadPool
 
 
 class BedrockClientBoto3(BedrockClientProtocol):
-    def __init__(self, aws_region: str):
-        log.debug(f"Initializing BedrockClientBoto3 with region '{aws_region}'")
-        self.boto3_client = boto3.client(service_name="bedrock-runtime", region_name=aws_region)  # pyright: ignore
+    """Bedrock client running the blocking boto3 calls on its own thread pool, sized by [plugins.bedrock_config].boto3_max_workers."""
+
+    def __init__(self, aws_region: str, max_workers: int):
+        log.debug(f"Initializing BedrockClientBoto3 with region '{aws_region}' and {max_workers} workers")
+        # one pooled connection per worker thread, so that the workers don't wait for a connection,
+        # and a single attempt per call: the inference retry policy is the only one
+        self.boto3_client = boto3.client(  # pyright: ignore
+            service_name="bedrock-runtime",
+            region_name=aws_region,
+            config=Config(max_pool_connections=max_workers, retries={"total_max_attempts": 1}),
+        )
+        self.thread_pool = MeteredThreadPool(max_workers=max_workers, thread_name_prefix="bedrock_boto3")
+
+    @override
+    def teardown(self) -> None:
+        log.debug(self.thread_pool.stats, title="BedrockClientBoto3 thread pool stats")
+        self.thread_pool.shutdown()
+        self.boto3_client.close()  # pyright: ignore
 
     @override
     async def chat(
@@ -35,8 +51,10 @@ class BedrockClientBoto3(BedrockClientProtocol):
         if system_text:
             params["system"] = [{"text": system_text}]
 
-        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-        resp_dict: Dict[str, Any] = await loop.run_in_executor(None, lambda: self.boto3_client.converse(**params))  # pyright: ignore
+        def converse() -> Dict[str, Any]:
+            return cast(Dict[str, Any], self.boto3_client.converse(**params))  # pyright: ignore
+
+        resp_dict = await self.thread_pool.run(converse)
 
         usage_dict: Dict[str, Any] = resp_dict["usage"]
         nb_tokens_by_category: NbTokensByCategoryDict = {
@@ -45,3 +63,43 @@ class BedrockClientBoto3(BedrockClientProtocol):
         }
         response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
         return response_text, nb_tokens_by_category
+
+    @override
+    async def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: Optional[str],
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        params: Dict[str, Any] = {
+            "modelId": model,
+            "messages": messages,
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": max_tokens,
+            },
+        }
+        if system_text:
+            params["system"] = [{"text": system_text}]
+
+        def converse_stream() -> Dict[str, Any]:
+            return cast(Dict[str, Any], self.boto3_client.converse_stream(**params))  # pyright: ignore
+
+        resp_dict = await self.thread_pool.run(converse_stream)
+        # boto3's event stream is blocking, so each event is read in the thread pool
+        event_stream = resp_dict["stream"]
+        events: Iterator[Dict[str, Any]] = iter(event_stream)
+
+        def read_next_event() -> Optional[Dict[str, Any]]:
+            return next(events, None)
+
+        try:
+            while (event := await self.thread_pool.run(read_next_event)) is not None:
+                if text_chunk := read_converse_stream_event(event=event, nb_tokens_by_category=nb_tokens_by_category):
+                    yield text_chunk
+        finally:
+            # give the connection back to the pool even when the stream is stopped early or cancelled
+            await self.thread_pool.run(event_stream.close)
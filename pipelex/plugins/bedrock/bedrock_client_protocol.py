@@ -1,6 +1,6 @@
-from typing import Optional, Protocol, Tuple, runtime_checkable
+from typing import Any, AsyncIterator, Dict, Optional, Protocol, Tuple, runtime_checkable
 
-from pipelex.cogt.llm.token_category import NbTokensByCategoryDict
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
 
 
@@ -14,3 +14,30 @@ class BedrockClientProtocol(Protocol):
         temperature: float,
         max_tokens: Optional[int] = None,
     ) -> Tuple[str, NbTokensByCategoryDict]: ...
+
+    def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: Optional[str],
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the text of the response as it is generated, then fill nb_tokens_by_category with the usage reported at the end."""
+        ...
+
+    def teardown(self) -> None:
+        """Release the connections held by the client."""
+        ...
+
+
+def read_converse_stream_event(event: Dict[str, Any], nb_tokens_by_category: NbTokensByCategoryDict) -> Optional[str]:
+    """Read an event of a Bedrock converse stream: return its text delta if any, and record the usage of the metadata event."""
+    if content_block_delta := event.get("contentBlockDelta"):
+        text_chunk: Optional[str] = content_block_delta.get("delta", {}).get("text")
+        return text_chunk
+    if usage_dict := event.get("metadata", {}).get("usage"):
+        nb_tokens_by_category[TokenCategory.INPUT] = usage_dict["inputTokens"]
+        nb_tokens_by_category[TokenCategory.OUTPUT] = usage_dict["outputTokens"]
+    return None
@@ -23,6 +23,7 @@ AWS_REGION_VAR_NAME = "AWS_REGION"
 
 class BedrockConfig(ConfigModel):
     client_method: BedrockClientMethod = Field(strict=False)
+    boto3_max_workers: int = Field(ge=1)
 
     def configure(self, secrets_provider: SecretsProviderAbstract) -> str:
         """Configure and return AWS region."""
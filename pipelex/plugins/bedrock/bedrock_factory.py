@@ -29,7 +29,7 @@ class BedrockFactory:
             case BedrockClientMethod.BOTO3:
                 from pipelex.plugins.bedrock.bedrock_client_boto3 import BedrockClientBoto3
 
-                bedrock_async_client = BedrockClientBoto3(aws_region=aws_region)
+                bedrock_async_client = BedrockClientBoto3(aws_region=aws_region, max_workers=bedrock_config.boto3_max_workers)
 
         return bedrock_async_client
 
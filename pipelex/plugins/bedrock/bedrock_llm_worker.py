@@ -1,4 +1,4 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncIterator, Optional, Type
 
 from typing_extensions import override
 
@@ -8,6 +8,7 @@ from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict
 from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol
 from pipelex.plugins.bedrock.bedrock_factory import BedrockFactory
 from pipelex.reporting.reporting_protocol import ReportingProtocol
@@ -60,6 +61,25 @@ class BedrockLLMWorker(LLMWorkerAbstract):
             llm_tokens_usage.nb_tokens_by_category = nb_tokens_by_category
         return bedrock_response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        message = BedrockFactory.make_simple_message(llm_job=llm_job)
+        nb_tokens_by_category: NbTokensByCategoryDict = {}
+        async for text_chunk in self.bedrock_client_for_text.chat_stream(
+            messages=message.to_dict_list(),
+            system_text=llm_job.llm_prompt.system_text,
+            model=self.llm_engine.llm_id,
+            temperature=llm_job.job_params.temperature,
+            nb_tokens_by_category=nb_tokens_by_category,
+            max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
+        ):
+            yield text_chunk
+        if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and nb_tokens_by_category:
+            llm_tokens_usage.nb_tokens_by_category = nb_tokens_by_category
+
     @override
     async def _gen_object(
         self,
@@ -1,4 +1,5 @@
-from typing import Dict, List
+import asyncio
+from typing import Dict, List, Optional
 
 from mistralai import Mistral, OCRImageObject, OCRResponse
 from mistralai.models import (
@@ -27,7 +28,8 @@ from pipelex.cogt.ocr.ocr_output import ExtractedImageFromPage, OcrOutput, Page
 from pipelex.config import get_config
 from pipelex.hub import get_secrets_provider
 from pipelex.plugins.openai.openai_factory import OpenAIFactory
-from pipelex.tools.misc.base_64_utils import encode_to_base64, load_binary_as_base64
+from pipelex.tools.misc.base_64_utils import decode_base64, encode_to_base64, load_binary_as_base64
+from pipelex.tools.storage.payload_storage import payload_storage
 
 
 class MistralFactory:
@@ -37,8 +39,10 @@ class MistralFactory:
 
     @classmethod
     def make_mistral_client(cls) -> Mistral:
+        # the SDK does not retry: the inference retry policy is the only one, see InferenceWorkerAbstract._run_with_retry
         return Mistral(
             api_key=get_config().plugins.mistral_config.api_key(secrets_provider=get_secrets_provider()),
+            retry_config=None,
         )
 
     #########################################################
@@ -131,7 +135,8 @@ class MistralFactory:
             )
             if should_include_images:
                 for mistral_ocr_image_obj in ocr_response_page.images:
-                    extracted_image = cls.make_extracted_image_from_page_from_mistral_ocr_image_obj(mistral_ocr_image_obj)
+                    # the image may be written to the payload storage
+                    extracted_image = await asyncio.to_thread(cls.make_extracted_image_from_page_from_mistral_ocr_image_obj, mistral_ocr_image_obj)
                     page.extracted_images.append(extracted_image)
             pages[ocr_response_page.index] = page
 
@@ -144,12 +149,18 @@ class MistralFactory:
         cls,
         mistral_ocr_image_obj: OCRImageObject,
     ) -> ExtractedImageFromPage:
+        base_64 = mistral_ocr_image_obj.image_base64 if mistral_ocr_image_obj.image_base64 else None
+        blob_uri: Optional[str] = None
+        if base_64 and payload_storage.is_enabled:
+            blob_uri = payload_storage.store(data=decode_base64(b64=base_64))
+            base_64 = None
         extracted_image = ExtractedImageFromPage(
             image_id=mistral_ocr_image_obj.id,
             top_left_x=mistral_ocr_image_obj.top_left_x,
             top_left_y=mistral_ocr_image_obj.top_left_y,
             bottom_right_x=mistral_ocr_image_obj.bottom_right_x,
             bottom_right_y=mistral_ocr_image_obj.bottom_right_y,
-            base_64=mistral_ocr_image_obj.image_base64 if mistral_ocr_image_obj.image_base64 else None,
+            base_64=base_64,
+            blob_uri=blob_uri,
         )
         return extracted_image
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncIterator, Optional, Type
 
 import instructor
 from mistralai import Mistral
@@ -67,6 +67,26 @@ class MistralLLMWorker(LLMWorkerAbstract):
 
         return mistral_response_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        messages = MistralFactory.make_simple_messages(llm_job=llm_job)
+        completion_events = await self.mistral_client_for_text.chat.stream_async(
+            messages=messages,
+            model=self.llm_engine.llm_id,
+            temperature=llm_job.job_params.temperature,
+            max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
+        )
+        async with completion_events:
+            async for completion_event in completion_events:
+                completion_chunk = completion_event.data
+                if completion_chunk.choices and isinstance(text_chunk := completion_chunk.choices[0].delta.content, str) and text_chunk:
+                    yield text_chunk
+                if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := completion_chunk.usage):
+                    llm_tokens_usage.nb_tokens_by_category = MistralFactory.make_nb_tokens_by_category(usage=usage)
+
     @override
     async def _gen_object(
         self,
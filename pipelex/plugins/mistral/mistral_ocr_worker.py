@@ -1,6 +1,7 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from mistralai import Mistral
+from mistralai.types import UNSET
 from typing_extensions import override
 
 from pipelex import log
@@ -15,7 +16,7 @@ from pipelex.plugins.mistral.mistral_utils import upload_file_for_ocr
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.misc.base_64_utils import load_binary_as_base64_async
 from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64
-from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.misc.path_utils import InterpretedPathOrUrl, clarify_path_or_url, interpret_path_or_url
 
 
 class MistralOcrWorker(OcrWorkerAbstract):
@@ -50,11 +51,26 @@ class MistralOcrWorker(OcrWorkerAbstract):
                 should_include_images=ocr_job.job_params.should_include_images,
                 should_caption_images=ocr_job.job_params.should_caption_images,
                 should_include_page_views=ocr_job.job_params.should_include_page_views,
+                page_indices=ocr_job.ocr_input.page_indices,
             )
         else:
             raise OcrInputError("No image nor PDF URI provided in OcrJob")
         return ocr_output
 
+    @property
+    @override
+    def is_page_selection_supported(self) -> bool:
+        return True
+
+    @override
+    async def _prepare_pdf_uri_for_page_chunks(self, pdf_uri: str) -> str:
+        pdf_path, pdf_url = clarify_path_or_url(path_or_uri=pdf_uri)  # pyright: ignore
+        if pdf_url:
+            return pdf_url
+        assert pdf_path is not None  # Type narrowing for mypy
+        # upload the file once, all the chunks use its signed URL
+        return await self.get_signed_url_for_pdf_file(pdf_path=pdf_path)
+
     async def make_ocr_output_from_image(
         self,
         image_uri: str,
@@ -62,6 +78,11 @@ class MistralOcrWorker(OcrWorkerAbstract):
     ) -> OcrOutput:
         if should_caption_image:
             raise NotImplementedError("Captioning is not implemented for Mistral OCR.")
+        if interpret_path_or_url(path_or_uri=image_uri) == InterpretedPathOrUrl.BASE_64:
+            # Mistral OCR takes data URLs as image URLs
+            return await self.extract_from_image_url(
+                image_url=image_uri,
+            )
         image_path, image_url = clarify_path_or_url(path_or_uri=image_uri)
         if image_url:
             return await self.extract_from_image_url(
@@ -79,6 +100,7 @@ class MistralOcrWorker(OcrWorkerAbstract):
         should_include_images: bool,
         should_caption_images: bool,
         should_include_page_views: bool,
+        page_indices: Optional[List[int]] = None,
     ) -> OcrOutput:
         if should_caption_images:
             raise OcrCapabilityError("Captioning is not implemented for Mistral OCR.")
@@ -94,12 +116,14 @@ class MistralOcrWorker(OcrWorkerAbstract):
             ocr_output = await self.extract_from_pdf_url(
                 pdf_url=pdf_url,
                 should_include_images=should_include_images,
+                page_indices=page_indices,
             )
         else:  # pdf_path must be provided based on validation
             assert pdf_path is not None  # Type narrowing for mypy
             ocr_output = await self.extract_from_pdf_file(
                 pdf_path=pdf_path,
                 should_include_images=should_include_images,
+                page_indices=page_indices,
             )
         return ocr_output
 
@@ -141,6 +165,7 @@ class MistralOcrWorker(OcrWorkerAbstract):
         self,
         pdf_url: str,
         should_include_images: bool = False,
+        page_indices: Optional[List[int]] = None,
     ) -> OcrOutput:
         ocr_response = await self.mistral_client.ocr.process_async(
             model=self.ocr_engine.ocr_model_name,
@@ -148,6 +173,7 @@ class MistralOcrWorker(OcrWorkerAbstract):
                 "type": "document_url",
                 "document_url": pdf_url,
             },
+            pages=page_indices if page_indices is not None else UNSET,
             include_image_base64=should_include_images,
         )
 
@@ -161,7 +187,16 @@ class MistralOcrWorker(OcrWorkerAbstract):
         self,
         pdf_path: str,
         should_include_images: bool = False,
+        page_indices: Optional[List[int]] = None,
     ) -> OcrOutput:
+        signed_url = await self.get_signed_url_for_pdf_file(pdf_path=pdf_path)
+        return await self.extract_from_pdf_url(
+            pdf_url=signed_url,
+            should_include_images=should_include_images,
+            page_indices=page_indices,
+        )
+
+    async def get_signed_url_for_pdf_file(self, pdf_path: str) -> str:
         # Upload the file
         uploaded_file_id = await upload_file_for_ocr(
             mistral_client=self.mistral_client,
@@ -172,7 +207,4 @@ class MistralOcrWorker(OcrWorkerAbstract):
         signed_url = await self.mistral_client.files.get_signed_url_async(
             file_id=uploaded_file_id,
         )
-        return await self.extract_from_pdf_url(
-            pdf_url=signed_url.url,
-            should_include_images=should_include_images,
-        )
+        return signed_url.url
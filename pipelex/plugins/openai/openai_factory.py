@@ -27,6 +27,7 @@ from pipelex.tools.misc.base_64_utils import load_binary_as_base64
 class OpenAIFactory:
     @classmethod
     def make_openai_client(cls, llm_platform: LLMPlatform) -> openai.AsyncClient:
+        # the SDK does not retry: the inference retry policy is the only one, see InferenceWorkerAbstract._run_with_retry
         the_client: openai.AsyncOpenAI
         api_key: Optional[str] = None
         match llm_platform:
@@ -39,6 +40,7 @@ class OpenAIFactory:
                     azure_endpoint=endpoint,
                     api_key=api_key,
                     api_version=api_version,
+                    max_retries=0,
                 )
             case LLMPlatform.PERPLEXITY:
                 perplexity_config = get_config().plugins.perplexity_config
@@ -48,11 +50,12 @@ class OpenAIFactory:
                 the_client = openai.AsyncOpenAI(
                     api_key=api_key,
                     base_url=endpoint,
+                    max_retries=0,
                 )
             case LLMPlatform.OPENAI:
                 openai_config = get_config().plugins.openai_config
                 api_key = openai_config.get_api_key(secrets_provider=get_secrets_provider())
-                the_client = openai.AsyncOpenAI(api_key=api_key)
+                the_client = openai.AsyncOpenAI(api_key=api_key, max_retries=0)
             case LLMPlatform.VERTEXAI:
                 vertexai_config = get_config().plugins.vertexai_config
                 endpoint, api_key = vertexai_config.configure(secrets_provider=get_secrets_provider())
@@ -61,6 +64,7 @@ class OpenAIFactory:
                 the_client = openai.AsyncOpenAI(
                     api_key=api_key,
                     base_url=endpoint,
+                    max_retries=0,
                 )
             case LLMPlatform.XAI:
                 xai_config = get_config().plugins.xai_config
@@ -70,6 +74,7 @@ class OpenAIFactory:
                 the_client = openai.AsyncOpenAI(
                     api_key=api_key,
                     base_url=endpoint,
+                    max_retries=0,
                 )
             case LLMPlatform.CUSTOM_LLM:
                 custom_endpoint_config = get_config().plugins.custom_endpoint_config
@@ -79,6 +84,7 @@ class OpenAIFactory:
                 the_client = openai.AsyncOpenAI(
                     api_key=api_key,
                     base_url=base_url,
+                    max_retries=0,
                 )
             case LLMPlatform.ANTHROPIC | LLMPlatform.BEDROCK | LLMPlatform.BEDROCK_ANTHROPIC | LLMPlatform.MISTRAL:
                 raise LLMEngineParameterError(f"Platform '{llm_platform}' is not supported by this factory '{cls.__name__}'")
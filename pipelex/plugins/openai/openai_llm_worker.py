@@ -1,9 +1,9 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncIterator, Optional, Tuple, Type, Union, cast
 
 import instructor
 import openai
-from openai import NOT_GIVEN, APIConnectionError, BadRequestError, NotFoundError
-from openai.types.chat import ChatCompletionMessage
+from openai import NOT_GIVEN, APIConnectionError, AsyncStream, BadRequestError, NotFoundError, NotGiven
+from openai.types.chat import ChatCompletionChunk, ChatCompletionMessage, ChatCompletionStreamOptionsParam
 from typing_extensions import override
 
 from pipelex import log
@@ -11,6 +11,7 @@ from pipelex.cogt.exceptions import LLMCompletionError, LLMEngineParameterError,
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.plugins.openai.openai_factory import OpenAIFactory
@@ -43,6 +44,54 @@ class OpenAILLMWorker(LLMWorkerAbstract):
 
     #########################################################
 
+    def _make_text_sampling_params(self, llm_job: LLMJob) -> Tuple[float, Union[int, NotGiven], Union[int, NotGiven]]:
+        """Adapt the temperature and the tokens limit to the LLM family: returns the temperature, max_tokens and max_completion_tokens."""
+        match self.llm_engine.llm_model.llm_family:
+            case LLMFamily.O_SERIES:
+                # for o1 models, we must use temperature=1, and tokens limit is named max_completion_tokens
+                return 1, NOT_GIVEN, llm_job.job_params.max_tokens or NOT_GIVEN
+            case LLMFamily.GEMINI:
+                # for gemini models, we multiply the temperature by 2 because the range is 0-2
+                return llm_job.job_params.temperature * 2, llm_job.job_params.max_tokens or NOT_GIVEN, NOT_GIVEN
+            case (
+                LLMFamily.GPT_4
+                | LLMFamily.GPT_3_5
+                | LLMFamily.GPT_3
+                | LLMFamily.GPT_4_5
+                | LLMFamily.GPT_4_1
+                | LLMFamily.GPT_4O
+                | LLMFamily.CUSTOM_LLAMA_4
+                | LLMFamily.CUSTOM_GEMMA_3
+                | LLMFamily.CUSTOM_MISTRAL_SMALL_3_1
+                | LLMFamily.CUSTOM_QWEN_3
+                | LLMFamily.PERPLEXITY_SEARCH
+                | LLMFamily.PERPLEXITY_RESEARCH
+                | LLMFamily.PERPLEXITY_REASONING
+                | LLMFamily.PERPLEXITY_DEEPSEEK
+                | LLMFamily.GROK_3
+            ):
+                return llm_job.job_params.temperature, llm_job.job_params.max_tokens or NOT_GIVEN, NOT_GIVEN
+            case (
+                LLMFamily.CLAUDE_3
+                | LLMFamily.CLAUDE_3_5
+                | LLMFamily.CLAUDE_3_7
+                | LLMFamily.CLAUDE_4
+                | LLMFamily.MISTRAL_7B
+                | LLMFamily.MISTRAL_8X7B
+                | LLMFamily.MISTRAL_LARGE
+                | LLMFamily.MISTRAL_SMALL
+                | LLMFamily.MISTRAL_CODESTRAL
+                | LLMFamily.MINISTRAL
+                | LLMFamily.PIXTRAL
+                | LLMFamily.LLAMA_3
+                | LLMFamily.LLAMA_3_1
+                | LLMFamily.BEDROCK_MISTRAL_LARGE
+                | LLMFamily.BEDROCK_ANTHROPIC_CLAUDE
+                | LLMFamily.BEDROCK_META_LLAMA_3
+                | LLMFamily.BEDROCK_AMAZON_NOVA
+            ):
+                raise LLMEngineParameterError(f"LLM family {self.llm_engine.llm_model.llm_family} is not supported by OpenAILLMWorker")
+
     @override
     async def _gen_text(
         self,
@@ -52,71 +101,17 @@ class OpenAILLMWorker(LLMWorkerAbstract):
             llm_job=llm_job,
             llm_engine=self.llm_engine,
         )
+        temperature, max_tokens, max_completion_tokens = self._make_text_sampling_params(llm_job=llm_job)
 
         try:
-            match self.llm_engine.llm_model.llm_family:
-                case LLMFamily.O_SERIES:
-                    # for o1 models, we must use temperature=1, and tokens limit is named max_completion_tokens
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=1,
-                        max_completion_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case LLMFamily.GEMINI:
-                    # for gemini models, we multiply the temperature by 2 because the range is 0-2
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=llm_job.job_params.temperature * 2,
-                        max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case (
-                    LLMFamily.GPT_4
-                    | LLMFamily.GPT_3_5
-                    | LLMFamily.GPT_3
-                    | LLMFamily.GPT_4_5
-                    | LLMFamily.GPT_4_1
-                    | LLMFamily.GPT_4O
-                    | LLMFamily.CUSTOM_LLAMA_4
-                    | LLMFamily.CUSTOM_GEMMA_3
-                    | LLMFamily.CUSTOM_MISTRAL_SMALL_3_1
-                    | LLMFamily.CUSTOM_QWEN_3
-                    | LLMFamily.PERPLEXITY_SEARCH
-                    | LLMFamily.PERPLEXITY_RESEARCH
-                    | LLMFamily.PERPLEXITY_REASONING
-                    | LLMFamily.PERPLEXITY_DEEPSEEK
-                    | LLMFamily.GROK_3
-                ):
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=llm_job.job_params.temperature,
-                        max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case (
-                    LLMFamily.CLAUDE_3
-                    | LLMFamily.CLAUDE_3_5
-                    | LLMFamily.CLAUDE_3_7
-                    | LLMFamily.CLAUDE_4
-                    | LLMFamily.MISTRAL_7B
-                    | LLMFamily.MISTRAL_8X7B
-                    | LLMFamily.MISTRAL_LARGE
-                    | LLMFamily.MISTRAL_SMALL
-                    | LLMFamily.MISTRAL_CODESTRAL
-                    | LLMFamily.MINISTRAL
-                    | LLMFamily.PIXTRAL
-                    | LLMFamily.LLAMA_3
-                    | LLMFamily.LLAMA_3_1
-                    | LLMFamily.BEDROCK_MISTRAL_LARGE
-                    | LLMFamily.BEDROCK_ANTHROPIC_CLAUDE
-                    | LLMFamily.BEDROCK_META_LLAMA_3
-                    | LLMFamily.BEDROCK_AMAZON_NOVA
-                ):
-                    raise LLMEngineParameterError(f"LLM family {self.llm_engine.llm_model.llm_family} is not supported by OpenAILLMWorker")
+            response = await self.openai_client_for_text.chat.completions.create(
+                model=self.llm_engine.llm_id,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                max_completion_tokens=max_completion_tokens,
+                seed=llm_job.job_params.seed,
+                messages=messages,
+            )
         except NotFoundError as not_found_error:
             # TODO: record llm config so it can be displayed here
             raise LLMModelNotFoundError(
@@ -139,6 +134,53 @@ class OpenAILLMWorker(LLMWorkerAbstract):
             llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
         return response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        messages = OpenAIFactory.make_simple_messages(
+            llm_job=llm_job,
+            llm_engine=self.llm_engine,
+        )
+        temperature, max_tokens, max_completion_tokens = self._make_text_sampling_params(llm_job=llm_job)
+        # Azure OpenAI deployments don't all accept stream_options, without it the usage is not reported
+        stream_options: Union[ChatCompletionStreamOptionsParam, NotGiven] = (
+            NOT_GIVEN if self.llm_engine.llm_platform == LLMPlatform.AZURE_OPENAI else {"include_usage": True}
+        )
+
+        try:
+            response_stream = cast(
+                AsyncStream[ChatCompletionChunk],
+                await self.openai_client_for_text.chat.completions.create(
+                    model=self.llm_engine.llm_id,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    max_completion_tokens=max_completion_tokens,
+                    seed=llm_job.job_params.seed,
+                    messages=messages,
+                    stream=True,
+                    stream_options=stream_options,
+                ),
+            )
+        except NotFoundError as not_found_error:
+            raise LLMModelNotFoundError(
+                f"OpenAI model or deployment not found:\n{self.llm_engine.desc}\nmodel: {self.llm_engine.llm_model.desc}\n{not_found_error}"
+            ) from not_found_error
+        except APIConnectionError as api_connection_error:
+            raise LLMCompletionError(f"OpenAI API connection error: {api_connection_error}") from api_connection_error
+        except BadRequestError as bad_request_error:
+            raise LLMCompletionError(
+                f"OpenAI bad request error with model: {self.llm_engine.llm_model.desc}:\n{bad_request_error}"
+            ) from bad_request_error
+
+        async with response_stream:
+            async for chunk in response_stream:
+                if chunk.choices and (text_chunk := chunk.choices[0].delta.content):
+                    yield text_chunk
+                if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := chunk.usage):
+                    llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
+
     @override
     async def _gen_object(
         self,
@@ -1,35 +1,23 @@
 from typing import Dict, List, Optional
 
-from pydantic import Field, RootModel
 from typing_extensions import override
 
 from pipelex import log
-from pipelex.cogt.exceptions import ReportingManagerError
-from pipelex.cogt.inference.cost_registry import CostRegistry
+from pipelex.cogt.exceptions import CostRegistryError, ReportingManagerError
+from pipelex.cogt.inference.cost_registry import CostRegistry, CostTotals
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.inference.inference_retry import InferenceAttempt
 from pipelex.cogt.llm.llm_job import LLMJob
-from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokensUsage
 from pipelex.config import ReportingConfig
 from pipelex.pipeline.pipeline_models import SpecialPipelineId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.misc.file_utils import ensure_path, get_incremental_file_path
 
-LLMUsageRegistryRoot = List[LLMTokensUsage]
-
-
-class UsageRegistry(RootModel[LLMUsageRegistryRoot]):
-    root: LLMUsageRegistryRoot = Field(default_factory=list)
-
-    def get_current_tokens_usage(self) -> LLMUsageRegistryRoot:
-        return self.root
-
-    def add_tokens_usage(self, llm_tokens_usage: LLMTokensUsage):
-        self.root.append(llm_tokens_usage)
-
 
 class ReportingManager(ReportingProtocol):
     def __init__(self, reporting_config: ReportingConfig):
-        self._usage_registries: Dict[str, UsageRegistry] = {}
+        self._usage_registries: Dict[str, CostRegistry] = {}
+        self._inference_attempts: Dict[str, List[InferenceAttempt]] = {}
         self._reporting_config = reporting_config
 
     ############################################################
@@ -39,17 +27,35 @@ class ReportingManager(ReportingProtocol):
     @override
     def setup(self):
         self._usage_registries.clear()
-        self._usage_registries[SpecialPipelineId.UNTITLED] = UsageRegistry()
+        self._inference_attempts.clear()
+        self._usage_registries[SpecialPipelineId.UNTITLED] = CostRegistry()
 
     @override
     def teardown(self):
         self._usage_registries.clear()
+        self._inference_attempts.clear()
+
+    @property
+    def nb_open_registries(self) -> int:
+        return len(self._usage_registries)
+
+    def get_inference_attempts(self, pipeline_run_id: str) -> List[InferenceAttempt]:
+        """List the failed attempts of the inference jobs of a pipeline run that were retried."""
+        return self._inference_attempts.get(pipeline_run_id, [])
+
+    def get_cost_totals(self, pipeline_run_id: str) -> CostTotals:
+        """Get the running totals of the tokens and costs of the LLM jobs of a pipeline run, overall."""
+        return self._get_registry(pipeline_run_id).totals
+
+    def get_cost_totals_by_llm_name(self, pipeline_run_id: str) -> Dict[str, CostTotals]:
+        """Get the running totals of the tokens and costs of the LLM jobs of a pipeline run, by LLM model."""
+        return self._get_registry(pipeline_run_id).totals_by_llm_name
 
     ############################################################
     # Private methods
     ############################################################
 
-    def _get_registry(self, pipeline_run_id: str) -> UsageRegistry:
+    def _get_registry(self, pipeline_run_id: str) -> CostRegistry:
         if pipeline_run_id not in self._usage_registries:
             raise ReportingManagerError(f"Registry for pipeline '{pipeline_run_id}' does not exist")
         return self._usage_registries[pipeline_run_id]
@@ -61,13 +67,13 @@ class ReportingManager(ReportingProtocol):
             log.warning("LLM job has no llm_tokens_usage")
             return
 
-        llm_token_cost_report: Optional[LLMTokenCostReport] = None
-
-        if self._reporting_config.is_log_costs_to_console:
-            llm_token_cost_report = CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
-
         pipeline_run_id = llm_job.job_metadata.pipeline_run_id
-        self._get_registry(pipeline_run_id).add_tokens_usage(llm_tokens_usage)
+        try:
+            llm_token_cost_report = self._get_registry(pipeline_run_id).add_tokens_usage(llm_tokens_usage)
+        except CostRegistryError as exc:
+            # the inference has succeeded, a problem with its cost report must not fail it
+            log.error(f"Could not add the cost report of LLM job '{llm_job.job_metadata.unit_job_id}': {exc}")
+            return
 
         if self._reporting_config.is_log_costs_to_console:
             log.verbose(llm_token_cost_report, title="Token Cost report")
@@ -80,7 +86,7 @@ class ReportingManager(ReportingProtocol):
     def open_registry(self, pipeline_run_id: str):
         if pipeline_run_id in self._usage_registries:
             raise ReportingManagerError(f"Registry for pipeline '{pipeline_run_id}' already exists")
-        self._usage_registries[pipeline_run_id] = UsageRegistry()
+        self._usage_registries[pipeline_run_id] = CostRegistry()
 
     @override
     def report_inference_job(self, inference_job: InferenceJobAbstract):
@@ -92,6 +98,15 @@ class ReportingManager(ReportingProtocol):
         llm_job: LLMJob = inference_job
         self._report_llm_job(llm_job=llm_job)
 
+    @override
+    def report_inference_attempt(self, inference_job: InferenceJobAbstract, inference_attempt: InferenceAttempt):
+        log.warning(
+            f"Inference job '{inference_job.job_metadata.unit_job_id}' attempt {inference_attempt.attempt_number} failed "
+            f"({inference_attempt.error_kind}), retrying in {inference_attempt.delay_seconds:.2f}s"
+        )
+        pipeline_run_id = inference_job.job_metadata.pipeline_run_id
+        self._inference_attempts.setdefault(pipeline_run_id, []).append(inference_attempt)
+
     @override
     def generate_report(self, pipeline_run_id: Optional[str] = None):
         cost_report_file_path: Optional[str] = None
@@ -103,20 +118,22 @@ class ReportingManager(ReportingProtocol):
                 extension=self._reporting_config.cost_report_extension,
             )
 
-        registries_to_process: Dict[str, UsageRegistry] = {}
+        registries_to_process: Dict[str, CostRegistry] = {}
         if pipeline_run_id:
             registries_to_process = {pipeline_run_id: self._get_registry(pipeline_run_id)}
         else:
             registries_to_process = self._usage_registries
 
         for run_id, registry in registries_to_process.items():
-            CostRegistry.generate_report(
+            if inference_attempts := self.get_inference_attempts(pipeline_run_id=run_id):
+                log.info(f"Pipeline run '{run_id}': {len(inference_attempts)} failed inference attempts were retried")
+            registry.generate_report(
                 pipeline_run_id=run_id,
-                llm_tokens_usages=registry.get_current_tokens_usage(),
                 unit_scale=self._reporting_config.cost_report_unit_scale,
                 cost_report_file_path=cost_report_file_path,
             )
 
     @override
     def close_registry(self, pipeline_run_id: str):
-        self._usage_registries.pop(pipeline_run_id)
+        self._usage_registries.pop(pipeline_run_id, None)
+        self._inference_attempts.pop(pipeline_run_id, None)
@@ -3,6 +3,7 @@ from typing import Optional, Protocol
 from typing_extensions import override
 
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.inference.inference_retry import InferenceAttempt
 
 
 class ReportingProtocol(Protocol):
@@ -10,6 +11,8 @@ class ReportingProtocol(Protocol):
 
     def report_inference_job(self, inference_job: InferenceJobAbstract): ...
 
+    def report_inference_attempt(self, inference_job: InferenceJobAbstract, inference_attempt: InferenceAttempt): ...
+
     def generate_report(self, pipeline_run_id: Optional[str] = None): ...
 
     def close_registry(self, pipeline_run_id: str): ...
@@ -28,6 +31,10 @@ class ReportingNoOp(ReportingProtocol):
     def report_inference_job(self, inference_job: InferenceJobAbstract):
         pass
 
+    @override
+    def report_inference_attempt(self, inference_job: InferenceJobAbstract, inference_attempt: InferenceAttempt):
+        pass
+
     @override
     def generate_report(self, pipeline_run_id: Optional[str] = None):
         pass
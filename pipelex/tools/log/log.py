@@ -10,6 +10,9 @@ from pipelex.tools.log.log_levels import LOGGING_LEVEL_DEV, LOGGING_LEVEL_OFF, L
 class Log:
     """
     A class for managing logging configurations and operations.
+
+    The content of a log call can be a function returning the content (e.g. a lambda around an f-string),
+    called only if the message is emitted at the current log level.
     """
 
     ########################################################
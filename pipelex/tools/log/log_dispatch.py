@@ -1,12 +1,21 @@
+import functools
 import inspect
 import logging
 import os
 import traceback
-from typing import Any, List, Optional, Union
+from types import FrameType
+from typing import Any, Callable, List, Optional, TypeGuard, Union
 
 from pipelex.tools.log.log_config import CallerInfoTemplate, LogConfig, LogMode
 from pipelex.tools.misc.json_utils import purify_json, purify_json_dict, purify_json_list
 
+LazyLogContent = Callable[[], Any]
+
+
+def is_lazy_log_content(content: Any) -> TypeGuard[LazyLogContent]:
+    """Functions, methods and partials passed as log content are called to get the content, only if it is logged."""
+    return inspect.isfunction(content) or inspect.ismethod(content) or isinstance(content, functools.partial)
+
 
 class LogDispatch:
     """
@@ -74,7 +83,7 @@ class LogDispatch:
 
     def dispatch(
         self,
-        content: Union[str, Any],
+        content: Union[str, Any, LazyLogContent],
         severity: int,
         title: Optional[str] = None,
         inline: Optional[str] = None,
@@ -83,14 +92,25 @@ class LogDispatch:
         """
         Dispatches a log message to appropriate logging methods based on content type.
 
+        Nothing is formatted if the message would not be emitted at this severity.
+
         Args:
-            content (Union[str, Any]): The content to be logged.
+            content (Union[str, Any, LazyLogContent]): The content to be logged, or a function returning it.
             severity (int): The severity level of the log message.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
             include_exception (bool, optional): Whether to include exception traceback. Defaults to False.
         """
+        if not self._log_config.is_console_logging_enabled:
+            return
+        # check the level before formatting anything or inspecting the caller
+        logger = self._get_origin_logger()
+        if not self._is_enabled_for(logger=logger, severity=severity):
+            return
+        if is_lazy_log_content(content):
+            content = content()
+
         caller_info_str: Optional[str] = None
         if (
             (self._log_config.is_caller_info_enabled)
@@ -115,6 +135,7 @@ class LogDispatch:
 
         if isinstance(content, str):
             self._log_message(
+                logger=logger,
                 message=content,
                 severity=severity,
                 caller_info_str=caller_info_str,
@@ -124,6 +145,7 @@ class LogDispatch:
             )
         else:
             self._log_data(
+                logger=logger,
                 data=content,
                 severity=severity,
                 caller_info_str=caller_info_str,
@@ -133,6 +155,7 @@ class LogDispatch:
 
     def _log_message(
         self,
+        logger: logging.Logger,
         message: str,
         severity: int,
         caller_info_str: Optional[str],
@@ -144,6 +167,7 @@ class LogDispatch:
         Logs a message to both console and Google Cloud.
 
         Args:
+            logger (logging.Logger): The logger of the module that made the log call.
             message (str): The message to be logged.
             severity (int): The severity level of the log message.
             caller_info_str (Optional[str]): Information about the caller.
@@ -163,10 +187,11 @@ class LogDispatch:
 
         if include_exception:
             message += f"\n{traceback.format_exc()}"
-        self._log_to_console(message=message_for_console, severity=severity)
+        self._log_to_console(logger=logger, message=message_for_console, severity=severity)
 
     def _log_data(
         self,
+        logger: logging.Logger,
         data: Any,
         severity: int,
         caller_info_str: Optional[str],
@@ -177,6 +202,7 @@ class LogDispatch:
         Logs potentially structured data (maybe it's a dict or a list) to both console and Google Cloud.
 
         Args:
+            logger (logging.Logger): The logger of the module that made the log call.
             data (Any): The data to be logged.
             severity (int): The severity level of the log message.
             caller_info_str (Optional[str]): Information about the caller.
@@ -191,7 +217,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(logger=logger, message=message, severity=severity)
         elif isinstance(data, dict):
             dict_string: str
             _, dict_string = purify_json_dict(
@@ -206,7 +232,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(logger=logger, message=message, severity=severity)
         elif isinstance(data, list):
             list_data: List[Any] = data
             _, list_string = purify_json_list(
@@ -221,7 +247,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(logger=logger, message=message, severity=severity)
         else:
             _, dict_string = purify_json(
                 data=data,
@@ -236,58 +262,60 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(logger=logger, message=message, severity=severity)
+
+    def _get_origin_logger(self) -> logging.Logger:
+        """
+        Get the logger named after the top-level package of the module that made the log call, or after the project for __main__.
 
-    def _log_to_console(self, message: str, severity: int):
+        The frames are walked through their globals rather than with inspect.stack(), which reads the source of every frame.
+        """
+        logging_module_path = os.path.abspath(__file__)
+        log_origin_name = "unknown"
+        frame: Optional[FrameType] = inspect.currentframe()
+        try:
+            while frame is not None:
+                module_file = frame.f_globals.get("__file__")
+                module_name = frame.f_globals.get("__name__")
+                if not isinstance(module_file, str) or not isinstance(module_name, str):
+                    frame = frame.f_back
+                    continue
+                module_file = os.path.abspath(module_file)
+                if module_file == logging_module_path or module_file.endswith("/log.py"):
+                    frame = frame.f_back
+                    continue
+                if module_name == "__main__":
+                    if self.project_name is None:
+                        raise RuntimeError("Project name is not set. You must call initialize Pipelex first.")
+                    log_origin_name = self.project_name
+                else:
+                    log_origin_name = module_name.split(sep=".", maxsplit=1)[0]
+                break
+        finally:
+            del frame
+        return logging.getLogger(log_origin_name)
+
+    def _is_enabled_for(self, logger: logging.Logger, severity: int) -> bool:
+        if logger.isEnabledFor(severity):
+            return True
+        if self.log_mode == LogMode.POOR:
+            return logging.getLogger(self._log_config.generic_poor_logger).isEnabledFor(severity)
+        return False
+
+    def _log_to_console(self, logger: logging.Logger, message: str, severity: int):
         """
         Logs a message to the console.
 
         Args:
+            logger (logging.Logger): The logger of the module that made the log call.
             message (str): The message to be logged.
             severity (int): The severity level of the log message.
         """
-        if not self._log_config.is_console_logging_enabled:
-            return
-
         match self.log_mode:
             case LogMode.RICH:
                 pass
             case LogMode.POOR:
-                logger = logging.getLogger(self._log_config.generic_poor_logger)
-                logger.log(level=severity, msg=message, stacklevel=6)
+                poor_logger = logging.getLogger(self._log_config.generic_poor_logger)
+                poor_logger.log(level=severity, msg=message, stacklevel=6)
 
-        stack = inspect.stack()
-        try:
-            logging_module_path = os.path.abspath(__file__)
-            log_origin_name = "unknown"
-
-            for frame_info in stack[1:]:
-                try:
-                    frame = frame_info.frame
-                    module = inspect.getmodule(frame)
-
-                    if module is None:
-                        continue
-
-                    if hasattr(module, "__file__") and module.__file__ is not None:
-                        module_file = os.path.abspath(module.__file__)
-                    else:
-                        continue
-
-                    if module_file == logging_module_path or module_file.endswith("/log.py"):
-                        continue
-                    else:
-                        if module.__name__ == "__main__":
-                            if self.project_name is None:
-                                raise RuntimeError("Project name is not set. You must call initialize Pipelex first.")
-                            log_origin_name = self.project_name
-                        else:
-                            log_origin_name = module.__name__.split(sep=".", maxsplit=1)[0]
-                        break
-                finally:
-                    del frame_info
-            logger = logging.getLogger(log_origin_name)
-            logger.log(level=severity, msg=message, stacklevel=5)
-        finally:
-            if stack:
-                del stack
+        logger.log(level=severity, msg=message, stacklevel=5)
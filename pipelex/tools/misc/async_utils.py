@@ -0,0 +1,292 @@
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AsyncExitStack
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar, cast
+
+from pydantic import BaseModel
+
+from pipelex import log
+
+TaskResultType = TypeVar("TaskResultType")
+ResourceType = TypeVar("ResourceType")
+
+TaskFactory = Callable[[], Awaitable[TaskResultType]]
+
+
+class BoundedPoolStats(BaseModel):
+    nb_tasks: int = 0
+    nb_workers: int = 0
+    max_queue_depth: int = 0
+    max_in_flight: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def mean_wait_time(self) -> float:
+        if not self.nb_tasks:
+            return 0.0
+        return self.total_wait_time / self.nb_tasks
+
+
+class BoundedTaskPool(Generic[TaskResultType]):
+    """
+    Runs task factories through a fixed number of workers and returns results in submission order.
+
+    Each task is given as a factory (a callable returning an awaitable) so that nothing is instantiated
+    before a worker picks it up: the per-task setup cost (e.g. copying a working memory) is only paid
+    for the tasks actually in flight.
+    If max_concurrency is None, all tasks are started at once, like asyncio.gather.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be a positive integer or None, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.stats = BoundedPoolStats()
+        self._nb_in_flight = 0
+
+    async def run(self, task_factories: Sequence[TaskFactory[TaskResultType]]) -> List[TaskResultType]:
+        nb_tasks = len(task_factories)
+        nb_workers = min(self.max_concurrency or nb_tasks, nb_tasks)
+        self.stats = BoundedPoolStats(nb_tasks=nb_tasks, nb_workers=nb_workers)
+        if not nb_tasks:
+            return []
+
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for task_index in range(nb_tasks):
+            queue.put_nowait(task_index)
+        results: List[Optional[TaskResultType]] = [None] * nb_tasks
+        enqueued_at = time.monotonic()
+
+        async def worker() -> None:
+            while True:
+                queue_depth = queue.qsize()
+                try:
+                    task_index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                self._record_dequeue(queue_depth=queue_depth, wait_time=time.monotonic() - enqueued_at)
+                try:
+                    results[task_index] = await task_factories[task_index]()
+                finally:
+                    self._nb_in_flight -= 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(nb_workers)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return cast(List[TaskResultType], results)
+
+    def _record_dequeue(self, queue_depth: int, wait_time: float) -> None:
+        self._nb_in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self._nb_in_flight)
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, queue_depth)
+        self.stats.total_wait_time += wait_time
+        self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+
+
+class MeteredThreadPool:
+    """
+    Dedicated thread pool for blocking calls made from async code, with queue metrics.
+
+    Using it instead of the event loop's default executor keeps a burst of blocking calls (e.g. SDK requests)
+    from queuing behind, or starving, the unrelated work sent to the default executor by asyncio.to_thread.
+    The stats count the calls, the number of calls waiting for a thread and the time they waited.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        self.max_workers = max_workers
+        self.stats = BoundedPoolStats(nb_workers=max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+        self._nb_queued = 0
+        self._nb_in_flight = 0
+
+    @property
+    def nb_queued(self) -> int:
+        return self._nb_queued
+
+    @property
+    def nb_in_flight(self) -> int:
+        return self._nb_in_flight
+
+    async def run(self, func: Callable[..., TaskResultType], *args: Any) -> TaskResultType:
+        submitted_at = time.monotonic()
+        with self._lock:
+            self._nb_queued += 1
+            self.stats.nb_tasks += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._nb_queued)
+
+        is_dequeued = False
+
+        def dequeue() -> bool:
+            # called with the lock held, by the thread starting the call or by the caller if it is cancelled first
+            nonlocal is_dequeued
+            if is_dequeued:
+                return False
+            is_dequeued = True
+            self._nb_queued -= 1
+            return True
+
+        def run_metered() -> TaskResultType:
+            wait_time = time.monotonic() - submitted_at
+            with self._lock:
+                dequeue()
+                self._nb_in_flight += 1
+                self.stats.max_in_flight = max(self.stats.max_in_flight, self._nb_in_flight)
+                self.stats.total_wait_time += wait_time
+                self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._nb_in_flight -= 1
+
+        # like asyncio.to_thread, the call sees the context variables of the caller (e.g. the current pipe span)
+        call_context = contextvars.copy_context()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call_context.run, run_metered)
+        except asyncio.CancelledError:
+            with self._lock:
+                dequeue()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the threads once their current call is done, the calls still waiting for a thread are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SpawnedProcessPool:
+    """
+    Pool of worker processes for CPU-heavy calls made from async code, started on the first call.
+
+    The workers are spawned rather than forked, which is safe with native libraries and threads, but each of them imports
+    the __main__ module of the program: a script using the pool must guard its entry point with `if __name__ == "__main__":`,
+    otherwise the workers fail to start and the pool breaks.
+    When a worker dies (e.g. killed for using too much memory), the pool can't be used anymore: its calls raise
+    BrokenProcessPool, it is shut down and the next call starts a new pool.
+    """
+
+    def __init__(self, pool_desc: str):
+        self.pool_desc = pool_desc
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        if self._executor is None:
+            log.verbose(f"Starting {self.pool_desc} with {max_workers} workers")
+            self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def submit(self, max_workers: int, func: Callable[..., TaskResultType], *args: Any) -> asyncio.Future[TaskResultType]:
+        """Start the call in a worker process, the pool being started with max_workers processes if needed."""
+        executor = self._get_executor(max_workers=max_workers)
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            self._discard_broken_executor(executor=executor)
+            raise
+        future.add_done_callback(functools.partial(self._check_executor, executor))
+        return future
+
+    async def run(self, max_workers: int, func: Callable[..., TaskResultType], *args: Any) -> TaskResultType:
+        return await self.submit(max_workers, func, *args)
+
+    def _check_executor(self, executor: ProcessPoolExecutor, future: asyncio.Future[Any]) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._discard_broken_executor(executor=executor)
+
+    def _discard_broken_executor(self, executor: ProcessPoolExecutor) -> None:
+        # all the pending calls of a broken pool fail, only the first one replaces it
+        if self._executor is executor:
+            log.warning(f"The {self.pool_desc} is broken, a new one will be started")
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes once their current call is done, the calls still waiting for a process are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class LoopBoundResources(Generic[ResourceType]):
+    """
+    One resource per event loop, for the resources bound to the loop they were opened in (e.g. async HTTP clients).
+
+    A resource is opened on its first use in a loop, by open_resource entering it in an AsyncExitStack, and it is closed
+    on that same loop: when the loop shuts down its async generators, as asyncio.run does before closing it,
+    or at teardown if that comes first.
+    """
+
+    def __init__(self, open_resource: Callable[[AsyncExitStack], Awaitable[ResourceType]], resource_desc: str):
+        self.open_resource = open_resource
+        self.resource_desc = resource_desc
+        self._resources: Dict[asyncio.AbstractEventLoop, Tuple[ResourceType, AsyncGenerator[None, None]]] = {}
+        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._closing_tasks: Set[asyncio.Task[None]] = set()
+
+    @property
+    def nb_resources(self) -> int:
+        return len(self._resources)
+
+    async def get(self) -> ResourceType:
+        loop = asyncio.get_running_loop()
+        if resource_entry := self._resources.get(loop):
+            return resource_entry[0]
+        # the resources of closed loops were closed with their loop, or can't be used anymore
+        for closed_loop in [resource_loop for resource_loop in self._resources if resource_loop.is_closed()]:
+            del self._resources[closed_loop]
+            self._locks.pop(closed_loop, None)
+        async with self._locks.setdefault(loop, asyncio.Lock()):
+            if resource_entry := self._resources.get(loop):
+                return resource_entry[0]
+            exit_stack = AsyncExitStack()
+            resource = await self.open_resource(exit_stack)
+            resource_closer = self._close_at_loop_shutdown(exit_stack=exit_stack)
+            # starting the generator in the loop registers it for the loop's shutdown_asyncgens()
+            await resource_closer.__anext__()
+            self._resources[loop] = (resource, resource_closer)
+            return resource
+
+    async def _close_at_loop_shutdown(self, exit_stack: AsyncExitStack) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            try:
+                await exit_stack.aclose()
+            except Exception as exc:
+                log.warning(f"Failed to close {self.resource_desc}: {exc}")
+
+    def teardown(self) -> None:
+        """Close the resources of the loops that are still open: right away if they are idle, in a task for the running loop."""
+        resources = self._resources
+        self._resources = {}
+        self._locks = {}
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for loop, (_, resource_closer) in resources.items():
+            if loop.is_closed():
+                # already closed with the loop, unless it was closed without shutting down its async generators
+                continue
+            if not loop.is_running():
+                loop.run_until_complete(resource_closer.aclose())
+            elif loop is running_loop:
+                closing_task = loop.create_task(resource_closer.aclose())
+                self._closing_tasks.add(closing_task)
+                closing_task.add_done_callback(self._closing_tasks.discard)
+            else:
+                asyncio.run_coroutine_threadsafe(resource_closer.aclose(), loop)
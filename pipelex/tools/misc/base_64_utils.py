@@ -28,10 +28,7 @@ async def encode_to_base64_async(data_bytes: bytes) -> bytes:
     return b64
 
 
-def save_base64_to_binary_file(
-    b64: str,
-    file_path: str,
-):
+def decode_base64(b64: str) -> bytes:
     # Ensure we're getting clean base64 data without any prefixes
     base64_str = b64
     # Remove potential data URL prefix if present
@@ -40,7 +37,13 @@ def save_base64_to_binary_file(
     if "data:" in base64_str and ";base64," in base64_str:
         base64_str = base64_str.split(";base64,", 1)[1]
 
-    # Decode base64
-    byte_data = base64.b64decode(base64_str)
+    return base64.b64decode(base64_str)
+
+
+def save_base64_to_binary_file(
+    b64: str,
+    file_path: str,
+):
+    byte_data = decode_base64(b64=b64)
 
     save_bytes_to_binary_file(file_path=file_path, byte_data=byte_data)
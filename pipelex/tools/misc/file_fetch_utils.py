@@ -1,36 +1,111 @@
+import importlib.util
+import threading
+from contextlib import AsyncExitStack
 from typing import Optional
 
 import httpx
 from httpx import Response
 
+from pipelex import log
+from pipelex.tools.misc.async_utils import LoopBoundResources
+from pipelex.tools.misc.http_client_config import HttpClientConfig
+
+
+def is_http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the h2 package is installed, e.g. with `pip install "httpx[http2]"`
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    """
+    Process-wide httpx clients, so that the connections to the hosts we fetch files from are kept alive and reused across fetches.
+
+    An httpx.AsyncClient is bound to the event loop it was first used in, so one is opened per event loop, on the first fetch,
+    and closed on that loop when the loop shuts down or at teardown.
+    Until it is set up with the [pipelex.http_client_config], the clients use the default limits of httpx.
+    """
+
+    def __init__(self, http_client_config: Optional[HttpClientConfig] = None):
+        self.http_client_config = http_client_config
+        self._async_clients: LoopBoundResources[httpx.AsyncClient] = LoopBoundResources(
+            open_resource=self._open_async_client,
+            resource_desc="pooled httpx async client",
+        )
+        self._sync_client: Optional[httpx.Client] = None
+        self._sync_client_lock = threading.Lock()
+
+    def setup(self, http_client_config: HttpClientConfig) -> None:
+        self.http_client_config = http_client_config
+
+    def teardown(self) -> None:
+        nb_async_clients = self._async_clients.nb_resources
+        self._async_clients.teardown()
+        with self._sync_client_lock:
+            if self._sync_client is not None:
+                self._sync_client.close()
+                self._sync_client = None
+        self.http_client_config = None
+        log.verbose(f"Closed {nb_async_clients} pooled httpx async client(s)")
+
+    def _make_limits(self) -> httpx.Limits:
+        if self.http_client_config is None:
+            return httpx.Limits()
+        return httpx.Limits(
+            max_connections=self.http_client_config.max_connections,
+            max_keepalive_connections=self.http_client_config.max_keepalive_connections,
+            keepalive_expiry=self.http_client_config.keepalive_expiry_seconds,
+        )
+
+    def _is_http2(self) -> bool:
+        if self.http_client_config is None or not self.http_client_config.is_http2_enabled:
+            return False
+        if not is_http2_available():
+            log.verbose("HTTP/2 is enabled in http_client_config but the h2 package is not installed, falling back to HTTP/1.1")
+            return False
+        return True
+
+    async def _open_async_client(self, exit_stack: AsyncExitStack) -> httpx.AsyncClient:
+        async_client = httpx.AsyncClient(limits=self._make_limits(), http2=self._is_http2(), follow_redirects=True)
+        return await exit_stack.enter_async_context(async_client)
+
+    async def get_async_client(self) -> httpx.AsyncClient:
+        return await self._async_clients.get()
+
+    def get_sync_client(self) -> httpx.Client:
+        with self._sync_client_lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(limits=self._make_limits(), http2=self._is_http2(), follow_redirects=True)
+            return self._sync_client
+
+
+http_client_pool = HttpClientPool()
+
 
 async def fetch_file_from_url_httpx_async(
     url: str,
     timeout: Optional[int] = None,
 ) -> bytes:
-    async with httpx.AsyncClient() as client:
-        response: Response = await client.get(
-            url,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        response.raise_for_status()  # Raise exception for 4XX/5XX status codes
+    client = await http_client_pool.get_async_client()
+    response: Response = await client.get(
+        url,
+        timeout=timeout,
+    )
+    response.raise_for_status()  # Raise exception for 4XX/5XX status codes
 
-        bytes_content: bytes = response.content
-        return bytes_content
+    bytes_content: bytes = response.content
+    return bytes_content
 
 
 def fetch_file_from_url_httpx(
     url: str,
     timeout: Optional[int] = None,
 ) -> bytes:
-    with httpx.Client() as client:
-        response: Response = client.get(
-            url,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        response.raise_for_status()  # Raise exception for 4XX/5XX status codes
+    client = http_client_pool.get_sync_client()
+    response: Response = client.get(
+        url,
+        timeout=timeout,
+    )
+    response.raise_for_status()  # Raise exception for 4XX/5XX status codes
 
-        bytes_content: bytes = response.content
-        return bytes_content
+    bytes_content: bytes = response.content
+    return bytes_content
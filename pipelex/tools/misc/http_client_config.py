@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from pipelex.tools.config.models import ConfigModel
+
+
+class HttpClientConfig(ConfigModel):
+    max_connections: int = Field(..., ge=1)
+    max_keepalive_connections: int = Field(..., ge=0)
+    keepalive_expiry_seconds: float = Field(..., ge=0)
+    is_http2_enabled: bool
@@ -2,6 +2,7 @@ import os
 import urllib.parse
 from typing import Optional, Tuple
 
+from pipelex.tools.storage.local_blob_store import is_blob_uri
 from pipelex.types import StrEnum
 
 
@@ -11,6 +12,7 @@ class InterpretedPathOrUrl(StrEnum):
     URL = "uri"
     FILE_NAME = "file_name"
     BASE_64 = "base_64"
+    BLOB = "blob"
 
     @property
     def desc(self) -> str:
@@ -25,6 +27,8 @@ class InterpretedPathOrUrl(StrEnum):
                 return "File Name"
             case InterpretedPathOrUrl.BASE_64:
                 return "Base 64"
+            case InterpretedPathOrUrl.BLOB:
+                return "Blob"
 
 
 def interpret_path_or_url(path_or_uri: str) -> InterpretedPathOrUrl:
@@ -46,7 +50,8 @@ def interpret_path_or_url(path_or_uri: str) -> InterpretedPathOrUrl:
             - FILE_PATH for everything else
             - URL for http(s) URLs
             - FILE_NAME for file names
-            - BASE_64 for base64-encoded images
+            - BASE_64 for base64-encoded images, as data URLs
+            - BLOB for references to payloads in the blob store (pipelex-blob://)
 
     Example:
         >>> interpret_path_or_url("file:///home/user/file.txt")
@@ -58,6 +63,10 @@ def interpret_path_or_url(path_or_uri: str) -> InterpretedPathOrUrl:
     """
     if path_or_uri.startswith("file://"):
         return InterpretedPathOrUrl.FILE_URI
+    elif is_blob_uri(path_or_uri):
+        return InterpretedPathOrUrl.BLOB
+    elif path_or_uri.startswith("data:"):
+        return InterpretedPathOrUrl.BASE_64
     elif path_or_uri.startswith("http"):
         return InterpretedPathOrUrl.URL
     elif os.sep in path_or_uri:
@@ -110,4 +119,6 @@ def clarify_path_or_url(path_or_uri: str) -> Tuple[Optional[str], Optional[str]]
             url = None
         case InterpretedPathOrUrl.BASE_64:
             raise NotImplementedError("Base 64 is not supported yet by clarify_path_or_url")
+        case InterpretedPathOrUrl.BLOB:
+            raise NotImplementedError("Blob URIs are not supported by clarify_path_or_url, their payload must be loaded from the payload storage")
     return file_path, url
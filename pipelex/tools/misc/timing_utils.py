@@ -0,0 +1,34 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """
+    Accumulates the wall-clock duration of named phases, in the order they were first entered.
+
+    Entering the same phase several times adds up its durations.
+    """
+
+    def __init__(self) -> None:
+        self.durations: Dict[str, float] = {}
+
+    def reset(self) -> None:
+        self.durations = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - started_at
+
+    @property
+    def total_duration(self) -> float:
+        return sum(self.durations.values())
+
+    def make_breakdown_text(self) -> str:
+        lines = [f"{name}: {duration * 1000:.1f} ms" for name, duration in self.durations.items()]
+        lines.append(f"total: {self.total_duration * 1000:.1f} ms")
+        return "\n".join(lines)
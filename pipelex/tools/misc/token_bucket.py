@@ -0,0 +1,71 @@
+import asyncio
+import time
+from typing import Sequence, Tuple
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to capacity tokens, refilled continuously at capacity tokens per refill period.
+
+    Reservations are served in call order: a reservation that can't be served right away is taken anyway,
+    the level goes negative, and the caller waits until the refill covers it, so later callers queue behind it.
+    """
+
+    def __init__(self, capacity: int, refill_period: float = 60.0):
+        if capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity}")
+        if refill_period <= 0:
+            raise ValueError(f"refill_period must be positive, got {refill_period}")
+        self.capacity = capacity
+        self.refill_rate = capacity / refill_period
+        self._level = float(capacity)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(float(self.capacity), self._level + (now - self._updated_at) * self.refill_rate)
+        self._updated_at = now
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserve tokens and return the delay in seconds before they are available.
+
+        An amount larger than the capacity is capped to the capacity, otherwise it could never be served.
+        """
+        self._refill()
+        self._level -= min(amount, float(self.capacity))
+        if self._level >= 0:
+            return 0.0
+        return -self._level / self.refill_rate
+
+    def give_back(self, amount: float) -> None:
+        """Return tokens to the bucket (or take more if amount is negative), e.g. when the actual usage differs from the reservation."""
+        self._refill()
+        self._level = min(float(self.capacity), self._level + amount)
+
+
+async def acquire_from_buckets(reservations: Sequence[Tuple[TokenBucket, float]]) -> float:
+    """
+    Reserve from all the buckets at once and wait until every reservation is available.
+
+    If the wait is cancelled, the reserved tokens are given back.
+
+    Returns:
+        The time waited, in seconds
+    """
+    delay = 0.0
+    for bucket, amount in reservations:
+        delay = max(delay, bucket.reserve(amount=amount))
+    if delay > 0:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            for bucket, amount in reservations:
+                bucket.give_back(amount=min(amount, float(bucket.capacity)))
+            raise
+    return delay
@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from pipelex.tools.config.models import ConfigModel
+
+
+class PdfRendererConfig(ConfigModel):
+    is_process_pool_enabled: bool
+    max_workers: int = Field(..., ge=1)
+    min_pages_per_chunk: int = Field(..., ge=1)
+    max_pages_rendered_ahead: int = Field(..., ge=1)
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import math
 import pathlib
-from typing import List
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Deque, List, Optional, Tuple
 
 import pypdfium2 as pdfium
 from PIL import Image
 from pypdfium2.raw import FPDFBitmap_BGRA
 
+from pipelex import log
 from pipelex.tools.exceptions import ToolException
+from pipelex.tools.misc.async_utils import SpawnedProcessPool
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
 from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.pdf.pdf_renderer_config import PdfRendererConfig
+from pipelex.tools.storage.local_blob_store import is_blob_uri
+from pipelex.tools.storage.payload_storage import payload_storage
 
 PDFIUM2_REFERENCE_DPI = 72
 
@@ -22,56 +30,216 @@ class PyPdfium2RendererError(ToolException):
 PdfInput = str | pathlib.Path | bytes
 
 
+def count_pdf_pages(pdf_input: PdfInput) -> int:
+    pdf_doc = pdfium.PdfDocument(pdf_input)
+    nb_pages = len(pdf_doc)
+    pdf_doc.close()
+    return nb_pages
+
+
+def render_pdf_page(pdf_doc: pdfium.PdfDocument, scale: float, page_index: int) -> Image.Image:
+    page = pdf_doc[page_index]
+    pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        scale=scale,  # pyright: ignore[reportArgumentType]
+        force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
+        rev_byteorder=True,  # so we get RGBA
+    ).to_pil()
+    page.close()
+    return pil_img  # pyright: ignore[reportUnknownVariableType]
+
+
+def render_pdf_page_range(pdf_input: PdfInput, scale: float, start_index: int = 0, stop_index: Optional[int] = None) -> List[Image.Image]:
+    """
+    Render the pages of a PDF from start_index (included) to stop_index (excluded, defaults to the end of the document).
+
+    This is a module-level function so that it can be sent to the worker processes, which each open the document independently.
+    """
+    pdf_doc = pdfium.PdfDocument(pdf_input)
+    if stop_index is None:
+        stop_index = len(pdf_doc)
+    images = [render_pdf_page(pdf_doc=pdf_doc, scale=scale, page_index=page_index) for page_index in range(start_index, stop_index)]
+    pdf_doc.close()
+    return images
+
+
+def split_page_ranges(nb_pages: int, max_nb_chunks: int, min_pages_per_chunk: int) -> List[Tuple[int, int]]:
+    """
+    Split the pages into at most max_nb_chunks contiguous (start, stop) ranges of about the same size.
+
+    There are only as many ranges as there are min_pages_per_chunk pages in the document, so that the ranges have at least
+    min_pages_per_chunk pages, except for the last one which gets the remaining pages.
+    """
+    if nb_pages == 0:
+        return []
+    nb_chunks = max(1, min(max_nb_chunks, nb_pages // min_pages_per_chunk))
+    chunk_size = math.ceil(nb_pages / nb_chunks)
+    return [(start_index, min(start_index + chunk_size, nb_pages)) for start_index in range(0, nb_pages, chunk_size)]
+
+
 class PyPdfium2Renderer:
     """
-    Thread-safe PDF page renderer built on pypdfium2.
+    PDF page renderer built on pypdfium2.
 
-    • All entry into the native PDFium library is protected by a single
-      asyncio.Lock, so the enclosing *process* is safe even if other
-      libraries spin up worker threads.
+    • Pages are rendered inside `asyncio.to_thread` and all entry into the native PDFium library
+      is protected by a single asyncio.Lock, because PDFium is not thread-safe.
 
-    • Heavy work runs inside `asyncio.to_thread`, keeping the event-loop
-      responsive for the rest of your application.
+    • Once set up with the [pipelex.pdf_renderer_config] with its process pool enabled, the pages of a document are split
+      into page ranges rendered in parallel by spawned worker processes, each opening the document independently.
+      Since every process has its own PDFium library, documents rendered concurrently don't wait for each other.
+      The entry point of the program must then be guarded by `if __name__ == "__main__":`, see SpawnedProcessPool.
+      If the process pool breaks, the pages are rendered in-process instead.
     """
 
     _pdfium_lock: asyncio.Lock = asyncio.Lock()  # shared per process
 
-    # ---- internal blocking helper ------------------------------------
-    @staticmethod
-    def _render_pdf_pages_sync(pdf_input: PdfInput, scale: float) -> List[Image.Image]:
-        pdf_doc = pdfium.PdfDocument(pdf_input)
-        images: List[Image.Image] = []
-        for index in range(len(pdf_doc)):
-            # page = doc.get_page(index)
-            page = pdf_doc[index]
-
-            pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                scale=scale,  # pyright: ignore[reportArgumentType]
-                force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
-                rev_byteorder=True,  # so we get RGBA
-            ).to_pil()
-
-            images.append(pil_img)  # pyright: ignore[reportUnknownArgumentType]
-            page.close()
-        pdf_doc.close()
-        return images
+    def __init__(self) -> None:
+        self.pdf_renderer_config: Optional[PdfRendererConfig] = None
+        self._process_pool = SpawnedProcessPool(pool_desc="PDF rendering process pool")
+
+    def setup(self, pdf_renderer_config: PdfRendererConfig) -> None:
+        self.pdf_renderer_config = pdf_renderer_config
+
+    def teardown(self) -> None:
+        self._process_pool.shutdown()
+        self.pdf_renderer_config = None
+
+    async def _render_pdf_page_range_in_process(
+        self,
+        pdf_input: PdfInput,
+        scale: float,
+        start_index: int = 0,
+        stop_index: Optional[int] = None,
+    ) -> List[Image.Image]:
+        async with self._pdfium_lock:
+            return await asyncio.to_thread(render_pdf_page_range, pdf_input, scale, start_index, stop_index)
 
     # ---- public async façade -----------------------------------------
     async def render_pdf_pages(self, pdf_input: PdfInput, dpi: int) -> List[Image.Image]:
+        """Render all the pages of a PDF as PIL images."""
+        scale = dpi / PDFIUM2_REFERENCE_DPI
+        pdf_renderer_config = self.pdf_renderer_config
+        if pdf_renderer_config is None or not pdf_renderer_config.is_process_pool_enabled:
+            return await self._render_pdf_page_range_in_process(pdf_input=pdf_input, scale=scale)
+
+        nb_pages = await self.count_pages(pdf_input=pdf_input)
+        page_ranges = split_page_ranges(
+            nb_pages=nb_pages,
+            max_nb_chunks=pdf_renderer_config.max_workers,
+            min_pages_per_chunk=pdf_renderer_config.min_pages_per_chunk,
+        )
+        try:
+            images_per_range = await asyncio.gather(
+                *[
+                    self._process_pool.submit(pdf_renderer_config.max_workers, render_pdf_page_range, pdf_input, scale, start_index, stop_index)
+                    for start_index, stop_index in page_ranges
+                ]
+            )
+        except BrokenProcessPool as exc:
+            log.warning(f"PDF rendering process pool is broken, rendering the pages in this process instead: {exc}")
+            return await self._render_pdf_page_range_in_process(pdf_input=pdf_input, scale=scale)
+        return [image for images in images_per_range for image in images]
+
+    async def iter_pdf_pages(
+        self,
+        pdf_input: PdfInput,
+        dpi: int,
+        start_index: int = 0,
+        stop_index: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Image.Image]:
+        """
+        Render the pages of a PDF one at a time, from start_index (included) to stop_index (excluded, defaults to the end of the document),
+        stopping after max_pages pages if set.
+
+        Pages are yielded in order, so the caller can encode and release each one before the next: only a few pages are held in memory
+        at once instead of the whole document. With the process pool, up to max_pages_rendered_ahead pages are rendered ahead.
+        """
+        if start_index < 0:
+            raise PyPdfium2RendererError(f"Invalid start_index {start_index}: page indices start at 0")
         scale = dpi / PDFIUM2_REFERENCE_DPI
-        """Render *one* page and return PNG bytes."""
+        # the document is opened once in this process, to render its pages in-process or to count them for the process pool
         async with self._pdfium_lock:
-            return await asyncio.to_thread(self._render_pdf_pages_sync, pdf_input, scale)
-
-    async def render_pdf_pages_from_uri(self, pdf_uri: str, dpi: int) -> List[Image.Image]:
+            pdf_doc = await asyncio.to_thread(pdfium.PdfDocument, pdf_input)
+            nb_pages = len(pdf_doc)
+        try:
+            stop_index = nb_pages if stop_index is None else min(stop_index, nb_pages)
+            if max_pages is not None:
+                stop_index = min(stop_index, start_index + max_pages)
+
+            # pages rendered in the process pool, if enabled, until it breaks
+            next_page_index = start_index
+            pdf_renderer_config = self.pdf_renderer_config
+            if pdf_renderer_config is not None and pdf_renderer_config.is_process_pool_enabled:
+                # the pages rendered ahead of the caller are bounded by max_pages_rendered_ahead, in ranges shared by the workers
+                chunk_size = max(1, pdf_renderer_config.max_pages_rendered_ahead // pdf_renderer_config.max_workers)
+                pending_renders: Deque[asyncio.Future[List[Image.Image]]] = collections.deque()
+                try:
+                    for chunk_start_index in range(start_index, stop_index, chunk_size):
+                        chunk_stop_index = min(chunk_start_index + chunk_size, stop_index)
+                        pending_renders.append(
+                            self._process_pool.submit(
+                                pdf_renderer_config.max_workers, render_pdf_page_range, pdf_input, scale, chunk_start_index, chunk_stop_index
+                            )
+                        )
+                        if len(pending_renders) >= pdf_renderer_config.max_workers:
+                            for page_image in await pending_renders.popleft():
+                                next_page_index += 1
+                                yield page_image
+                    while pending_renders:
+                        for page_image in await pending_renders.popleft():
+                            next_page_index += 1
+                            yield page_image
+                except BrokenProcessPool as exc:
+                    log.warning(f"PDF rendering process pool is broken, rendering the remaining pages in this process instead: {exc}")
+                finally:
+                    # when the caller stops early, the ranges rendered ahead are not needed anymore
+                    for pending_render in pending_renders:
+                        pending_render.cancel()
+
+            for page_index in range(next_page_index, stop_index):
+                async with self._pdfium_lock:
+                    page_image = await asyncio.to_thread(render_pdf_page, pdf_doc, scale, page_index)
+                yield page_image
+        finally:
+            async with self._pdfium_lock:
+                await asyncio.to_thread(pdf_doc.close)
+
+    async def load_pdf_input_from_uri(self, pdf_uri: str) -> PdfInput:
+        if is_blob_uri(pdf_uri):
+            return await asyncio.to_thread(payload_storage.load, uri=pdf_uri)
         pdf_path, pdf_url = clarify_path_or_url(path_or_uri=pdf_uri)  # pyright: ignore
         if pdf_url:
-            pdf_bytes = await fetch_file_from_url_httpx_async(url=pdf_url)
-            return await self.render_pdf_pages(pdf_input=pdf_bytes, dpi=dpi)
+            return await fetch_file_from_url_httpx_async(url=pdf_url)
         elif pdf_path:
-            return await self.render_pdf_pages(pdf_input=pdf_path, dpi=dpi)
+            return pdf_path
         else:
             raise PyPdfium2RendererError(f"Invalid PDF URI: {pdf_uri}")
 
+    async def count_pages(self, pdf_input: PdfInput) -> int:
+        async with self._pdfium_lock:
+            return await asyncio.to_thread(count_pdf_pages, pdf_input)
+
+    async def count_pages_from_uri(self, pdf_uri: str) -> int:
+        pdf_input = await self.load_pdf_input_from_uri(pdf_uri=pdf_uri)
+        return await self.count_pages(pdf_input=pdf_input)
+
+    async def render_pdf_pages_from_uri(self, pdf_uri: str, dpi: int) -> List[Image.Image]:
+        pdf_input = await self.load_pdf_input_from_uri(pdf_uri=pdf_uri)
+        return await self.render_pdf_pages(pdf_input=pdf_input, dpi=dpi)
+
+    async def iter_pdf_pages_from_uri(
+        self,
+        pdf_uri: str,
+        dpi: int,
+        start_index: int = 0,
+        stop_index: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Image.Image]:
+        pdf_input = await self.load_pdf_input_from_uri(pdf_uri=pdf_uri)
+        async for page_image in self.iter_pdf_pages(
+            pdf_input=pdf_input, dpi=dpi, start_index=start_index, stop_index=stop_index, max_pages=max_pages
+        ):
+            yield page_image
+
 
 pypdfium2_renderer = PyPdfium2Renderer()
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import tempfile
+import time
+from typing import Optional
+
+from typing_extensions import override
+
+from pipelex import log
+from pipelex.tools.exceptions import ToolException
+from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+
+BLOB_URI_PREFIX = "pipelex-blob://sha256/"
+
+
+class LocalBlobStoreError(ToolException):
+    pass
+
+
+def make_blob_uri(digest: str) -> str:
+    return f"{BLOB_URI_PREFIX}{digest}"
+
+
+def is_blob_uri(uri: str) -> bool:
+    return uri.startswith(BLOB_URI_PREFIX)
+
+
+class LocalBlobStore(StorageProviderAbstract):
+    """
+    Content-addressed store of binary payloads (images, PDFs, rendered page views) in a local directory.
+
+    Each payload is saved once, in a file named after its SHA-256 digest, and referenced by a pipelex-blob:// URI,
+    so that stuffs can hold a short reference instead of the base 64 encoded payload.
+    Files are written to a temporary file first and then renamed, so concurrent writers of the same payload are safe.
+    Blobs which were neither stored nor loaded for ttl_seconds are deleted by evict_expired_blobs(), which walks the whole store
+    directory, so it is called once when Pipelex is set up rather than along with the stores.
+    """
+
+    def __init__(self, store_dir: str, ttl_seconds: Optional[int] = None):
+        self.store_dir = store_dir
+        self.ttl_seconds = ttl_seconds
+
+    def get_blob_path(self, uri: str) -> str:
+        if not is_blob_uri(uri):
+            raise LocalBlobStoreError(f"'{uri}' is not a blob URI, it should start with '{BLOB_URI_PREFIX}'")
+        digest = uri.removeprefix(BLOB_URI_PREFIX)
+        if len(digest) != 64 or not all(char in "0123456789abcdef" for char in digest):
+            raise LocalBlobStoreError(f"'{uri}' is not a valid blob URI, it should end with a SHA-256 hex digest")
+        # the first 2 characters make a sub-directory so that no directory holds too many files
+        return os.path.join(self.store_dir, digest[:2], digest)
+
+    def has_blob(self, uri: str) -> bool:
+        return os.path.isfile(self.get_blob_path(uri=uri))
+
+    @override
+    def load(self, uri: str) -> bytes:
+        blob_path = self.get_blob_path(uri=uri)
+        try:
+            with open(blob_path, "rb") as blob_file:
+                data = blob_file.read()
+            self._touch_blob(blob_path=blob_path)
+            return data
+        except FileNotFoundError as exc:
+            raise LocalBlobStoreError(f"Blob '{uri}' not found in blob store '{self.store_dir}'") from exc
+        except OSError as exc:
+            raise LocalBlobStoreError(f"Could not read blob '{uri}' from blob store '{self.store_dir}': {exc}") from exc
+
+    @override
+    def store(self, data: bytes) -> str:
+        uri = make_blob_uri(digest=hashlib.sha256(data).hexdigest())
+        blob_path = self.get_blob_path(uri=uri)
+        if os.path.isfile(blob_path):
+            self._touch_blob(blob_path=blob_path)
+            return uri
+        blob_dir = os.path.dirname(blob_path)
+        try:
+            os.makedirs(blob_dir, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=blob_dir, suffix=".tmp")
+            try:
+                with os.fdopen(file_descriptor, "wb") as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_path, blob_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as exc:
+            raise LocalBlobStoreError(f"Could not write blob '{uri}' to blob store '{self.store_dir}': {exc}") from exc
+        return uri
+
+    def evict_expired_blobs(self) -> int:
+        """Delete the blobs which were neither stored nor loaded for ttl_seconds, and return how many were deleted."""
+        if self.ttl_seconds is None or not os.path.isdir(self.store_dir):
+            return 0
+        expiry_time = time.time() - self.ttl_seconds
+        nb_evicted = 0
+        for dir_path, _, file_names in os.walk(self.store_dir):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                try:
+                    if os.path.getmtime(file_path) < expiry_time:
+                        os.unlink(file_path)
+                        nb_evicted += 1
+                except OSError as exc:
+                    # the blob may have been evicted or touched concurrently
+                    log.debug(f"Could not evict blob file '{file_path}': {exc}")
+        if nb_evicted:
+            log.debug(f"Evicted {nb_evicted} expired blobs from blob store '{self.store_dir}'")
+        return nb_evicted
+
+    @staticmethod
+    def _touch_blob(blob_path: str) -> None:
+        # the modification time tells when the blob was last used, so that blobs still in use are not evicted
+        try:
+            os.utime(blob_path)
+        except OSError as exc:
+            log.debug(f"Could not touch blob file '{blob_path}': {exc}")
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from pipelex.tools.exceptions import ToolException
+from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+
+
+class PayloadStorageError(ToolException):
+    pass
+
+
+class PayloadStorage:
+    """
+    Where the binary payloads of stuffs (images, rendered page views...) are offloaded, so that stuffs hold a short URI
+    instead of a base 64 string which gets copied into every branch, artefact and serialization of the working memory.
+
+    Until it is set up with a storage provider, payloads stay inline as base 64 strings.
+    """
+
+    def __init__(self) -> None:
+        self.storage_provider: Optional[StorageProviderAbstract] = None
+
+    def setup(self, storage_provider: Optional[StorageProviderAbstract]) -> None:
+        self.storage_provider = storage_provider
+
+    def teardown(self) -> None:
+        self.storage_provider = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.storage_provider is not None
+
+    def store(self, data: bytes) -> Optional[str]:
+        """Store the payload and return its URI, or return None if no storage provider is set up."""
+        if self.storage_provider is None:
+            return None
+        return self.storage_provider.store(data=data)
+
+    def load(self, uri: str) -> bytes:
+        if self.storage_provider is None:
+            raise PayloadStorageError(f"Cannot load payload '{uri}': no storage provider is set up")
+        return self.storage_provider.load(uri=uri)
+
+
+payload_storage = PayloadStorage()
@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from pipelex.tools.exceptions import ToolException
+
+
+class SqliteCacheStoreError(ToolException):
+    pass
+
+
+class SqliteCacheStore:
+    """
+    Key-value cache of text values persisted in a local SQLite file.
+
+    Entries older than ttl_seconds are treated as missing and deleted when read.
+    When there are more than max_nb_entries entries, the least recently used ones are evicted.
+    SQLite handles the locking, so several processes can share the same file.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: Optional[int] = None,
+        max_nb_entries: Optional[int] = None,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_nb_entries = max_nb_entries
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            try:
+                if db_dir := os.path.dirname(self.db_path):
+                    os.makedirs(db_dir, exist_ok=True)
+                connection = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache_entries "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_accessed_at ON cache_entries (accessed_at)")
+                connection.commit()
+            except (OSError, sqlite3.Error) as exc:
+                raise SqliteCacheStoreError(f"Could not open the cache store at '{self.db_path}': {exc}") from exc
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def _locked_connection(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            connection = self._get_connection()
+            try:
+                yield connection
+            except sqlite3.Error as exc:
+                connection.rollback()
+                raise SqliteCacheStoreError(f"Cache store error at '{self.db_path}': {exc}") from exc
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._locked_connection() as connection:
+            row = connection.execute("SELECT value, created_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                connection.commit()
+                return None
+            connection.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+            connection.commit()
+            return str(value)
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._locked_connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if self.ttl_seconds is not None:
+                connection.execute("DELETE FROM cache_entries WHERE created_at < ?", (now - self.ttl_seconds,))
+            if self.max_nb_entries is not None:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE key IN (SELECT key FROM cache_entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_nb_entries,),
+                )
+            connection.commit()
+
+    def delete(self, key: str) -> None:
+        with self._locked_connection() as connection:
+            connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self) -> None:
+        with self._locked_connection() as connection:
+            connection.execute("DELETE FROM cache_entries")
+            connection.commit()
+
+    @property
+    def nb_entries(self) -> int:
+        with self._locked_connection() as connection:
+            row = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+            return int(row[0])
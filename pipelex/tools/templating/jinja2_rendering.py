@@ -1,6 +1,6 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
-from jinja2 import Template, meta
+from jinja2 import Template
 from jinja2.exceptions import (
     TemplateAssertionError,
     TemplateSyntaxError,
@@ -8,7 +8,6 @@ from jinja2.exceptions import (
 )
 
 from pipelex import log
-from pipelex.tools.templating.jinja2_environment import make_jinja2_env_from_template_provider
 from pipelex.tools.templating.jinja2_errors import (
     Jinja2ContextError,
     Jinja2RenderError,
@@ -16,6 +15,7 @@ from pipelex.tools.templating.jinja2_errors import (
     make_jinja2_error_explanation,
 )
 from pipelex.tools.templating.jinja2_models import Jinja2ContextKey
+from pipelex.tools.templating.jinja2_template_cache import CompiledJinja2Template, jinja2_template_cache
 from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
 from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
 from pipelex.tools.templating.templating_models import PromptingStyle
@@ -31,40 +31,54 @@ def _add_to_templating_context(temlating_context: Dict[str, Any], jinja2_context
     temlating_context[jinja2_context_key] = value
 
 
+def _select_templating_context(temlating_context: Mapping[str, Any], compiled_template: CompiledJinja2Template) -> Dict[str, Any]:
+    """
+    Select the part of the context used by the template, so that lazy values (e.g. stuff artefacts) are only computed when needed.
+    The Jinja2ContextKey entries are always kept because our filters read them from the jinja2 context.
+    Templates that include or import other templates get the whole context because we can't know which variables those use.
+    """
+    if compiled_template.is_referencing_templates:
+        return dict(temlating_context)
+    selected_names = compiled_template.undeclared_variables.union(Jinja2ContextKey)
+    return {name: temlating_context[name] for name in selected_names if name in temlating_context}
+
+
 async def render_jinja2(
     template_category: Jinja2TemplateCategory,
     template_provider: TemplateProviderAbstract,
-    temlating_context: Dict[str, Any],
+    temlating_context: Mapping[str, Any],
     jinja2_name: Optional[str] = None,
     jinja2: Optional[str] = None,
     prompting_style: Optional[PromptingStyle] = None,
 ) -> str:
-    jinja2_env, loader = make_jinja2_env_from_template_provider(
-        template_category=template_category,
-        template_provider=template_provider,
-    )
-
     template: Template
     template_source: str
     try:
         if jinja2:
-            template = jinja2_env.from_string(jinja2)
             template_source = jinja2
         elif jinja2_name:
-            template = jinja2_env.get_template(jinja2_name)
-            template_source = loader.get_source(jinja2_env, jinja2_name)[0]
+            template_source = jinja2_template_cache.get_template_source(
+                template_category=template_category,
+                template_provider=template_provider,
+                jinja2_name=jinja2_name,
+            )
         else:
             raise Jinja2StuffError("No jinja2 or jinja2_name in Jinja2Assignment")
+        compiled_template = jinja2_template_cache.get_compiled_template(
+            template_category=template_category,
+            template_provider=template_provider,
+            template_source=template_source,
+        )
+        template = compiled_template.template
     except TemplateAssertionError as exc:
         explanation = make_jinja2_error_explanation(jinja2_name=jinja2_name, template_text=jinja2)
         raise Jinja2RenderError(f"Jinja2 render error: '{exc}' {explanation}") from exc
 
-    parsed_ast = jinja2_env.parse(template_source)
-    if undeclared_variables := meta.find_undeclared_variables(parsed_ast):
+    if undeclared_variables := set(compiled_template.undeclared_variables):
         undeclared_variables.discard("preliminary_text")
         if undeclared_variables:
             log.verbose(undeclared_variables, "Jinja2 undeclared_variables")
-    temlating_context = temlating_context.copy()
+    temlating_context = _select_templating_context(temlating_context=temlating_context, compiled_template=compiled_template)
     if prompting_style:
         _add_to_templating_context(
             temlating_context=temlating_context,
@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Tuple
+
+from jinja2 import BaseLoader, Environment, Template, meta
+from pydantic import BaseModel, ConfigDict
+
+from pipelex.tools.templating.jinja2_environment import make_jinja2_env_from_template_provider
+from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
+from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
+
+JINJA2_TEMPLATE_CACHE_DEFAULT_MAX_SIZE = 1024
+
+# keys are (template category, id of the template provider, template source)
+Jinja2TemplateCacheKey = Tuple[Jinja2TemplateCategory, int, str]
+
+
+class CompiledJinja2Template(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    template: Template
+    undeclared_variables: FrozenSet[str]
+    is_referencing_templates: bool
+
+
+class Jinja2TemplateCacheStats(BaseModel):
+    nb_hits: int = 0
+    nb_misses: int = 0
+    nb_evictions: int = 0
+
+
+class Jinja2TemplateCache:
+    """
+    Process-wide LRU cache of compiled jinja2 templates and of their undeclared variables.
+
+    The jinja2 environments are also cached, one per template category and template provider,
+    so that the filters and loader are only set up once.
+    """
+
+    def __init__(self, max_size: int = JINJA2_TEMPLATE_CACHE_DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.stats = Jinja2TemplateCacheStats()
+        self._environments: Dict[Tuple[Jinja2TemplateCategory, int], Tuple[TemplateProviderAbstract, Environment, BaseLoader]] = {}
+        self._compiled_templates: OrderedDict[Jinja2TemplateCacheKey, CompiledJinja2Template] = OrderedDict()
+
+    def teardown(self) -> None:
+        """Resets the cache to an empty state."""
+        self._environments.clear()
+        self._compiled_templates.clear()
+        self.stats = Jinja2TemplateCacheStats()
+
+    @property
+    def size(self) -> int:
+        return len(self._compiled_templates)
+
+    def get_env(
+        self,
+        template_category: Jinja2TemplateCategory,
+        template_provider: TemplateProviderAbstract,
+    ) -> Tuple[Environment, BaseLoader]:
+        env_key = (template_category, id(template_provider))
+        if cached := self._environments.get(env_key):
+            cached_provider, jinja2_env, loader = cached
+            if cached_provider is template_provider:
+                return jinja2_env, loader
+            # the id of a provider that was garbage collected has been reused: its templates are stale
+            self._evict_templates_of(template_category=template_category, template_provider_id=id(template_provider))
+        jinja2_env, loader = make_jinja2_env_from_template_provider(
+            template_category=template_category,
+            template_provider=template_provider,
+        )
+        self._environments[env_key] = (template_provider, jinja2_env, loader)
+        return jinja2_env, loader
+
+    def get_template_source(
+        self,
+        template_category: Jinja2TemplateCategory,
+        template_provider: TemplateProviderAbstract,
+        jinja2_name: str,
+    ) -> str:
+        jinja2_env, loader = self.get_env(template_category=template_category, template_provider=template_provider)
+        return loader.get_source(jinja2_env, jinja2_name)[0]
+
+    def get_compiled_template(
+        self,
+        template_category: Jinja2TemplateCategory,
+        template_provider: TemplateProviderAbstract,
+        template_source: str,
+    ) -> CompiledJinja2Template:
+        """
+        Get the compiled template for a template source, compiling and caching it if needed.
+
+        Raises:
+            TemplateSyntaxError, TemplateAssertionError: If the template source cannot be compiled, nothing is cached in that case
+        """
+        cache_key: Jinja2TemplateCacheKey = (template_category, id(template_provider), template_source)
+        if compiled_template := self._compiled_templates.get(cache_key):
+            self._compiled_templates.move_to_end(cache_key)
+            self.stats.nb_hits += 1
+            return compiled_template
+
+        self.stats.nb_misses += 1
+        jinja2_env, _ = self.get_env(template_category=template_category, template_provider=template_provider)
+        parsed_ast = jinja2_env.parse(template_source)
+        compiled_template = CompiledJinja2Template(
+            template=jinja2_env.from_string(parsed_ast),
+            undeclared_variables=frozenset(meta.find_undeclared_variables(parsed_ast)),
+            is_referencing_templates=any(True for _ in meta.find_referenced_templates(parsed_ast)),
+        )
+        self._compiled_templates[cache_key] = compiled_template
+        while len(self._compiled_templates) > self.max_size:
+            self._compiled_templates.popitem(last=False)
+            self.stats.nb_evictions += 1
+        return compiled_template
+
+    def _evict_templates_of(self, template_category: Jinja2TemplateCategory, template_provider_id: int) -> None:
+        stale_keys = [cache_key for cache_key in self._compiled_templates if cache_key[:2] == (template_category, template_provider_id)]
+        for stale_key in stale_keys:
+            del self._compiled_templates[stale_key]
+            self.stats.nb_evictions += 1
+
+
+jinja2_template_cache = Jinja2TemplateCache()
@@ -41,6 +41,19 @@ class TestLLMGenText:
         pretty_print(generated_text)
         get_report_delegate().generate_report()
 
+    @pytest.mark.parametrize("topic, prompt_text", LLMTestCases.SINGLE_TEXT)
+    async def test_gen_text_stream_using_handle(self, llm_job_params: LLMJobParams, llm_handle: str, topic: str, prompt_text: str):
+        pretty_print(prompt_text, title=topic)
+        llm_worker = get_llm_worker(llm_handle=llm_handle)
+        llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+            user_text=prompt_text,
+            llm_job_params=llm_job_params,
+        )
+        text_chunks: List[str] = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job)]
+        assert text_chunks
+        pretty_print("".join(text_chunks))
+        assert llm_job.job_report.llm_tokens_usage
+
     @pytest.mark.parametrize("topic, prompt_text", LLMTestCases.SINGLE_TEXT)
     async def test_gen_text_async_using_llm_preset(self, llm_preset_id: str, topic: str, prompt_text: str):
         llm_worker, llm_job = get_async_worker_and_job(llm_preset_id=llm_preset_id, user_text=prompt_text)
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from pipelex.cogt.inference.cost_registry import CostRegistry
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_report import LLMTokensUsage
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+def make_llm_engine(llm_name: str, input_cost: float, output_cost: float) -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.OPENAI,
+        llm_family=LLMFamily.GPT_4O,
+        llm_name=llm_name,
+        version="latest",
+        is_gen_object_supported=True,
+        platform_llm_id={LLMPlatform.OPENAI: llm_name},
+        max_prompt_images=None,
+        cost_per_million_tokens_usd={TokenCategory.INPUT: input_cost, TokenCategory.OUTPUT: output_cost},
+    )
+    return LLMEngine(llm_platform=LLMPlatform.OPENAI, llm_model=llm_model)
+
+
+def make_tokens_usage(llm_engine: LLMEngine, nb_tokens_input: int, nb_tokens_input_cached: int, nb_tokens_output: int) -> LLMTokensUsage:
+    return LLMTokensUsage(
+        job_metadata=JobMetadata(pipeline_run_id="run_a"),
+        llm_engine=llm_engine,
+        nb_tokens_by_category={
+            TokenCategory.INPUT: nb_tokens_input,
+            TokenCategory.INPUT_CACHED: nb_tokens_input_cached,
+            TokenCategory.OUTPUT: nb_tokens_output,
+        },
+    )
+
+
+def make_cost_registry() -> CostRegistry:
+    small_llm_engine = make_llm_engine(llm_name="small_llm", input_cost=1.0, output_cost=4.0)
+    large_llm_engine = make_llm_engine(llm_name="large_llm", input_cost=10.0, output_cost=40.0)
+    cost_registry = CostRegistry()
+    for _ in range(2):
+        cost_registry.add_tokens_usage(
+            make_tokens_usage(llm_engine=small_llm_engine, nb_tokens_input=1_000_000, nb_tokens_input_cached=200_000, nb_tokens_output=500_000)
+        )
+    cost_registry.add_tokens_usage(
+        make_tokens_usage(llm_engine=large_llm_engine, nb_tokens_input=100_000, nb_tokens_input_cached=0, nb_tokens_output=10_000)
+    )
+    return cost_registry
+
+
+class TestCostRegistry:
+    def test_totals_are_updated_as_reports_are_added(self):
+        cost_registry = make_cost_registry()
+
+        small_llm_totals = cost_registry.totals_by_llm_name["small_llm"]
+        assert small_llm_totals.nb_cost_reports == 2
+        assert small_llm_totals.get_nb_tokens(TokenCategory.INPUT_JOINED) == 2_000_000
+        assert small_llm_totals.get_nb_tokens(TokenCategory.INPUT_CACHED) == 400_000
+        assert small_llm_totals.get_nb_tokens(TokenCategory.INPUT_NON_CACHED) == 1_600_000
+        # cached input tokens are discounted 50% when the model has no cost for them
+        assert small_llm_totals.get_cost(TokenCategory.INPUT_CACHED) == pytest.approx(0.2)
+        assert small_llm_totals.get_cost(TokenCategory.INPUT_NON_CACHED) == pytest.approx(1.6)
+        assert small_llm_totals.get_cost(TokenCategory.OUTPUT) == pytest.approx(4.0)
+        assert small_llm_totals.total_cost == pytest.approx(5.8)
+
+        assert cost_registry.totals.nb_cost_reports == 3
+        assert cost_registry.totals.get_nb_tokens(TokenCategory.OUTPUT) == 1_010_000
+        assert cost_registry.totals.total_cost == pytest.approx(5.8 + 1.0 + 0.4)
+
+    def test_cost_table_has_a_row_by_model_and_a_total_row(self):
+        cost_registry = make_cost_registry()
+
+        cost_table = cost_registry.make_cost_table(pipeline_run_id="run_a", unit_scale=1.0)
+
+        assert cost_table.row_count == 3
+        assert list(cost_table.columns[0].cells) == ["large_llm", "small_llm", "Total"]
+        assert list(cost_table.columns[-1].cells)[-1] == "7.2000"
+
+    def test_export_to_excel(self, tmp_path: str):
+        cost_report_file_path = os.path.join(tmp_path, "cost_report.xlsx")
+
+        make_cost_registry().export_to_excel(file_path=cost_report_file_path)
+
+        assert os.path.getsize(cost_report_file_path) > 0
+
+    def test_empty_registry_generates_no_report(self, tmp_path: str):
+        cost_report_file_path = os.path.join(tmp_path, "cost_report.xlsx")
+
+        CostRegistry().generate_report(pipeline_run_id="run_a", unit_scale=1.0, cost_report_file_path=cost_report_file_path)
+
+        assert not os.path.exists(cost_report_file_path)
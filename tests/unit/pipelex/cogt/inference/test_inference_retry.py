@@ -0,0 +1,240 @@
+import random
+from email.utils import formatdate
+from typing import Dict, List, Optional, Type
+
+import httpx
+import openai
+import pytest
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+from pipelex.cogt.config_cogt import InferenceRetryConfig
+from pipelex.cogt.inference.inference_retry import (
+    InferenceAttempt,
+    InferenceRetryPolicy,
+    RetryableErrorKind,
+    classify_retryable_error,
+    get_retry_after_seconds,
+    inference_retry_policy,
+)
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobConfig, LLMJobParams
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+FAST_RETRY_CONFIG = InferenceRetryConfig(
+    max_attempts=3,
+    initial_delay_seconds=0.001,
+    max_delay_seconds=0.01,
+    backoff_multiplier=2.0,
+    max_retry_after_seconds=1.0,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeAPIStatusError(Exception):
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(status_code=status_code, headers=headers)
+
+
+class FakeClientError(Exception):
+    def __init__(self, error_code: str, http_status_code: int):
+        super().__init__(f"An error occurred ({error_code})")
+        self.response = {"Error": {"Code": error_code}, "ResponseMetadata": {"HTTPStatusCode": http_status_code}}
+
+
+class SomeTimeoutLookalike(Exception):
+    pass
+
+
+class FlakyLLMWorker(LLMWorkerAbstract):
+    def __init__(self, llm_engine: LLMEngine, errors: List[Exception]):
+        super().__init__(llm_engine=llm_engine, structure_method=None, reporting_delegate=None)
+        self.errors = errors
+        self.nb_calls = 0
+
+    @override
+    async def _gen_text(self, llm_job: LLMJob) -> str:
+        self.nb_calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "generated text"
+
+    @override
+    async def _gen_object(self, llm_job: LLMJob, schema: Type[BaseModelTypeVar]) -> BaseModelTypeVar:
+        raise NotImplementedError()
+
+
+def make_flaky_llm_worker(errors: List[Exception]) -> FlakyLLMWorker:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.ANTHROPIC,
+        llm_family=LLMFamily.CLAUDE_3_5,
+        llm_name="claude-3-5-sonnet",
+        version="latest",
+        is_gen_object_supported=True,
+        platform_llm_id={LLMPlatform.ANTHROPIC: "claude-3-5-sonnet"},
+        max_prompt_images=None,
+    )
+    return FlakyLLMWorker(llm_engine=LLMEngine(llm_platform=LLMPlatform.ANTHROPIC, llm_model=llm_model), errors=errors)
+
+
+class TestClassifyRetryableError:
+    @pytest.mark.parametrize(
+        "status_code, expected_error_kind",
+        [
+            (429, RetryableErrorKind.RATE_LIMIT),
+            (529, RetryableErrorKind.OVERLOAD),
+            (503, RetryableErrorKind.OVERLOAD),
+            (504, RetryableErrorKind.TIMEOUT),
+            (500, RetryableErrorKind.SERVER_ERROR),
+            (400, None),
+            (404, None),
+        ],
+    )
+    def test_status_codes(self, status_code: int, expected_error_kind: Optional[RetryableErrorKind]):
+        assert classify_retryable_error(FakeAPIStatusError(status_code=status_code)) == expected_error_kind
+
+    def test_botocore_error_codes(self):
+        assert classify_retryable_error(FakeClientError(error_code="ThrottlingException", http_status_code=400)) == RetryableErrorKind.RATE_LIMIT
+        assert classify_retryable_error(FakeClientError(error_code="ValidationException", http_status_code=400)) is None
+
+    def test_timeout_and_connection_error_types(self, mocker: MockerFixture):
+        # the SDK errors only keep the request they are given
+        sdk_request = mocker.MagicMock()
+        assert classify_retryable_error(openai.APITimeoutError(request=sdk_request)) == RetryableErrorKind.TIMEOUT
+        assert classify_retryable_error(openai.APIConnectionError(request=sdk_request)) == RetryableErrorKind.CONNECTION
+        request = httpx.Request("POST", "https://api.example.com")
+        assert classify_retryable_error(httpx.ReadTimeout("timed out", request=request)) == RetryableErrorKind.TIMEOUT
+        assert classify_retryable_error(httpx.ConnectError("connection refused", request=request)) == RetryableErrorKind.CONNECTION
+        assert classify_retryable_error(ValueError("invalid")) is None
+        # errors are not recognized by their class name
+        assert classify_retryable_error(SomeTimeoutLookalike("Request timed out")) is None
+
+    def test_error_raised_while_handling_another_is_not_classified_by_it(self):
+        try:
+            try:
+                raise FakeAPIStatusError(status_code=529)
+            except FakeAPIStatusError:
+                raise ValueError("invalid response")
+        except ValueError as exc:
+            assert classify_retryable_error(exc) is None
+
+    def test_wrapped_error(self):
+        try:
+            try:
+                raise FakeAPIStatusError(status_code=529)
+            except FakeAPIStatusError as exc:
+                raise RuntimeError("LLM completion failed") from exc
+        except RuntimeError as wrapping_exc:
+            assert classify_retryable_error(wrapping_exc) == RetryableErrorKind.OVERLOAD
+
+
+class TestGetRetryAfterSeconds:
+    def test_seconds_and_milliseconds(self):
+        assert get_retry_after_seconds(FakeAPIStatusError(status_code=429, headers={"retry-after": "7"})) == 7.0
+        assert get_retry_after_seconds(FakeAPIStatusError(status_code=429, headers={"retry-after-ms": "1500", "retry-after": "2"})) == 1.5
+        assert get_retry_after_seconds(FakeAPIStatusError(status_code=429)) is None
+
+    def test_http_date(self):
+        retry_after_seconds = get_retry_after_seconds(FakeAPIStatusError(status_code=503, headers={"retry-after": formatdate(usegmt=True)}))
+        assert retry_after_seconds is not None
+        assert 0 <= retry_after_seconds <= 1
+
+
+class TestInferenceRetryPolicy:
+    def test_compute_delay(self):
+        retry_policy = InferenceRetryPolicy(retry_config=FAST_RETRY_CONFIG, rng=random.Random(42))
+        for attempt_number in range(1, 10):
+            delay = retry_policy.compute_delay(retry_config=FAST_RETRY_CONFIG, attempt_number=attempt_number)
+            assert 0 <= delay <= min(FAST_RETRY_CONFIG.max_delay_seconds, 0.001 * 2 ** (attempt_number - 1))
+        delay = retry_policy.compute_delay(retry_config=FAST_RETRY_CONFIG, attempt_number=1, retry_after_seconds=0.5)
+        assert 0.5 <= delay <= 0.5 + FAST_RETRY_CONFIG.initial_delay_seconds
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        retry_policy = InferenceRetryPolicy(retry_config=FAST_RETRY_CONFIG)
+        errors: List[Exception] = [FakeAPIStatusError(status_code=429), FakeAPIStatusError(status_code=529)]
+        inference_attempts: List[InferenceAttempt] = []
+
+        async def make_attempt() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "done"
+
+        result = await retry_policy.run(make_attempt=make_attempt, job_desc="test job", on_retry=inference_attempts.append)
+        assert result == "done"
+        assert [inference_attempt.error_kind for inference_attempt in inference_attempts] == [
+            RetryableErrorKind.RATE_LIMIT,
+            RetryableErrorKind.OVERLOAD,
+        ]
+        assert [inference_attempt.attempt_number for inference_attempt in inference_attempts] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_gives_up(self):
+        retry_policy = InferenceRetryPolicy(retry_config=FAST_RETRY_CONFIG)
+        nb_calls = 0
+
+        async def make_attempt() -> str:
+            nonlocal nb_calls
+            nb_calls += 1
+            raise FakeAPIStatusError(status_code=500)
+
+        with pytest.raises(FakeAPIStatusError):
+            await retry_policy.run(make_attempt=make_attempt, job_desc="test job")
+        assert nb_calls == FAST_RETRY_CONFIG.max_attempts
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            FakeAPIStatusError(status_code=400),
+            FakeAPIStatusError(status_code=429, headers={"retry-after": "3600"}),
+        ],
+    )
+    async def test_does_not_retry(self, error: Exception):
+        retry_policy = InferenceRetryPolicy(retry_config=FAST_RETRY_CONFIG)
+        nb_calls = 0
+
+        async def make_attempt() -> str:
+            nonlocal nb_calls
+            nb_calls += 1
+            raise error
+
+        with pytest.raises(FakeAPIStatusError):
+            await retry_policy.run(make_attempt=make_attempt, job_desc="test job")
+        assert nb_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_worker_retries_and_reports_attempts(self, mocker: MockerFixture):
+        mocker.patch.object(inference_retry_policy, "retry_config", FAST_RETRY_CONFIG)
+        llm_worker = make_flaky_llm_worker(errors=[FakeAPIStatusError(status_code=529)])
+        reporting_delegate = mocker.MagicMock()
+        llm_worker.reporting_delegate = reporting_delegate
+        llm_job = LLMJob(
+            job_metadata=JobMetadata(),
+            llm_prompt=LLMPrompt(user_text="Hello"),
+            job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+            job_config=LLMJobConfig(is_streaming_enabled=False, max_retries=1),
+        )
+
+        result = await llm_worker.gen_text(llm_job=llm_job)
+
+        assert result == "generated text"
+        assert llm_worker.nb_calls == 2
+        reporting_delegate.report_inference_attempt.assert_called_once()
+        inference_attempt = reporting_delegate.report_inference_attempt.call_args.kwargs["inference_attempt"]
+        assert inference_attempt.error_kind == RetryableErrorKind.OVERLOAD
+        reporting_delegate.report_inference_job.assert_called_once_with(inference_job=llm_job)
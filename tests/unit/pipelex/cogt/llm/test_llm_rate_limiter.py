@@ -0,0 +1,80 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobConfig, LLMJobParams
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter, LLMRateLimits, estimate_llm_job_nb_tokens
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+def make_llm_engine(llm_name: str) -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.OPENAI,
+        llm_family=LLMFamily.GPT_4O,
+        llm_name=llm_name,
+        version="latest",
+        is_gen_object_supported=True,
+        platform_llm_id={LLMPlatform.OPENAI: llm_name},
+        max_prompt_images=None,
+    )
+    return LLMEngine(llm_platform=LLMPlatform.OPENAI, llm_model=llm_model)
+
+
+def make_llm_job(user_text: str, max_tokens: int) -> LLMJob:
+    return LLMJob(
+        job_metadata=JobMetadata(),
+        llm_prompt=LLMPrompt(user_text=user_text),
+        job_params=LLMJobParams(temperature=0.5, max_tokens=max_tokens, seed=None),
+        job_config=LLMJobConfig(is_streaming_enabled=False, max_retries=1),
+    )
+
+
+class TestLLMRateLimiter:
+    rate_limits = LLMRateLimits.model_validate(
+        {
+            "openai": {
+                "requests_per_minute": 100,
+                "models": {"gpt-4o-mini": {"tokens_per_minute": 1000}},
+            }
+        }
+    )
+
+    def test_get_rate_limits(self):
+        assert [name for name, _ in self.rate_limits.get_rate_limits(llm_platform=LLMPlatform.OPENAI, llm_name="gpt-4o")] == ["openai"]
+        assert [name for name, _ in self.rate_limits.get_rate_limits(llm_platform=LLMPlatform.OPENAI, llm_name="gpt-4o-mini")] == [
+            "openai",
+            "openai/gpt-4o-mini",
+        ]
+        assert self.rate_limits.get_rate_limits(llm_platform=LLMPlatform.ANTHROPIC, llm_name="claude-3-7-sonnet") == []
+
+    def test_estimate_llm_job_nb_tokens(self):
+        assert estimate_llm_job_nb_tokens(llm_job=make_llm_job(user_text="a" * 400, max_tokens=50)) == 150
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_model_tokens(self, mocker: MockerFixture):
+        mock_sleep = mocker.patch("pipelex.tools.misc.token_bucket.asyncio.sleep", new_callable=mocker.AsyncMock)
+        llm_rate_limiter = LLMRateLimiter()
+        llm_rate_limiter.rate_limits = self.rate_limits
+
+        llm_job = make_llm_job(user_text="a" * 2000, max_tokens=300)
+        await llm_rate_limiter.acquire(llm_engine=make_llm_engine(llm_name="gpt-4o-mini"), llm_job=llm_job)
+        mock_sleep.assert_not_awaited()
+        # 800 tokens reserved out of 1000 per minute: the next job of the same model has to wait
+        await llm_rate_limiter.acquire(llm_engine=make_llm_engine(llm_name="gpt-4o-mini"), llm_job=llm_job)
+        mock_sleep.assert_awaited_once()
+        # another model of the platform only shares the requests per minute
+        await llm_rate_limiter.acquire(llm_engine=make_llm_engine(llm_name="gpt-4o"), llm_job=llm_job)
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_limits_never_waits(self, mocker: MockerFixture):
+        mock_sleep = mocker.patch("pipelex.tools.misc.token_bucket.asyncio.sleep", new_callable=mocker.AsyncMock)
+        llm_rate_limiter = LLMRateLimiter()
+        for _ in range(10):
+            await llm_rate_limiter.acquire(llm_engine=make_llm_engine(llm_name="gpt-4o"), llm_job=make_llm_job(user_text="Hello", max_tokens=10))
+        mock_sleep.assert_not_awaited()
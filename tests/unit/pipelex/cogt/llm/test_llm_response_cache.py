@@ -0,0 +1,96 @@
+import hashlib
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.content_generation.assignment_models import LLMAssignment
+from pipelex.cogt.content_generation.llm_generate import llm_gen_text
+from pipelex.cogt.image.prompt_image import PromptImageBytes, PromptImagePath, PromptImageUrl
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_models.llm_setting import LLMSetting
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_response_cache import (
+    IMAGE_FILE_HASH_CHUNK_SIZE,
+    LLMResponseCache,
+    LLMResponseKind,
+    make_llm_response_cache_key,
+    make_prompt_image_digest,
+)
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.storage.sqlite_cache_store import SqliteCacheStore
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class OtherAnswer(BaseModel):
+    answer: int
+
+
+class TestLLMResponseCacheKey:
+    llm_job_params = LLMJobParams(temperature=0.5, max_tokens=100, seed=None)
+    llm_prompt = LLMPrompt(
+        system_text="You are a helpful assistant.",
+        user_text="What is the capital of France?",
+        user_images=[PromptImageUrl(url="https://example.com/image.png"), PromptImageBytes(base_64=b"aW1hZ2U=")],
+    )
+
+    def make_key(self, **kwargs: object) -> str:
+        key_arguments: Dict[str, object] = {
+            "response_kind": LLMResponseKind.OBJECT,
+            "llm_engine_tag": "openai - gpt-4o - latest",
+            "llm_job_params": self.llm_job_params,
+            "llm_prompt": self.llm_prompt,
+            "schema": Answer,
+        }
+        key_arguments.update(kwargs)
+        return make_llm_response_cache_key(**key_arguments)  # type: ignore[arg-type]
+
+    def test_same_inputs_make_same_key(self):
+        assert self.make_key() == self.make_key(llm_prompt=self.llm_prompt.model_copy(deep=True))
+
+    def test_each_input_changes_the_key(self):
+        reference_key = self.make_key()
+        assert self.make_key(response_kind=LLMResponseKind.TEXT, schema=None) != reference_key
+        assert self.make_key(llm_engine_tag="anthropic - claude-3-7-sonnet - latest") != reference_key
+        assert self.make_key(llm_job_params=LLMJobParams(temperature=0.6, max_tokens=100, seed=None)) != reference_key
+        assert self.make_key(llm_prompt=self.llm_prompt.model_copy(update={"user_text": "And of Italy?"})) != reference_key
+        assert self.make_key(llm_prompt=self.llm_prompt.model_copy(update={"user_images": [PromptImageBytes(base_64=b"b3RoZXI=")]})) != reference_key
+        assert self.make_key(schema=OtherAnswer) != reference_key
+
+    def test_image_file_is_hashed_by_chunks(self, tmp_path: Path):
+        image_path = tmp_path / "image.png"
+        image_data = b"\x89PNG" + b"x" * (2 * IMAGE_FILE_HASH_CHUNK_SIZE + 10)
+        image_path.write_bytes(image_data)
+
+        digest = make_prompt_image_digest(prompt_image=PromptImagePath(file_path=str(image_path)))
+
+        assert digest == f"path:{hashlib.sha256(image_data).hexdigest()}"
+
+
+class TestLLMGenerateWithCache:
+    @pytest.mark.asyncio
+    async def test_llm_gen_text_uses_cache(self, tmp_path: Path, mocker: MockerFixture):
+        mocker.patch.object(LLMResponseCache, "is_enabled", new_callable=mocker.PropertyMock, return_value=True)
+        mocker.patch.object(LLMResponseCache, "_get_store", return_value=SqliteCacheStore(db_path=str(tmp_path / "llm_cache.sqlite")))
+        mock_llm_worker = mocker.MagicMock()
+        mock_llm_worker.llm_engine.tag = "openai - gpt-4o - latest"
+        mock_llm_worker.gen_text = mocker.AsyncMock(return_value="Paris")
+        mocker.patch("pipelex.cogt.content_generation.llm_generate.get_llm_worker", return_value=mock_llm_worker)
+        llm_assignment = LLMAssignment(
+            job_metadata=JobMetadata(),
+            llm_setting=LLMSetting(llm_handle="gpt-4o", temperature=0.5),
+            llm_prompt=LLMPrompt(user_text="What is the capital of France?"),
+        )
+
+        assert await llm_gen_text(llm_assignment=llm_assignment) == "Paris"
+        assert await llm_gen_text(llm_assignment=llm_assignment) == "Paris"
+        assert mock_llm_worker.gen_text.await_count == 1
+
+        other_llm_assignment = llm_assignment.clone_with_new_prompt(new_prompt=LLMPrompt(user_text="What is the capital of Italy?"))
+        await llm_gen_text(llm_assignment=other_llm_assignment)
+        assert mock_llm_worker.gen_text.await_count == 2
@@ -0,0 +1,174 @@
+from typing import AsyncIterator, List, Type
+
+import pytest
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+from pipelex.cogt.config_cogt import InferenceRetryConfig
+from pipelex.cogt.inference.inference_retry import inference_retry_policy
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobConfig, LLMJobParams
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+
+class OverloadedError(Exception):
+    status_code = 529
+
+
+class StreamingLLMWorker(LLMWorkerAbstract):
+    def __init__(
+        self,
+        llm_engine: LLMEngine,
+        text_chunks: List[str],
+        nb_failures_before_stream: int = 0,
+        is_failing_after_first_chunk: bool = False,
+    ):
+        super().__init__(llm_engine=llm_engine, structure_method=None, reporting_delegate=None)
+        self.text_chunks = text_chunks
+        self.nb_failures_before_stream = nb_failures_before_stream
+        self.is_failing_after_first_chunk = is_failing_after_first_chunk
+        self.nb_gen_text_calls = 0
+        self.nb_closed_streams = 0
+
+    @override
+    async def _gen_text(self, llm_job: LLMJob) -> str:
+        self.nb_gen_text_calls += 1
+        return "".join(self.text_chunks)
+
+    @override
+    async def _gen_text_stream(self, llm_job: LLMJob) -> AsyncIterator[str]:
+        if self.nb_failures_before_stream:
+            self.nb_failures_before_stream -= 1
+            raise OverloadedError("Overloaded")
+        try:
+            for text_chunk in self.text_chunks:
+                yield text_chunk
+                if self.is_failing_after_first_chunk:
+                    raise OverloadedError("Overloaded")
+        except GeneratorExit:
+            self.nb_closed_streams += 1
+            raise
+        if llm_tokens_usage := llm_job.job_report.llm_tokens_usage:
+            llm_tokens_usage.nb_tokens_by_category = {TokenCategory.INPUT: 10, TokenCategory.OUTPUT: len(self.text_chunks)}
+
+    @override
+    async def _gen_object(self, llm_job: LLMJob, schema: Type[BaseModelTypeVar]) -> BaseModelTypeVar:
+        raise NotImplementedError()
+
+
+class TextOnlyLLMWorker(StreamingLLMWorker):
+    @override
+    async def _gen_text_stream(self, llm_job: LLMJob) -> AsyncIterator[str]:
+        async for text_chunk in LLMWorkerAbstract._gen_text_stream(self, llm_job=llm_job):
+            yield text_chunk
+
+
+def make_llm_engine() -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.OPENAI,
+        llm_family=LLMFamily.GPT_4O,
+        llm_name="gpt-4o-mini",
+        version="latest",
+        is_gen_object_supported=True,
+        platform_llm_id={LLMPlatform.OPENAI: "gpt-4o-mini"},
+        max_prompt_images=None,
+    )
+    return LLMEngine(llm_platform=LLMPlatform.OPENAI, llm_model=llm_model)
+
+
+def make_llm_job(is_streaming_enabled: bool = False) -> LLMJob:
+    return LLMJob(
+        job_metadata=JobMetadata(),
+        llm_prompt=LLMPrompt(user_text="Tell me a story"),
+        job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        job_config=LLMJobConfig(is_streaming_enabled=is_streaming_enabled, max_retries=1),
+    )
+
+
+class TestLLMWorkerStream:
+    @pytest.mark.asyncio
+    async def test_gen_text_stream_yields_chunks_and_reports_once(self, mocker: MockerFixture):
+        llm_worker = StreamingLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon", " a time"])
+        reporting_delegate = mocker.MagicMock()
+        llm_worker.reporting_delegate = reporting_delegate
+        llm_job = make_llm_job()
+
+        text_chunks = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job)]
+
+        assert text_chunks == ["Once", " upon", " a time"]
+        assert llm_job.job_report.llm_tokens_usage is not None
+        assert llm_job.job_report.llm_tokens_usage.nb_tokens_by_category[TokenCategory.OUTPUT] == 3
+        assert llm_job.job_metadata.completed_at is not None
+        reporting_delegate.report_inference_job.assert_called_once_with(inference_job=llm_job)
+
+    @pytest.mark.asyncio
+    async def test_gen_text_uses_stream_when_enabled(self):
+        llm_worker = StreamingLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon", " a time"])
+
+        generated_text = await llm_worker.gen_text(llm_job=make_llm_job(is_streaming_enabled=True))
+
+        assert generated_text == "Once upon a time"
+        assert llm_worker.nb_gen_text_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_default_stream_is_the_whole_text(self):
+        llm_worker = TextOnlyLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon", " a time"])
+
+        text_chunks = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=make_llm_job())]
+
+        assert text_chunks == ["Once upon a time"]
+        assert llm_worker.nb_gen_text_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_before_first_chunk_is_retried(self, mocker: MockerFixture):
+        retry_config = InferenceRetryConfig(
+            max_attempts=2,
+            initial_delay_seconds=0.001,
+            max_delay_seconds=0.001,
+            backoff_multiplier=1.0,
+            max_retry_after_seconds=1.0,
+        )
+        mocker.patch.object(inference_retry_policy, "retry_config", retry_config)
+        llm_worker = StreamingLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon"], nb_failures_before_stream=1)
+
+        text_chunks = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=make_llm_job())]
+
+        assert text_chunks == ["Once", " upon"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stopped_early_is_closed_and_reported(self, mocker: MockerFixture):
+        llm_worker = StreamingLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon", " a time"])
+        reporting_delegate = mocker.MagicMock()
+        llm_worker.reporting_delegate = reporting_delegate
+        llm_job = make_llm_job()
+
+        text_stream = llm_worker.gen_text_stream(llm_job=llm_job)
+        first_text_chunk = await anext(text_stream)
+        await text_stream.aclose()
+
+        assert first_text_chunk == "Once"
+        assert llm_worker.nb_closed_streams == 1
+        reporting_delegate.report_inference_job.assert_called_once_with(inference_job=llm_job)
+
+    @pytest.mark.asyncio
+    async def test_stream_failing_after_first_chunk_is_closed_and_reported(self, mocker: MockerFixture):
+        llm_worker = StreamingLLMWorker(llm_engine=make_llm_engine(), text_chunks=["Once", " upon"], is_failing_after_first_chunk=True)
+        reporting_delegate = mocker.MagicMock()
+        llm_worker.reporting_delegate = reporting_delegate
+        llm_job = make_llm_job()
+
+        text_chunks: List[str] = []
+        with pytest.raises(OverloadedError):
+            async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job):
+                text_chunks.append(text_chunk)
+
+        assert text_chunks == ["Once"]
+        reporting_delegate.report_inference_job.assert_called_once_with(inference_job=llm_job)
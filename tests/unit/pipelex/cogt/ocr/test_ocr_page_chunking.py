@@ -0,0 +1,119 @@
+import asyncio
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+from pipelex.cogt.config_cogt import InferenceRetryConfig
+from pipelex.cogt.inference.inference_retry import inference_retry_policy
+from pipelex.cogt.ocr.ocr_engine import OcrEngine
+from pipelex.cogt.ocr.ocr_input import OcrInput
+from pipelex.cogt.ocr.ocr_job import OcrJob
+from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig, OcrJobParams, OcrPageChunkingConfig
+from pipelex.cogt.ocr.ocr_job_factory import OcrJobFactory
+from pipelex.cogt.ocr.ocr_output import OcrOutput, Page
+from pipelex.cogt.ocr.ocr_platform import OcrPlatform
+from pipelex.cogt.ocr.ocr_worker_abstract import OcrWorkerAbstract
+from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
+
+
+class ServerError(Exception):
+    status_code = 500
+
+
+class PageSelectingOcrWorker(OcrWorkerAbstract):
+    """Numbers the pages it returns within the requested chunk, and fails once on the chunk starting at failing_page_index."""
+
+    def __init__(self, failing_page_index: int):
+        super().__init__(ocr_engine=OcrEngine(ocr_platform=OcrPlatform.MISTRAL, ocr_model_name="fake-ocr"))
+        self.failing_page_index = failing_page_index
+        self.requested_page_indices: List[List[int]] = []
+        self.nb_running_chunks = 0
+        self.max_nb_running_chunks = 0
+
+    @property
+    @override
+    def is_page_selection_supported(self) -> bool:
+        return True
+
+    @override
+    async def _ocr_extract_pages(self, ocr_job: OcrJob) -> OcrOutput:
+        page_indices = ocr_job.ocr_input.page_indices or []
+        self.requested_page_indices.append(page_indices)
+        self.nb_running_chunks += 1
+        self.max_nb_running_chunks = max(self.max_nb_running_chunks, self.nb_running_chunks)
+        await asyncio.sleep(0.01)
+        self.nb_running_chunks -= 1
+        if page_indices and page_indices[0] == self.failing_page_index:
+            self.failing_page_index = -1
+            raise ServerError("Internal server error")
+        return OcrOutput(pages={chunk_page_index: Page(text=f"page {page_index}") for chunk_page_index, page_index in enumerate(page_indices)})
+
+
+def make_ocr_job(is_chunking_enabled: bool, pdf_uri: str = "tests/data/documents/long_document.pdf") -> OcrJob:
+    return OcrJobFactory.make_ocr_job(
+        ocr_input=OcrInput(pdf_uri=pdf_uri),
+        ocr_job_params=OcrJobParams.make_default_ocr_job_params(),
+        ocr_job_config=OcrJobConfig(
+            page_chunking_config=OcrPageChunkingConfig(
+                is_enabled=is_chunking_enabled,
+                min_nb_pages=10,
+                nb_pages_per_chunk=4,
+                max_concurrent_chunks=2,
+            )
+        ),
+    )
+
+
+class TestOcrPageChunking:
+    @pytest.mark.asyncio
+    async def test_chunks_are_merged_with_document_page_indices(self, mocker: MockerFixture):
+        mocker.patch.object(pypdfium2_renderer, "count_pages_from_uri", return_value=10)
+        retry_config = InferenceRetryConfig(
+            max_attempts=2,
+            initial_delay_seconds=0.001,
+            max_delay_seconds=0.001,
+            backoff_multiplier=1,
+            max_retry_after_seconds=0,
+        )
+        mocker.patch.object(inference_retry_policy, "retry_config", retry_config)
+        ocr_worker = PageSelectingOcrWorker(failing_page_index=4)
+
+        ocr_output = await ocr_worker.ocr_extract_pages(ocr_job=make_ocr_job(is_chunking_enabled=True))
+
+        assert {page_index: page.text for page_index, page in ocr_output.pages.items()} == {
+            page_index: f"page {page_index}" for page_index in range(10)
+        }
+        # only the failed chunk was retried
+        assert sorted(ocr_worker.requested_page_indices) == [[0, 1, 2, 3], [4, 5, 6, 7], [4, 5, 6, 7], [8, 9]]
+        assert ocr_worker.max_nb_running_chunks == 2
+
+    @pytest.mark.asyncio
+    async def test_short_documents_are_not_chunked(self, mocker: MockerFixture):
+        mocker.patch.object(pypdfium2_renderer, "count_pages_from_uri", return_value=9)
+        ocr_worker = PageSelectingOcrWorker(failing_page_index=-1)
+
+        await ocr_worker.ocr_extract_pages(ocr_job=make_ocr_job(is_chunking_enabled=True))
+
+        assert ocr_worker.requested_page_indices == [[]]
+
+    @pytest.mark.asyncio
+    async def test_chunking_disabled(self, mocker: MockerFixture):
+        count_pages = mocker.patch.object(pypdfium2_renderer, "count_pages_from_uri", return_value=100)
+        ocr_worker = PageSelectingOcrWorker(failing_page_index=-1)
+
+        await ocr_worker.ocr_extract_pages(ocr_job=make_ocr_job(is_chunking_enabled=False))
+
+        assert ocr_worker.requested_page_indices == [[]]
+        count_pages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_remote_documents_are_not_downloaded_to_be_chunked(self, mocker: MockerFixture):
+        count_pages = mocker.patch.object(pypdfium2_renderer, "count_pages_from_uri", return_value=100)
+        ocr_worker = PageSelectingOcrWorker(failing_page_index=-1)
+
+        await ocr_worker.ocr_extract_pages(ocr_job=make_ocr_job(is_chunking_enabled=True, pdf_uri="https://example.com/long_document.pdf"))
+
+        assert ocr_worker.requested_page_indices == [[]]
+        count_pages.assert_not_called()
@@ -3,10 +3,14 @@ from typing import ClassVar, List, Tuple
 import pytest
 
 from pipelex.core.concept_native import NativeConcept
+from pipelex.core.stuff_artefact import StuffArtefact
 from pipelex.core.stuff_content import HtmlContent, ImageContent, ListContent, NumberContent, TextAndImagesContent, TextContent
 from pipelex.core.stuff_factory import StuffFactory
 from pipelex.core.working_memory import WorkingMemory
 from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.hub import get_template_provider
+from pipelex.tools.templating.jinja2_rendering import render_jinja2
+from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
 
 
 class TestWorkingMemoryData:
@@ -179,3 +183,59 @@ class TestWorkingMemory:
         empty_memory = WorkingMemoryFactory.make_empty()
         assert len(empty_memory.root) == 0
         assert len(empty_memory.aliases) == 0
+
+    def test_working_memory_branch_copy_shares_stuffs(self, memory_with_aliases: WorkingMemory):
+        """Test that a branch copy shares the parent's stuffs without duplicating them."""
+        branch_memory = memory_with_aliases.make_branch_copy()
+
+        assert branch_memory.get_stuff("primary_text") is memory_with_aliases.get_stuff("primary_text")
+        assert branch_memory.get_stuff("backup_text") is memory_with_aliases.get_stuff("secondary_text")
+        assert branch_memory.root is not memory_with_aliases.root
+        assert branch_memory.aliases is not memory_with_aliases.aliases
+
+    def test_working_memory_branch_copy_isolates_writes(self, memory_with_aliases: WorkingMemory):
+        """Test that additions, overrides and removals in a branch copy don't affect the parent."""
+        branch_memory = memory_with_aliases.make_branch_copy()
+        new_stuff = StuffFactory.make_stuff(concept_str="native.Text", name="branch_text", content=TextContent(text="Branch content"))
+
+        branch_memory.set_new_main_stuff(stuff=new_stuff, name="branch_text")
+        branch_memory.remove_stuff(name="secondary_text")
+        branch_memory.set_alias(alias="main_text", target="branch_text")
+
+        assert memory_with_aliases.get_optional_stuff("branch_text") is None
+        assert memory_with_aliases.get_optional_main_stuff() is None
+        assert "secondary_text" in memory_with_aliases.root
+        assert memory_with_aliases.aliases["main_text"] == "primary_text"
+        assert branch_memory.get_main_stuff() is new_stuff
+
+    def test_working_memory_artefact_dict_is_lazy(self, memory_with_aliases: WorkingMemory):
+        """Test that stuff artefacts are only made when accessed, and shared with aliases."""
+        artefact_dict = memory_with_aliases.generate_stuff_artefact_dict()
+
+        assert set(artefact_dict.keys()) == {"primary_text", "secondary_text", "main_text", "backup_text"}
+        assert artefact_dict.nb_made_artefacts == 0
+
+        artefact = artefact_dict["main_text"]
+        assert isinstance(artefact, StuffArtefact)
+        assert artefact["stuff_name"] == "primary_text"
+        assert artefact_dict["primary_text"] is artefact
+        assert artefact_dict.nb_made_artefacts == 1
+
+        artefact_dict["_extra_param"] = 42
+        assert artefact_dict["_extra_param"] == 42
+        assert artefact_dict.nb_made_artefacts == 1
+
+    @pytest.mark.asyncio
+    async def test_working_memory_artefact_dict_rendering_only_makes_used_artefacts(self, memory_with_aliases: WorkingMemory):
+        """Test that rendering a template only makes the artefacts of the variables it references."""
+        artefact_dict = memory_with_aliases.generate_stuff_artefact_dict()
+
+        rendered_text = await render_jinja2(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=get_template_provider(),
+            temlating_context=artefact_dict,
+            jinja2="Question: {{ main_text.text }}",
+        )
+
+        assert rendered_text == "Question: Primary content"
+        assert artefact_dict.nb_made_artefacts == 1
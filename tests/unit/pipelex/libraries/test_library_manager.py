@@ -0,0 +1,28 @@
+from importlib.metadata import PackageNotFoundError
+
+from pytest_mock import MockerFixture
+
+import pipelex.libraries.library_manager
+from pipelex.libraries.library_manager import LibraryManager
+from pipelex.tools.misc.timing_utils import PhaseTimer
+
+
+class TestLibraryManager:
+    def test_load_libraries_parses_each_file_once(self, mocker: MockerFixture):
+        load_toml_spy = mocker.spy(pipelex.libraries.library_manager, "load_toml_from_path")
+        phase_timer = PhaseTimer()
+        library_manager = LibraryManager(phase_timer=phase_timer)
+        library_manager.load_libraries()
+
+        assert len(library_manager.pipe_library.root) > 0
+        loaded_paths = [call.kwargs["path"] for call in load_toml_spy.call_args_list]
+        assert loaded_paths
+        assert len(loaded_paths) == len(set(loaded_paths))
+        for phase_name in ("library_classes", "library_parsing", "library_domains", "library_concepts", "library_pipes"):
+            assert phase_name in phase_timer.durations
+
+    def test_snapshot_key_is_dropped_when_the_package_is_not_installed(self, mocker: MockerFixture):
+        mocker.patch.object(pipelex.libraries.library_manager, "version", side_effect=PackageNotFoundError("pipelex"))
+        library_manager = LibraryManager(phase_timer=PhaseTimer())
+
+        assert library_manager._compute_library_snapshot_key() is None  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from pipelex.libraries.library_manager import LibraryManager
+from pipelex.libraries.library_snapshot import LibrarySnapshot, LibrarySnapshotStore, compute_library_snapshot_key
+
+
+class TestLibrarySnapshot:
+    def test_snapshot_key_changes_with_files_and_fingerprints(self, tmp_path: Path):
+        library_file = tmp_path / "library.toml"
+        library_file.write_text('domain = "test"\n')
+        key = compute_library_snapshot_key(file_paths=[library_file], fingerprints=["pipelex=1.0"])
+        assert key == compute_library_snapshot_key(file_paths=[library_file, library_file], fingerprints=["pipelex=1.0"])
+        assert key != compute_library_snapshot_key(file_paths=[library_file], fingerprints=["pipelex=1.1"])
+
+        library_file.write_text('domain = "other"\n')
+        assert key != compute_library_snapshot_key(file_paths=[library_file], fingerprints=["pipelex=1.0"])
+
+    def test_snapshot_store_misses(self, tmp_path: Path):
+        snapshot_store = LibrarySnapshotStore(snapshot_dir=str(tmp_path))
+        assert snapshot_store.load(snapshot_key="unknown") is None
+
+        Path(snapshot_store.get_snapshot_path(snapshot_key="corrupted")).write_bytes(b"not a pickle")
+        assert snapshot_store.load(snapshot_key="corrupted") is None
+
+    def test_restore_libraries_from_snapshot(self, tmp_path: Path):
+        library_manager = LibraryManager()
+        library_manager.load_libraries()
+        snapshot_store = LibrarySnapshotStore(snapshot_dir=str(tmp_path))
+        snapshot_store.save(
+            snapshot=LibrarySnapshot(
+                snapshot_key="test_key",
+                domains=library_manager.domain_library.root,
+                concepts=library_manager.concept_library.root,
+                pipes=library_manager.pipe_library.root,
+                templates={"template_name": "Hello {{ name }}"},
+            )
+        )
+        library_snapshot = snapshot_store.load(snapshot_key="test_key")
+        assert library_snapshot is not None
+        assert library_snapshot.templates == {"template_name": "Hello {{ name }}"}
+
+        restored_library_manager = LibraryManager()
+        restored_library_manager.load_libraries(library_snapshot=library_snapshot)
+        assert restored_library_manager.domain_library.root.keys() == library_manager.domain_library.root.keys()
+        assert restored_library_manager.concept_library.root == library_manager.concept_library.root
+        assert restored_library_manager.pipe_library.root.keys() == library_manager.pipe_library.root.keys()
+        for pipe_code, pipe in library_manager.pipe_library.root.items():
+            assert restored_library_manager.pipe_library.root[pipe_code].model_dump() == pipe.model_dump()
@@ -0,0 +1,121 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.pipe_input_spec import PipeInputSpec
+from pipelex.core.pipe_output import PipeOutput
+from pipelex.core.pipe_run_params import BatchParams, PipeRunMode
+from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.core.stuff_content import ListContent, TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.pipe_controllers.pipe_batch import PipeBatch
+from pipelex.pipe_controllers.pipe_batch_checkpoint import PipeBatchCheckpointStore, make_batch_checkpoint_key
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.storage.sqlite_cache_store import SqliteCacheStore
+
+
+class FakeBranchRouter:
+    """Runs the branch pipe by upper-casing the item text, failing on the items listed in failing_texts."""
+
+    def __init__(self, failing_texts: List[str]):
+        self.failing_texts = failing_texts
+        self.branch_texts: List[str] = []
+
+    async def run_pipe_code(
+        self,
+        pipe_code: str,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        output_name: str,
+        pipe_run_params: object,
+    ) -> PipeOutput:
+        text = working_memory.get_stuff_as_str(name="text")
+        self.branch_texts.append(text)
+        if text in self.failing_texts:
+            raise RuntimeError(f"Branch failed on '{text}'")
+        output_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text=text.upper()), name=output_name)
+        return PipeOutput(working_memory=WorkingMemoryFactory.make_from_single_stuff(output_stuff), pipeline_run_id=job_metadata.pipeline_run_id)
+
+
+def make_pipe_batch() -> PipeBatch:
+    return PipeBatch(
+        domain="test_pipe_batch",
+        code="uppercase_all",
+        inputs=PipeInputSpec(root={"texts": "native.Text", "text": "native.Text"}),
+        output_concept_code="native.Text",
+        branch_pipe_code="uppercase_one",
+        batch_params=BatchParams(input_list_stuff_name="texts", input_item_stuff_name="text"),
+    )
+
+
+def make_working_memory(texts: List[str]) -> WorkingMemory:
+    texts_stuff = StuffFactory.make_stuff(
+        concept_str="native.Text",
+        content=ListContent(items=[TextContent(text=text) for text in texts]),
+        name="texts",
+    )
+    return WorkingMemoryFactory.make_from_single_stuff(texts_stuff)
+
+
+class TestPipeBatchCheckpoint:
+    def test_checkpoint_key(self):
+        item = TextContent(text="hello")
+        reference_key = make_batch_checkpoint_key(pipeline_run_id="run_1", pipe_code="batch", output_name=None, branch_index=0, item=item)
+        assert reference_key == make_batch_checkpoint_key(
+            pipeline_run_id="run_1", pipe_code="batch", output_name=None, branch_index=0, item=TextContent(text="hello")
+        )
+        assert reference_key.startswith("run_1/")
+        assert reference_key != make_batch_checkpoint_key(pipeline_run_id="run_2", pipe_code="batch", output_name=None, branch_index=0, item=item)
+        assert reference_key != make_batch_checkpoint_key(pipeline_run_id="run_1", pipe_code="batch", output_name=None, branch_index=1, item=item)
+        assert reference_key != make_batch_checkpoint_key(
+            pipeline_run_id="run_1", pipe_code="batch", output_name=None, branch_index=0, item=TextContent(text="bye")
+        )
+
+    @pytest.mark.asyncio
+    async def test_store_round_trip(self, tmp_path: Path, mocker: MockerFixture):
+        mocker.patch.object(PipeBatchCheckpointStore, "_get_store", return_value=SqliteCacheStore(db_path=str(tmp_path / "checkpoints.sqlite")))
+        checkpoint_store = PipeBatchCheckpointStore()
+        output_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text="HELLO"), name="result")
+
+        assert await checkpoint_store.get_output_stuff(checkpoint_key="run_1/key") is None
+        await checkpoint_store.set_output_stuff(checkpoint_key="run_1/key", output_stuff=output_stuff)
+        restored_stuff = await checkpoint_store.get_output_stuff(checkpoint_key="run_1/key")
+
+        assert restored_stuff is not None
+        assert restored_stuff.stuff_code == output_stuff.stuff_code
+        assert isinstance(restored_stuff.content, TextContent)
+        assert restored_stuff.content.text == "HELLO"
+
+    @pytest.mark.asyncio
+    async def test_resumed_batch_skips_completed_branches(self, tmp_path: Path, mocker: MockerFixture):
+        mocker.patch.object(PipeBatchCheckpointStore, "is_enabled", new_callable=mocker.PropertyMock, return_value=True)
+        mocker.patch.object(PipeBatchCheckpointStore, "_get_store", return_value=SqliteCacheStore(db_path=str(tmp_path / "checkpoints.sqlite")))
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_required_pipe", return_value=mocker.MagicMock(required_variables=lambda: set[str]()))
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_pipeline_tracker", return_value=mocker.MagicMock())
+        texts = ["a", "b", "c"]
+
+        failing_router = FakeBranchRouter(failing_texts=["c"])
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_pipe_router", return_value=failing_router)
+        with pytest.raises(RuntimeError):
+            await make_pipe_batch().run_pipe(
+                job_metadata=JobMetadata(pipeline_run_id="run_1"),
+                working_memory=make_working_memory(texts),
+                pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+            )
+        assert sorted(failing_router.branch_texts) == texts
+
+        resumed_router = FakeBranchRouter(failing_texts=[])
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_pipe_router", return_value=resumed_router)
+        pipe_output = await make_pipe_batch().run_pipe(
+            job_metadata=JobMetadata(pipeline_run_id="run_1"),
+            working_memory=make_working_memory(texts),
+            pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+        )
+
+        assert resumed_router.branch_texts == ["c"]
+        output_list = pipe_output.main_stuff_as_list(item_type=TextContent)
+        assert [item.text for item in output_list.items] == ["A", "B", "C"]
@@ -0,0 +1,100 @@
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.pipe_input_spec import PipeInputSpec
+from pipelex.core.pipe_output import PipeOutput
+from pipelex.core.pipe_run_params import BatchParams, PipeRunMode
+from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.core.stuff_content import ListContent, TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.pipe_controllers.pipe_batch import PipeBatch
+from pipelex.pipe_controllers.pipe_batch_models import BatchItemActivity, BatchItemErrorContent
+from pipelex.pipeline.activity.activity_models import ActivityReport
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+async def run_uppercase_branch(
+    pipe_code: str,
+    job_metadata: JobMetadata,
+    working_memory: WorkingMemory,
+    output_name: str,
+    pipe_run_params: object,
+) -> PipeOutput:
+    text = working_memory.get_stuff_as_str(name="text")
+    if text.startswith("bad"):
+        raise ValueError(f"Invalid text '{text}'")
+    output_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text=text.upper()), name=output_name)
+    return PipeOutput(working_memory=WorkingMemoryFactory.make_from_single_stuff(output_stuff), pipeline_run_id=job_metadata.pipeline_run_id)
+
+
+def make_pipe_batch(is_failure_tolerant: bool) -> PipeBatch:
+    return PipeBatch(
+        domain="test_pipe_batch",
+        code="uppercase_all",
+        inputs=PipeInputSpec(root={"texts": "native.Text", "text": "native.Text"}),
+        output_concept_code="native.Text",
+        branch_pipe_code="uppercase_one",
+        batch_params=BatchParams(input_list_stuff_name="texts", input_item_stuff_name="text"),
+        is_failure_tolerant=is_failure_tolerant,
+    )
+
+
+def make_working_memory(texts: List[str]) -> WorkingMemory:
+    texts_stuff = StuffFactory.make_stuff(
+        concept_str="native.Text",
+        content=ListContent(items=[TextContent(text=text) for text in texts]),
+        name="texts",
+    )
+    return WorkingMemoryFactory.make_from_single_stuff(texts_stuff)
+
+
+class TestPipeBatchFailureTolerance:
+    @pytest.fixture(autouse=True)
+    def fake_branch_pipe(self, mocker: MockerFixture):
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_required_pipe", return_value=mocker.MagicMock(required_variables=lambda: set[str]()))
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_pipeline_tracker", return_value=mocker.MagicMock())
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_pipe_router", return_value=mocker.MagicMock(run_pipe_code=run_uppercase_branch))
+
+    @pytest.mark.asyncio
+    async def test_failed_branch_aborts_by_default(self):
+        with pytest.raises(ValueError):
+            await make_pipe_batch(is_failure_tolerant=False).run_pipe(
+                job_metadata=JobMetadata(),
+                working_memory=make_working_memory(["a", "bad b", "c"]),
+                pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+            )
+
+    @pytest.mark.asyncio
+    async def test_failed_branches_are_recorded_and_activities_dispatched(self, mocker: MockerFixture):
+        activity_manager = mocker.MagicMock()
+        mocker.patch("pipelex.pipe_controllers.pipe_batch.get_activity_manager", return_value=activity_manager)
+        pipe_batch = make_pipe_batch(is_failure_tolerant=True)
+
+        pipe_output = await pipe_batch.run_pipe(
+            job_metadata=JobMetadata(),
+            working_memory=make_working_memory(["a", "bad b", "c", "bad d"]),
+            pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+            output_name="results",
+        )
+
+        assert [item.text for item in pipe_output.main_stuff_as_items(item_type=TextContent)] == ["A", "C"]
+        error_records = pipe_output.working_memory.get_stuff_as_list(
+            name=pipe_batch.make_errors_stuff_name(output_name="results"),
+            item_type=BatchItemErrorContent,
+        ).items
+        assert [(error_record.branch_index, error_record.error_type) for error_record in error_records] == [(1, "ValueError"), (3, "ValueError")]
+
+        activity_reports: List[ActivityReport] = [call.kwargs["activity_report"] for call in activity_manager.dispatch_activity.call_args_list]
+        batch_item_activities = [
+            activity_report.content for activity_report in activity_reports if isinstance(activity_report.content, BatchItemActivity)
+        ]
+        assert sorted((activity.branch_index, activity.is_success) for activity in batch_item_activities) == [
+            (0, True),
+            (1, False),
+            (2, True),
+            (3, False),
+        ]
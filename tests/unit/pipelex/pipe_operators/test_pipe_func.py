@@ -0,0 +1,90 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from pipelex.config import FuncExecutionMode
+from pipelex.core.pipe_input_spec import PipeInputSpec
+from pipelex.core.pipe_run_params import PipeRunMode
+from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.core.stuff_content import TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.exceptions import PipeFuncError
+from pipelex.pipe_operators.pipe_func import PipeFunc
+from pipelex.pipe_operators.pipe_func_runner import pipe_func_runner
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.func_registry import func_registry
+
+
+def shout(working_memory: WorkingMemory) -> TextContent:
+    return TextContent(text=f"{working_memory.get_stuff_as_str(name='text').upper()} from {threading.current_thread().name}")
+
+
+def shout_pid(working_memory: WorkingMemory) -> str:
+    return f"{working_memory.get_stuff_as_str(name='text').upper()} from process {os.getpid()}"
+
+
+async def shout_async(working_memory: WorkingMemory) -> TextContent:
+    await asyncio.sleep(0)
+    return TextContent(text=working_memory.get_stuff_as_str(name="text").upper())
+
+
+def make_working_memory() -> WorkingMemory:
+    text_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text="hello"), name="text")
+    return WorkingMemoryFactory.make_from_single_stuff(text_stuff)
+
+
+async def run_pipe_func(function_name: str, execution_mode: FuncExecutionMode) -> str:
+    pipe_func = PipeFunc(
+        domain="test_pipe_func",
+        code="shout_text",
+        inputs=PipeInputSpec(root={"text": "native.Text"}),
+        output_concept_code="native.Text",
+        function_name=function_name,
+        execution_mode=execution_mode,
+    )
+    pipe_output = await pipe_func.run_pipe(
+        job_metadata=JobMetadata(),
+        working_memory=make_working_memory(),
+        pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+        output_name="shouted",
+    )
+    return pipe_output.main_stuff_as_str
+
+
+class TestPipeFunc:
+    @pytest.fixture(autouse=True)
+    def registered_functions(self):
+        func_registry.register_function(shout)
+        func_registry.register_function(shout_pid)
+        func_registry.register_function(shout_async)
+        func_registry.register_function(lambda working_memory: TextContent(text="local"), name="shout_lambda")  # pyright: ignore[reportUnknownLambdaType, reportUnknownArgumentType]
+        yield
+        for function_name in ("shout", "shout_pid", "shout_async", "shout_lambda"):
+            func_registry.unregister_function_by_name(function_name)
+
+    @pytest.mark.asyncio
+    async def test_async_function_is_awaited(self):
+        assert await run_pipe_func(function_name="shout_async", execution_mode=FuncExecutionMode.THREAD) == "HELLO"
+
+    @pytest.mark.asyncio
+    async def test_inline_and_thread_execution_modes(self):
+        assert await run_pipe_func(function_name="shout", execution_mode=FuncExecutionMode.INLINE) == "HELLO from MainThread"
+        thread_output = await run_pipe_func(function_name="shout", execution_mode=FuncExecutionMode.THREAD)
+        assert thread_output.startswith("HELLO from pipe_func")
+        assert pipe_func_runner.thread_pool is not None
+        assert pipe_func_runner.thread_pool.stats.nb_tasks >= 1
+
+    @pytest.mark.asyncio
+    async def test_process_execution_mode(self):
+        process_output = await run_pipe_func(function_name="shout_pid", execution_mode=FuncExecutionMode.PROCESS)
+        assert process_output.startswith("HELLO from process ")
+        assert process_output != f"HELLO from process {os.getpid()}"
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_function_can_not_run_in_a_process(self):
+        with pytest.raises(PipeFuncError):
+            await run_pipe_func(function_name="shout_lambda", execution_mode=FuncExecutionMode.PROCESS)
@@ -0,0 +1,208 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from pydantic import BaseModel, field_serializer
+from typing_extensions import override
+
+from pipelex.config import FuncExecutionMode, get_config
+from pipelex.core.pipe_input_spec import PipeInputSpec
+from pipelex.core.pipe_run_params import PipeRunMode
+from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.core.stuff_content import TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.pipe_operators.pipe_func import PipeFunc
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.telemetry.in_memory_span_exporter import InMemorySpanExporter
+from pipelex.pipeline.telemetry.otlp_json_file_span_exporter import OtlpJsonFileSpanExporter, make_trace_id
+from pipelex.pipeline.telemetry.pipe_span import PipeSpan, PipeSpanStatus
+from pipelex.pipeline.telemetry.pipe_span_tracer import PipeSpanTracer, pipe_span_tracer
+from pipelex.pipeline.telemetry.telemetry_config import TelemetryConfig
+from pipelex.tools.func_registry import func_registry
+
+
+def make_tracer(span_exporter: InMemorySpanExporter) -> PipeSpanTracer:
+    tracer = PipeSpanTracer()
+    tracer.setup(telemetry_config=get_config().pipelex.telemetry_config, span_exporter=span_exporter)
+    return tracer
+
+
+def make_telemetry_config(is_output_size_recorded: bool) -> TelemetryConfig:
+    return get_config().pipelex.telemetry_config.model_copy(update={"is_output_size_recorded": is_output_size_recorded})
+
+
+class UnserializableOutput(BaseModel):
+    value: str
+
+    @field_serializer("value")
+    def serialize_value(self, value: str) -> str:
+        raise RuntimeError("cannot serialize")
+
+
+def shout_for_span(working_memory: WorkingMemory) -> TextContent:
+    return TextContent(text=working_memory.get_stuff_as_str(name="text").upper())
+
+
+class TestPipeSpanTracer:
+    @pytest.fixture
+    def in_memory_span_exporter(self) -> Iterator[InMemorySpanExporter]:
+        span_exporter = InMemorySpanExporter()
+        pipe_span_tracer.setup(telemetry_config=make_telemetry_config(is_output_size_recorded=True), span_exporter=span_exporter)
+        yield span_exporter
+        pipe_span_tracer.teardown()
+        pipe_span_tracer.setup(telemetry_config=get_config().pipelex.telemetry_config)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_child_spans_have_their_parent(self):
+        span_exporter = InMemorySpanExporter()
+        tracer = make_tracer(span_exporter=span_exporter)
+
+        async def run_child(pipe_code: str):
+            with tracer.trace_pipe(pipe_code=pipe_code, pipe_class="PipeLLM", pipeline_run_id="run_a"):
+                with tracer.time_inference_attempt():
+                    await asyncio.sleep(0.05)
+                    tracer.record_queue_wait(wait_seconds=0.05)
+                    await asyncio.sleep(0.02)
+
+        with tracer.trace_pipe(pipe_code="parent", pipe_class="PipeParallel", pipeline_run_id="run_a") as parent_span:
+            await asyncio.gather(run_child(pipe_code="child_1"), run_child(pipe_code="child_2"))
+
+        assert parent_span is not None
+        spans_by_code = {span.pipe_code: span for span in span_exporter.get_spans(pipeline_run_id="run_a")}
+        assert set(spans_by_code) == {"parent", "child_1", "child_2"}
+        assert spans_by_code["parent"].parent_span_id is None
+        for child_code in ("child_1", "child_2"):
+            child_span = spans_by_code[child_code]
+            assert child_span.parent_span_id == parent_span.span_id
+            assert child_span.queue_wait_seconds == 0.05
+            # the queue wait is not counted as inference time
+            assert child_span.duration_seconds is not None
+            assert 0.015 < child_span.inference_seconds < child_span.duration_seconds - 0.05
+        assert spans_by_code["parent"].inference_seconds == 0.0
+
+    def test_failed_pipe_span_has_error_status(self):
+        span_exporter = InMemorySpanExporter()
+        tracer = make_tracer(span_exporter=span_exporter)
+
+        with pytest.raises(ValueError):
+            with tracer.trace_pipe(pipe_code="failing", pipe_class="PipeFunc", pipeline_run_id="run_a"):
+                raise ValueError("boom")
+
+        [span] = span_exporter.spans
+        assert span.status == PipeSpanStatus.ERROR
+        assert span.error_message == "ValueError: boom"
+        assert span.duration_seconds is not None
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = PipeSpanTracer()
+        with tracer.trace_pipe(pipe_code="some_pipe", pipe_class="PipeFunc", pipeline_run_id="run_a") as pipe_span:
+            tracer.record_queue_wait(wait_seconds=1.0)
+        assert pipe_span is None
+        assert not tracer.is_enabled
+
+    @pytest.mark.asyncio
+    async def test_run_pipe_records_a_span(self, in_memory_span_exporter: InMemorySpanExporter):
+        func_registry.register_function(shout_for_span)
+        pipe_func = PipeFunc(
+            domain="test_pipe_span",
+            code="shout_for_span",
+            inputs=PipeInputSpec(root={"text": "native.Text"}),
+            output_concept_code="native.Text",
+            function_name="shout_for_span",
+            execution_mode=FuncExecutionMode.INLINE,
+        )
+        text_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text="hello"), name="text")
+        try:
+            await pipe_func.run_pipe(
+                job_metadata=JobMetadata(pipeline_run_id="run_with_span"),
+                working_memory=WorkingMemoryFactory.make_from_single_stuff(text_stuff),
+                pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.LIVE),
+            )
+        finally:
+            func_registry.unregister_function_by_name("shout_for_span")
+
+        [span] = in_memory_span_exporter.get_spans(pipeline_run_id="run_with_span")
+        assert span.pipe_code == "shout_for_span"
+        assert span.pipe_class == "PipeFunc"
+        assert span.status == PipeSpanStatus.OK
+        assert span.output_size_bytes == len(TextContent(text="HELLO").model_dump_json())
+
+    def test_output_size_is_only_recorded_when_enabled(self):
+        span_exporter = InMemorySpanExporter()
+        tracer = make_tracer(span_exporter=span_exporter)
+        with tracer.trace_pipe(pipe_code="some_pipe", pipe_class="PipeFunc", pipeline_run_id="run_a") as pipe_span:
+            assert pipe_span is not None
+            tracer.record_output(pipe_span=pipe_span, output=TextContent(text="hello"))
+        assert pipe_span.output_size_bytes is None
+
+        tracer.setup(telemetry_config=make_telemetry_config(is_output_size_recorded=True), span_exporter=span_exporter)
+        with tracer.trace_pipe(pipe_code="some_pipe", pipe_class="PipeFunc", pipeline_run_id="run_a") as pipe_span:
+            assert pipe_span is not None
+            tracer.record_output(pipe_span=pipe_span, output=TextContent(text="hello"))
+        assert pipe_span.output_size_bytes == len(TextContent(text="hello").model_dump_json())
+
+    def test_unserializable_output_does_not_fail_the_pipe(self):
+        pipe_span = PipeSpan(pipeline_run_id="run_a", pipe_code="some_pipe", pipe_class="PipeFunc")
+
+        pipe_span.record_output(output=UnserializableOutput(value="anything"))
+
+        assert pipe_span.output_size_bytes is None
+
+    def test_blocking_exporter_runs_in_a_background_thread(self, tmp_path: Any):
+        export_thread_names: List[str] = []
+
+        class RecordingOtlpJsonFileSpanExporter(OtlpJsonFileSpanExporter):
+            @override
+            def export(self, spans: List[PipeSpan]) -> None:
+                export_thread_names.append(threading.current_thread().name)
+                super().export(spans=spans)
+
+        file_path = str(tmp_path / "pipe_spans.otlp.jsonl")
+        tracer = PipeSpanTracer()
+        tracer.setup(
+            telemetry_config=get_config().pipelex.telemetry_config,
+            span_exporter=RecordingOtlpJsonFileSpanExporter(file_path=file_path, service_name="test_service"),
+        )
+        for pipe_code in ("first", "second"):
+            with tracer.trace_pipe(pipe_code=pipe_code, pipe_class="PipeFunc", pipeline_run_id="run_a"):
+                pass
+        tracer.teardown()
+
+        assert len(export_thread_names) == 2
+        assert all(thread_name != threading.current_thread().name for thread_name in export_thread_names)
+        with open(file_path, encoding="utf-8") as file:
+            span_names = [json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for line in file]
+        assert span_names == ["first", "second"]
+
+
+class TestOtlpJsonFileSpanExporter:
+    def test_export_appends_otlp_json_lines(self, tmp_path: Any):
+        file_path = str(tmp_path / "spans" / "pipe_spans.otlp.jsonl")
+        span_exporter = OtlpJsonFileSpanExporter(file_path=file_path, service_name="test_service")
+        parent_span = PipeSpan(pipeline_run_id="run_a", pipe_code="parent", pipe_class="PipeSequence")
+        child_span = PipeSpan(pipeline_run_id="run_a", pipe_code="child", pipe_class="PipeLLM", parent_span_id=parent_span.span_id)
+        child_span.inference_seconds = 1.5
+        child_span.output_size_bytes = 42
+        for span in (child_span, parent_span):
+            span.end()
+
+        span_exporter.export(spans=[child_span])
+        span_exporter.export(spans=[parent_span])
+
+        with open(file_path, encoding="utf-8") as file:
+            export_requests = [json.loads(line) for line in file]
+        assert len(export_requests) == 2
+        [resource_spans] = export_requests[0]["resourceSpans"]
+        assert resource_spans["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "test_service"}}]
+        [otlp_span] = resource_spans["scopeSpans"][0]["spans"]
+        assert otlp_span["traceId"] == make_trace_id(pipeline_run_id="run_a")
+        assert len(otlp_span["traceId"]) == 32
+        assert otlp_span["parentSpanId"] == parent_span.span_id
+        attributes: Dict[str, Optional[Dict[str, Any]]] = {attribute["key"]: attribute["value"] for attribute in otlp_span["attributes"]}
+        assert attributes["pipelex.inference_seconds"] == {"doubleValue": 1.5}
+        assert attributes["pipelex.output_size_bytes"] == {"intValue": "42"}
+        assert "parentSpanId" not in export_requests[1]["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
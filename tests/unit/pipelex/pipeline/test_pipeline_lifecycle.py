@@ -0,0 +1,55 @@
+import pytest
+
+from pipelex.config import get_config
+from pipelex.exceptions import PipelineManagerError
+from pipelex.hub import get_pipeline_manager, get_report_delegate
+from pipelex.pipeline.close import close_pipeline
+from pipelex.pipeline.pipeline_lifecycle import end_pipeline_run_job, evict_stale_pipeline_runs, open_pipeline_run
+from pipelex.pipeline.pipeline_manager import PipelineManager
+
+
+class TestPipelineLifecycle:
+    def test_stale_pipeline_run_ids(self):
+        pipeline_manager = PipelineManager()
+        for run_index in range(5):
+            pipeline = pipeline_manager.add_new_pipeline(pipeline_run_id=f"run_{run_index}")
+            pipeline.last_active_at = float(run_index)
+        pipeline_manager.get_pipeline(pipeline_run_id="run_0").mark_job_started()
+
+        assert pipeline_manager.get_stale_pipeline_run_ids(max_nb_open_runs=3, idle_ttl_seconds=None) == ["run_1", "run_2"]
+        assert pipeline_manager.get_stale_pipeline_run_ids(max_nb_open_runs=None, idle_ttl_seconds=None) == []
+        # all idle runs are expired, the running one is kept
+        assert pipeline_manager.get_stale_pipeline_run_ids(max_nb_open_runs=None, idle_ttl_seconds=1) == ["run_1", "run_2", "run_3", "run_4"]
+
+    def test_close_pipeline_releases_the_run(self):
+        pipeline = open_pipeline_run()
+        pipeline_run_id = pipeline.pipeline_run_id
+        with pytest.raises(PipelineManagerError):
+            close_pipeline(pipeline_run_id=pipeline_run_id, should_generate_report=False)
+        end_pipeline_run_job(pipeline=pipeline)
+
+        close_pipeline(pipeline_run_id=pipeline_run_id, should_generate_report=False)
+
+        assert get_pipeline_manager().get_optional_pipeline(pipeline_run_id=pipeline_run_id) is None
+        # the usage registry was released, so the run can be opened again
+        get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
+        get_report_delegate().close_registry(pipeline_run_id=pipeline_run_id)
+        # closing again is a no-op
+        close_pipeline(pipeline_run_id=pipeline_run_id, should_generate_report=False)
+
+    def test_expired_idle_runs_are_evicted(self):
+        pipeline_manager = get_pipeline_manager()
+        idle_pipeline = open_pipeline_run()
+        end_pipeline_run_job(pipeline=idle_pipeline)
+        running_pipeline = open_pipeline_run()
+        idle_ttl_seconds = get_config().pipelex.pipeline_retention_config.applied_idle_ttl_seconds
+        assert idle_ttl_seconds is not None
+        idle_pipeline.last_active_at -= idle_ttl_seconds + 1
+        running_pipeline.last_active_at -= idle_ttl_seconds + 1
+
+        assert evict_stale_pipeline_runs() == [idle_pipeline.pipeline_run_id]
+
+        assert pipeline_manager.get_optional_pipeline(pipeline_run_id=idle_pipeline.pipeline_run_id) is None
+        assert pipeline_manager.get_optional_pipeline(pipeline_run_id=running_pipeline.pipeline_run_id) is running_pipeline
+        end_pipeline_run_job(pipeline=running_pipeline)
+        close_pipeline(pipeline_run_id=running_pipeline.pipeline_run_id, should_generate_report=False)
@@ -0,0 +1,84 @@
+from typing import Literal, Union
+
+from pipelex.config import get_config
+from pipelex.core.stuff import Stuff
+from pipelex.core.stuff_content import TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
+
+
+def make_text_stuff(name: str, text: str) -> Stuff:
+    return StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text=text), name=name)
+
+
+def make_tracker(
+    max_nb_finished_runs: Union[int, Literal["unlimited"]],
+    max_finished_runs_bytes: Union[int, Literal["unlimited"]],
+) -> PipelineTracker:
+    tracker_config = get_config().pipelex.tracker_config.model_copy(
+        update={"max_nb_finished_runs": max_nb_finished_runs, "max_finished_runs_bytes": max_finished_runs_bytes}
+    )
+    pipeline_tracker = PipelineTracker(tracker_config=tracker_config)
+    pipeline_tracker.setup()
+    return pipeline_tracker
+
+
+def track_run(pipeline_tracker: PipelineTracker, pipeline_run_id: str, text: str = "some text") -> None:
+    pipeline_tracker.add_pipe_step(
+        pipeline_run_id=pipeline_run_id,
+        from_stuff=make_text_stuff(name="question", text=text),
+        to_stuff=make_text_stuff(name="answer", text=text),
+        pipe_code="answer_question",
+        comment="test",
+        pipe_layer=["answer_question"],
+    )
+
+
+class TestPipelineTracker:
+    def test_each_run_has_its_own_graph(self):
+        pipeline_tracker = make_tracker(max_nb_finished_runs="unlimited", max_finished_runs_bytes="unlimited")
+
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_a")
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_b")
+
+        run_graph_a = pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_a")
+        run_graph_b = pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_b")
+        assert run_graph_a is not None and run_graph_b is not None
+        assert run_graph_a.nx_graph.number_of_nodes() == 2  # pyright: ignore[reportUnknownMemberType]
+        assert run_graph_b.nx_graph.number_of_nodes() == 2  # pyright: ignore[reportUnknownMemberType]
+        assert run_graph_a.nb_bytes > 0
+
+    def test_finished_runs_are_evicted_beyond_max_nb(self):
+        pipeline_tracker = make_tracker(max_nb_finished_runs=2, max_finished_runs_bytes="unlimited")
+
+        for run_index in range(4):
+            track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id=f"run_{run_index}")
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_in_progress")
+        for run_index in range(4):
+            pipeline_tracker.finish_run(pipeline_run_id=f"run_{run_index}")
+
+        assert pipeline_tracker.nb_tracked_runs == 3
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_1") is None
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_2") is not None
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_3") is not None
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_in_progress") is not None
+
+    def test_finished_runs_are_evicted_beyond_max_bytes_except_the_last_one(self):
+        pipeline_tracker = make_tracker(max_nb_finished_runs="unlimited", max_finished_runs_bytes=10)
+
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_a", text="a" * 100)
+        pipeline_tracker.finish_run(pipeline_run_id="run_a")
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_a") is not None
+
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_b", text="b" * 100)
+        pipeline_tracker.finish_run(pipeline_run_id="run_b")
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_a") is None
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_b") is not None
+
+    def test_teardown_releases_all_runs(self):
+        pipeline_tracker = make_tracker(max_nb_finished_runs="unlimited", max_finished_runs_bytes="unlimited")
+        track_run(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_a")
+
+        pipeline_tracker.teardown()
+
+        assert pipeline_tracker.nb_tracked_runs == 0
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Dict
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.plugin_manager import PluginHandle, PluginManager
+from pipelex.plugins.bedrock.bedrock_client_aioboto3 import BedrockClientAioboto3
+
+
+class FakeBedrockRuntimeClient:
+    def __init__(self) -> None:
+        self.nb_enters = 0
+        self.nb_exits = 0
+
+    async def __aenter__(self) -> "FakeBedrockRuntimeClient":
+        self.nb_enters += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.nb_exits += 1
+
+    async def converse(self, **params: Any) -> Dict[str, Any]:
+        return {
+            "usage": {"inputTokens": 5, "outputTokens": 2},
+            "output": {"message": {"content": [{"text": "Hello"}]}},
+        }
+
+
+class TestBedrockClientAioboto3:
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_calls(self, mocker: MockerFixture):
+        bedrock_client = BedrockClientAioboto3(aws_region="us-east-1")
+        fake_client = FakeBedrockRuntimeClient()
+        mocker.patch.object(bedrock_client.session, "client", return_value=fake_client)
+
+        results = await asyncio.gather(*[bedrock_client.chat(messages=[], system_text=None, model="some-model", temperature=0.5) for _ in range(3)])
+
+        assert results[0] == ("Hello", {"input": 5, "output": 2})
+        assert fake_client.nb_enters == 1
+        assert fake_client.nb_exits == 0
+
+        bedrock_client.teardown()
+        await asyncio.sleep(0)
+        assert fake_client.nb_exits == 1
+
+    def test_client_is_closed_with_its_event_loop(self, mocker: MockerFixture):
+        bedrock_client = BedrockClientAioboto3(aws_region="us-east-1")
+        fake_client = FakeBedrockRuntimeClient()
+        mocker.patch.object(bedrock_client.session, "client", return_value=fake_client)
+
+        asyncio.run(bedrock_client.chat(messages=[], system_text=None, model="some-model", temperature=0.5))
+
+        assert fake_client.nb_exits == 1
+        bedrock_client.teardown()
+        assert fake_client.nb_exits == 1
+
+    def test_plugin_manager_teardown_closes_client(self, mocker: MockerFixture):
+        bedrock_client = BedrockClientAioboto3(aws_region="us-east-1")
+        fake_client = FakeBedrockRuntimeClient()
+        mocker.patch.object(bedrock_client.session, "client", return_value=fake_client)
+        plugin_manager = PluginManager()
+        plugin_manager.set_llm_sdk_instance(llm_sdk_handle=PluginHandle.BEDROCK_SDK, llm_sdk_instance=bedrock_client)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(bedrock_client.chat(messages=[], system_text=None, model="some-model", temperature=0.5))
+
+            plugin_manager.teardown()
+
+            assert fake_client.nb_exits == 1
+            assert plugin_manager.get_llm_sdk_instance(llm_sdk_handle=PluginHandle.BEDROCK_SDK) is None
+        finally:
+            loop.close()
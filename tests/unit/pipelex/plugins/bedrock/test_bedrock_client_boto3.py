@@ -0,0 +1,43 @@
+from typing import Any, AsyncGenerator, Dict, Iterator, List, cast
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict
+from pipelex.plugins.bedrock.bedrock_client_boto3 import BedrockClientBoto3
+
+
+class FakeEventStream:
+    def __init__(self, events: List[Dict[str, Any]]) -> None:
+        self.events = events
+        self.is_closed = False
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.events)
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+def make_text_event(text: str) -> Dict[str, Any]:
+    return {"contentBlockDelta": {"delta": {"text": text}}}
+
+
+class TestBedrockClientBoto3:
+    @pytest.mark.asyncio
+    async def test_stream_stopped_early_is_closed(self, mocker: MockerFixture):
+        bedrock_client = BedrockClientBoto3(aws_region="us-east-1", max_workers=2)
+        event_stream = FakeEventStream(events=[make_text_event("Hello"), make_text_event(" world")])
+        mocker.patch.object(bedrock_client, "boto3_client").converse_stream.return_value = {"stream": event_stream}
+        nb_tokens: NbTokensByCategoryDict = {}
+
+        text_stream = cast(
+            AsyncGenerator[str, None],
+            bedrock_client.chat_stream(messages=[], system_text=None, model="some-model", temperature=0.5, nb_tokens_by_category=nb_tokens),
+        )
+        first_chunk = await anext(text_stream)
+        await text_stream.aclose()
+
+        assert first_chunk == "Hello"
+        assert event_stream.is_closed
+        bedrock_client.thread_pool.shutdown()
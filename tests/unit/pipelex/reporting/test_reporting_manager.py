@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import cast
+
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_report import LLMTokensUsage, model_cost_per_token
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
+from pipelex.config import get_config
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.reporting import reporting_manager as reporting_manager_module
+from pipelex.reporting.reporting_manager import ReportingManager
+
+
+def make_llm_engine_without_cost(llm_name: str) -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.OPENAI,
+        llm_family=LLMFamily.GPT_4O,
+        llm_name=llm_name,
+        version="latest",
+        is_gen_object_supported=True,
+        platform_llm_id={LLMPlatform.OPENAI: llm_name},
+        max_prompt_images=None,
+        cost_per_million_tokens_usd={},
+    )
+    return LLMEngine(llm_platform=LLMPlatform.OPENAI, llm_model=llm_model)
+
+
+def make_llm_job(mocker: MockerFixture, nb_tokens_by_category: NbTokensByCategoryDict) -> LLMJob:
+    llm_job = mocker.MagicMock(spec=LLMJob)
+    llm_job.job_metadata = JobMetadata(pipeline_run_id="run_a", unit_job_id="llm_job_a", completed_at=datetime.now())
+    llm_job.job_report = mocker.MagicMock()
+    llm_job.job_report.llm_tokens_usage = LLMTokensUsage(
+        job_metadata=llm_job.job_metadata,
+        llm_engine=make_llm_engine_without_cost(llm_name="unpriced_llm"),
+        nb_tokens_by_category=nb_tokens_by_category,
+    )
+    return cast(LLMJob, llm_job)
+
+
+class TestReportingManager:
+    def test_cost_registry_error_does_not_fail_the_inference(self, mocker: MockerFixture):
+        reporting_manager = ReportingManager(reporting_config=get_config().pipelex.reporting_config)
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id="run_a")
+        log_error = mocker.patch.object(reporting_manager_module.log, "error")
+        # a tokens usage which already has non cached input tokens is rejected by the cost registry
+        llm_job = make_llm_job(mocker=mocker, nb_tokens_by_category={TokenCategory.INPUT: 10, TokenCategory.INPUT_NON_CACHED: 10})
+
+        reporting_manager.report_inference_job(inference_job=llm_job)
+
+        log_error.assert_called_once()
+        assert reporting_manager.get_cost_totals(pipeline_run_id="run_a").nb_cost_reports == 0
+        reporting_manager.teardown()
+
+    def test_missing_cost_is_warned_once_per_model(self, mocker: MockerFixture):
+        log_warning = mocker.patch("pipelex.cogt.llm.llm_report.log.warning")
+        first_llm_engine = make_llm_engine_without_cost(llm_name="first_unpriced_llm")
+        second_llm_engine = make_llm_engine_without_cost(llm_name="second_unpriced_llm")
+
+        for _ in range(3):
+            for llm_engine in (first_llm_engine, second_llm_engine):
+                for token_type in (TokenCategory.INPUT, TokenCategory.INPUT_CACHED, TokenCategory.OUTPUT):
+                    assert model_cost_per_token(llm_engine=llm_engine, token_type=token_type) == 0.0
+
+        assert log_warning.call_count == 2
@@ -0,0 +1,36 @@
+import logging
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex import log
+
+# the origin logger of the log calls made from this module
+ORIGIN_LOGGER_NAME = __name__.split(".", maxsplit=1)[0]
+
+
+class TestLogDispatch:
+    def test_lazy_content_is_only_evaluated_when_the_level_is_enabled(self, caplog: pytest.LogCaptureFixture):
+        caplog.set_level(logging.INFO, logger=ORIGIN_LOGGER_NAME)
+        calls: List[str] = []
+
+        def make_message() -> str:
+            calls.append("called")
+            return "expensive message"
+
+        log.debug(make_message)
+        assert calls == []
+
+        log.info(make_message)
+        assert calls == ["called"]
+        assert "expensive message" in caplog.text
+
+    def test_disabled_level_skips_formatting(self, caplog: pytest.LogCaptureFixture, mocker: MockerFixture):
+        caplog.set_level(logging.INFO, logger=ORIGIN_LOGGER_NAME)
+        purify_json_dict = mocker.patch("pipelex.tools.log.log_dispatch.purify_json_dict")
+
+        log.debug({"key": "value"}, title="Some data")
+
+        purify_json_dict.assert_not_called()
+        assert caplog.text == ""
@@ -0,0 +1,209 @@
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AsyncExitStack
+from typing import Any, List
+
+import pytest
+
+from pipelex.tools.misc.async_utils import BoundedTaskPool, LoopBoundResources, MeteredThreadPool, SpawnedProcessPool, TaskFactory
+
+
+class TestBoundedTaskPool:
+    @staticmethod
+    def make_task_factories(nb_tasks: int, in_flight_log: List[int]) -> List[TaskFactory[int]]:
+        nb_in_flight = 0
+
+        def make_task_factory(task_index: int) -> TaskFactory[int]:
+            async def task() -> int:
+                nonlocal nb_in_flight
+                nb_in_flight += 1
+                in_flight_log.append(nb_in_flight)
+                await asyncio.sleep(0.001 * (nb_tasks - task_index))
+                nb_in_flight -= 1
+                return task_index * 10
+
+            return task
+
+        return [make_task_factory(task_index) for task_index in range(nb_tasks)]
+
+    @pytest.mark.asyncio
+    async def test_results_keep_submission_order(self) -> None:
+        in_flight_log: List[int] = []
+        task_pool: BoundedTaskPool[int] = BoundedTaskPool(max_concurrency=3)
+
+        results = await task_pool.run(task_factories=self.make_task_factories(nb_tasks=10, in_flight_log=in_flight_log))
+
+        assert results == [task_index * 10 for task_index in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        in_flight_log: List[int] = []
+        task_pool: BoundedTaskPool[int] = BoundedTaskPool(max_concurrency=3)
+
+        await task_pool.run(task_factories=self.make_task_factories(nb_tasks=10, in_flight_log=in_flight_log))
+
+        assert max(in_flight_log) == 3
+        assert task_pool.stats.nb_workers == 3
+        assert task_pool.stats.max_in_flight == 3
+        assert task_pool.stats.max_queue_depth == 10
+
+    @pytest.mark.asyncio
+    async def test_unbounded_starts_everything(self) -> None:
+        in_flight_log: List[int] = []
+        task_pool: BoundedTaskPool[int] = BoundedTaskPool(max_concurrency=None)
+
+        await task_pool.run(task_factories=self.make_task_factories(nb_tasks=5, in_flight_log=in_flight_log))
+
+        assert max(in_flight_log) == 5
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised(self) -> None:
+        async def failing_task() -> int:
+            raise ValueError("boom")
+
+        task_pool: BoundedTaskPool[int] = BoundedTaskPool(max_concurrency=2)
+
+        with pytest.raises(ValueError, match="boom"):
+            await task_pool.run(task_factories=[failing_task])
+
+    def test_invalid_max_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            BoundedTaskPool[int](max_concurrency=0)
+
+
+class TestMeteredThreadPool:
+    @pytest.mark.asyncio
+    async def test_runs_on_its_own_threads_with_bounded_concurrency(self) -> None:
+        thread_pool = MeteredThreadPool(max_workers=2, thread_name_prefix="test_pool")
+
+        def blocking_call(value: int) -> str:
+            time.sleep(0.01)
+            return f"{threading.current_thread().name}:{value}"
+
+        try:
+            results = await asyncio.gather(*[thread_pool.run(blocking_call, value) for value in range(6)])
+        finally:
+            thread_pool.shutdown()
+
+        assert [result.split(":")[1] for result in results] == [str(value) for value in range(6)]
+        assert all(result.startswith("test_pool") for result in results)
+        assert thread_pool.stats.nb_tasks == 6
+        assert thread_pool.stats.max_in_flight == 2
+        assert thread_pool.stats.max_queue_depth >= 4
+        assert thread_pool.stats.max_wait_time > 0
+        assert thread_pool.nb_queued == 0
+        assert thread_pool.nb_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_is_raised(self) -> None:
+        thread_pool = MeteredThreadPool(max_workers=1, thread_name_prefix="test_pool")
+
+        def failing_call() -> int:
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                await thread_pool.run(failing_call)
+        finally:
+            thread_pool.shutdown()
+        assert thread_pool.nb_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_call_sees_the_context_variables_of_the_caller(self) -> None:
+        thread_pool = MeteredThreadPool(max_workers=1, thread_name_prefix="test_pool")
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="none")
+        request_id.set("request_1")
+
+        try:
+            seen_request_id = await thread_pool.run(request_id.get)
+        finally:
+            thread_pool.shutdown()
+        assert seen_request_id == "request_1"
+
+
+class TestSpawnedProcessPool:
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced(self) -> None:
+        process_pool = SpawnedProcessPool(pool_desc="test process pool")
+        try:
+            assert await process_pool.run(1, abs, -3) == 3
+            with pytest.raises(BrokenProcessPool):
+                # the worker process dies
+                await process_pool.run(1, os._exit, 1)
+            assert await process_pool.run(1, abs, -4) == 4
+        finally:
+            process_pool.shutdown()
+
+
+class FakeLoopBoundClient:
+    def __init__(self) -> None:
+        self.is_open = False
+        self.closed_in_loop: Any = None
+
+    async def __aenter__(self) -> "FakeLoopBoundClient":
+        self.is_open = True
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.is_open = False
+        self.closed_in_loop = asyncio.get_running_loop()
+
+
+class TestLoopBoundResources:
+    @staticmethod
+    def make_resources(opened_clients: List[FakeLoopBoundClient]) -> LoopBoundResources[FakeLoopBoundClient]:
+        async def open_client(exit_stack: AsyncExitStack) -> FakeLoopBoundClient:
+            client = await exit_stack.enter_async_context(FakeLoopBoundClient())
+            opened_clients.append(client)
+            return client
+
+        return LoopBoundResources(open_resource=open_client, resource_desc="fake client")
+
+    def test_one_resource_per_loop_closed_with_its_loop(self) -> None:
+        opened_clients: List[FakeLoopBoundClient] = []
+        resources = self.make_resources(opened_clients=opened_clients)
+        used_loops: List[asyncio.AbstractEventLoop] = []
+
+        async def use_resource() -> None:
+            used_loops.append(asyncio.get_running_loop())
+            first_client = await resources.get()
+            assert await resources.get() is first_client
+
+        asyncio.run(use_resource())
+        asyncio.run(use_resource())
+
+        assert len(opened_clients) == 2
+        assert [client.is_open for client in opened_clients] == [False, False]
+        assert [client.closed_in_loop for client in opened_clients] == used_loops
+        resources.teardown()
+
+    @pytest.mark.asyncio
+    async def test_teardown_in_running_loop_closes_the_resource(self) -> None:
+        opened_clients: List[FakeLoopBoundClient] = []
+        resources = self.make_resources(opened_clients=opened_clients)
+        client = await resources.get()
+
+        resources.teardown()
+        await asyncio.sleep(0)
+
+        assert not client.is_open
+        assert client.closed_in_loop is asyncio.get_running_loop()
+        assert resources.nb_resources == 0
+
+    def test_teardown_of_idle_loop_closes_the_resource(self) -> None:
+        opened_clients: List[FakeLoopBoundClient] = []
+        resources = self.make_resources(opened_clients=opened_clients)
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(resources.get())
+
+            resources.teardown()
+
+            assert not client.is_open
+            assert client.closed_in_loop is loop
+        finally:
+            loop.close()
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from pipelex.tools.misc.file_fetch_utils import HttpClientPool
+from pipelex.tools.misc.http_client_config import HttpClientConfig
+
+
+def make_http_client_config() -> HttpClientConfig:
+    return HttpClientConfig(max_connections=10, max_keepalive_connections=5, keepalive_expiry_seconds=30, is_http2_enabled=False)
+
+
+class TestHttpClientPool:
+    @pytest.mark.asyncio
+    async def test_async_client_is_reused_across_fetches(self):
+        http_client_pool = HttpClientPool(http_client_config=make_http_client_config())
+
+        async_client = await http_client_pool.get_async_client()
+        assert await http_client_pool.get_async_client() is async_client
+        assert not async_client.is_closed
+
+        http_client_pool.teardown()
+        await asyncio.sleep(0)
+        assert async_client.is_closed
+
+    def test_one_async_client_per_event_loop(self):
+        http_client_pool = HttpClientPool(http_client_config=make_http_client_config())
+
+        async def get_async_client_id() -> int:
+            return id(await http_client_pool.get_async_client())
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first_client_id = first_loop.run_until_complete(get_async_client_id())
+            assert first_loop.run_until_complete(get_async_client_id()) == first_client_id
+            assert second_loop.run_until_complete(get_async_client_id()) != first_client_id
+
+            http_client_pool.teardown()
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+    def test_async_client_is_closed_with_its_event_loop(self):
+        http_client_pool = HttpClientPool(http_client_config=make_http_client_config())
+
+        async_client = asyncio.run(http_client_pool.get_async_client())
+
+        assert async_client.is_closed
+        http_client_pool.teardown()
+
+    def test_sync_client_is_reused_and_closed(self):
+        http_client_pool = HttpClientPool(http_client_config=make_http_client_config())
+
+        sync_client = http_client_pool.get_sync_client()
+        assert http_client_pool.get_sync_client() is sync_client
+
+        http_client_pool.teardown()
+        assert sync_client.is_closed
+        assert http_client_pool.get_sync_client() is not sync_client
+        http_client_pool.teardown()
@@ -0,0 +1,32 @@
+import time
+
+from pipelex.tools.misc.timing_utils import PhaseTimer
+
+
+class TestPhaseTimer:
+    def test_phases_are_accumulated_in_order(self):
+        phase_timer = PhaseTimer()
+        with phase_timer.phase("parsing"):
+            time.sleep(0.01)
+        with phase_timer.phase("validation"):
+            pass
+        with phase_timer.phase("parsing"):
+            time.sleep(0.01)
+
+        assert list(phase_timer.durations.keys()) == ["parsing", "validation"]
+        assert phase_timer.durations["parsing"] >= 0.02
+        assert phase_timer.total_duration == sum(phase_timer.durations.values())
+        breakdown_lines = phase_timer.make_breakdown_text().splitlines()
+        assert [line.split(":")[0] for line in breakdown_lines] == ["parsing", "validation", "total"]
+
+        phase_timer.reset()
+        assert phase_timer.durations == {}
+
+    def test_phase_is_recorded_when_raising(self):
+        phase_timer = PhaseTimer()
+        try:
+            with phase_timer.phase("failing"):
+                raise ValueError("failure")
+        except ValueError:
+            pass
+        assert "failing" in phase_timer.durations
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.tools.misc.token_bucket import TokenBucket, acquire_from_buckets
+
+
+class TestTokenBucket:
+    def test_reserve_within_capacity_is_immediate(self):
+        token_bucket = TokenBucket(capacity=10)
+        assert token_bucket.reserve(amount=4) == 0.0
+        assert token_bucket.reserve(amount=6) == 0.0
+
+    def test_reserve_beyond_capacity_returns_refill_delay(self):
+        token_bucket = TokenBucket(capacity=60, refill_period=60.0)
+        assert token_bucket.reserve(amount=60) == 0.0
+        assert token_bucket.reserve(amount=30) == pytest.approx(30.0, abs=0.1)
+        # the next reservation queues behind the previous one
+        assert token_bucket.reserve(amount=30) == pytest.approx(60.0, abs=0.1)
+
+    def test_oversized_reservation_is_capped(self):
+        token_bucket = TokenBucket(capacity=10, refill_period=60.0)
+        assert token_bucket.reserve(amount=1000) == 0.0
+        assert token_bucket.level == pytest.approx(0.0, abs=0.01)
+
+    def test_give_back(self):
+        token_bucket = TokenBucket(capacity=10, refill_period=60.0)
+        token_bucket.reserve(amount=8)
+        token_bucket.give_back(amount=5)
+        assert token_bucket.level == pytest.approx(7.0, abs=0.01)
+        token_bucket.give_back(amount=100)
+        assert token_bucket.level == pytest.approx(10.0, abs=0.01)
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_the_slowest_bucket(self, mocker: MockerFixture):
+        mock_sleep = mocker.patch("pipelex.tools.misc.token_bucket.asyncio.sleep", new_callable=mocker.AsyncMock)
+        request_bucket = TokenBucket(capacity=1, refill_period=60.0)
+        token_bucket = TokenBucket(capacity=1000, refill_period=60.0)
+        assert await acquire_from_buckets(reservations=[(request_bucket, 1), (token_bucket, 100)]) == 0.0
+        mock_sleep.assert_not_awaited()
+
+        waited = await acquire_from_buckets(reservations=[(request_bucket, 1), (token_bucket, 100)])
+        assert waited == pytest.approx(60.0, abs=0.1)
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_acquire_gives_tokens_back(self):
+        token_bucket = TokenBucket(capacity=10, refill_period=60.0)
+        token_bucket.reserve(amount=10)
+        acquire_task = asyncio.create_task(acquire_from_buckets(reservations=[(token_bucket, 5)]))
+        await asyncio.sleep(0.01)
+        acquire_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await acquire_task
+        assert token_bucket.level == pytest.approx(0.0, abs=0.01)
@@ -0,0 +1,119 @@
+import asyncio
+import io
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Tuple
+
+import pypdfium2 as pdfium
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.tools.pdf.pdf_renderer_config import PdfRendererConfig
+from pipelex.tools.pdf.pypdfium2_renderer import PyPdfium2Renderer, split_page_ranges
+
+
+def make_pdf_bytes(page_sizes: List[Tuple[int, int]]) -> bytes:
+    pdf_doc = pdfium.PdfDocument.new()
+    for width, height in page_sizes:
+        pdf_doc.new_page(width, height)  # pyright: ignore[reportUnknownMemberType]
+    buffer = io.BytesIO()
+    pdf_doc.save(buffer)  # pyright: ignore[reportUnknownMemberType]
+    pdf_doc.close()
+    return buffer.getvalue()
+
+
+def make_pdf_renderer_config(is_process_pool_enabled: bool, min_pages_per_chunk: int) -> PdfRendererConfig:
+    return PdfRendererConfig(
+        is_process_pool_enabled=is_process_pool_enabled,
+        max_workers=2,
+        min_pages_per_chunk=min_pages_per_chunk,
+        max_pages_rendered_ahead=4,
+    )
+
+
+class TestPyPdfium2Renderer:
+    @pytest.mark.parametrize(
+        "nb_pages, max_nb_chunks, min_pages_per_chunk, expected_ranges",
+        [
+            (0, 4, 2, []),
+            (3, 4, 8, [(0, 3)]),
+            (10, 4, 1, [(0, 3), (3, 6), (6, 9), (9, 10)]),
+            (10, 4, 5, [(0, 5), (5, 10)]),
+            (300, 4, 8, [(0, 75), (75, 150), (150, 225), (225, 300)]),
+        ],
+    )
+    def test_split_page_ranges(self, nb_pages: int, max_nb_chunks: int, min_pages_per_chunk: int, expected_ranges: List[Tuple[int, int]]):
+        assert split_page_ranges(nb_pages=nb_pages, max_nb_chunks=max_nb_chunks, min_pages_per_chunk=min_pages_per_chunk) == expected_ranges
+
+    @pytest.mark.asyncio
+    async def test_process_pool_renders_pages_in_order(self):
+        page_sizes = [(100 + 10 * page_index, 200) for page_index in range(5)]
+        pdf_bytes = make_pdf_bytes(page_sizes=page_sizes)
+        renderer = PyPdfium2Renderer()
+        renderer.setup(pdf_renderer_config=make_pdf_renderer_config(is_process_pool_enabled=True, min_pages_per_chunk=1))
+        try:
+            images = await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72)
+        finally:
+            renderer.teardown()
+
+        assert [image.size for image in images] == page_sizes
+
+    @pytest.mark.asyncio
+    async def test_in_process_rendering_without_setup(self):
+        page_sizes = [(100, 200), (300, 100)]
+        images = await PyPdfium2Renderer().render_pdf_pages(pdf_input=make_pdf_bytes(page_sizes=page_sizes), dpi=144)
+        assert [image.size for image in images] == [(200, 400), (600, 200)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("is_process_pool_enabled", [False, True])
+    async def test_iter_pdf_pages_with_page_range(self, is_process_pool_enabled: bool):
+        page_sizes = [(100 + 10 * page_index, 200) for page_index in range(7)]
+        pdf_bytes = make_pdf_bytes(page_sizes=page_sizes)
+        renderer = PyPdfium2Renderer()
+        renderer.setup(
+            pdf_renderer_config=PdfRendererConfig(
+                is_process_pool_enabled=is_process_pool_enabled, max_workers=2, min_pages_per_chunk=2, max_pages_rendered_ahead=4
+            )
+        )
+        try:
+            all_sizes = [image.size async for image in renderer.iter_pdf_pages(pdf_input=pdf_bytes, dpi=72)]
+            range_sizes = [
+                image.size async for image in renderer.iter_pdf_pages(pdf_input=pdf_bytes, dpi=72, start_index=2, stop_index=6, max_pages=3)
+            ]
+        finally:
+            renderer.teardown()
+
+        assert all_sizes == page_sizes
+        assert range_sizes == page_sizes[2:5]
+
+    @pytest.mark.asyncio
+    async def test_broken_process_pool_falls_back_to_in_process_rendering(self, mocker: MockerFixture):
+        page_sizes = [(100 + 10 * page_index, 200) for page_index in range(5)]
+        pdf_bytes = make_pdf_bytes(page_sizes=page_sizes)
+        renderer = PyPdfium2Renderer()
+        renderer.setup(pdf_renderer_config=make_pdf_renderer_config(is_process_pool_enabled=True, min_pages_per_chunk=2))
+
+        def submit_to_broken_pool(*args: Any) -> asyncio.Future[Any]:
+            broken_render: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            broken_render.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+            return broken_render
+
+        mocker.patch.object(renderer._process_pool, "submit", side_effect=submit_to_broken_pool)  # pyright: ignore[reportPrivateUsage]
+        try:
+            images = await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72)
+            iterated_sizes = [image.size async for image in renderer.iter_pdf_pages(pdf_input=pdf_bytes, dpi=72)]
+        finally:
+            renderer.teardown()
+
+        assert [image.size for image in images] == page_sizes
+        assert iterated_sizes == page_sizes
+
+    @pytest.mark.asyncio
+    async def test_iter_pdf_pages_in_process_opens_the_document_once(self, mocker: MockerFixture):
+        page_sizes = [(100 + 10 * page_index, 200) for page_index in range(4)]
+        pdf_bytes = make_pdf_bytes(page_sizes=page_sizes)
+        open_document_spy = mocker.spy(pdfium, "PdfDocument")
+
+        sizes = [image.size async for image in PyPdfium2Renderer().iter_pdf_pages(pdf_input=pdf_bytes, dpi=72)]
+
+        assert sizes == page_sizes
+        assert open_document_spy.call_count == 1
@@ -0,0 +1,81 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from pipelex.core.stuff_content import ImageContent
+from pipelex.tools.storage.local_blob_store import BLOB_URI_PREFIX, LocalBlobStore, LocalBlobStoreError
+from pipelex.tools.storage.payload_storage import payload_storage
+
+
+class TestLocalBlobStore:
+    def test_store_and_load(self, tmp_path: Path):
+        blob_store = LocalBlobStore(store_dir=str(tmp_path / "blobs"))
+        data = b"some binary payload"
+
+        uri = blob_store.store(data=data)
+
+        assert uri == f"{BLOB_URI_PREFIX}{hashlib.sha256(data).hexdigest()}"
+        assert blob_store.has_blob(uri=uri)
+        assert blob_store.load(uri=uri) == data
+        assert LocalBlobStore(store_dir=str(tmp_path / "blobs")).load(uri=uri) == data
+
+    def test_same_payload_is_stored_once(self, tmp_path: Path):
+        blob_store = LocalBlobStore(store_dir=str(tmp_path))
+
+        first_uri = blob_store.store(data=b"payload")
+        second_uri = blob_store.store(data=b"payload")
+
+        assert first_uri == second_uri
+        assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 1
+
+    def test_invalid_and_missing_blobs(self, tmp_path: Path):
+        blob_store = LocalBlobStore(store_dir=str(tmp_path))
+        with pytest.raises(LocalBlobStoreError):
+            blob_store.load(uri="https://example.com/image.png")
+        with pytest.raises(LocalBlobStoreError):
+            blob_store.load(uri=f"{BLOB_URI_PREFIX}../../etc/passwd")
+        with pytest.raises(LocalBlobStoreError):
+            blob_store.load(uri=f"{BLOB_URI_PREFIX}{'0' * 64}")
+
+    def test_expired_blobs_are_evicted(self, tmp_path: Path):
+        blob_store = LocalBlobStore(store_dir=str(tmp_path), ttl_seconds=3600)
+        expired_uri = blob_store.store(data=b"expired payload")
+        used_uri = blob_store.store(data=b"used payload")
+        two_hours_ago = time.time() - 7200
+        for uri in (expired_uri, used_uri):
+            os.utime(blob_store.get_blob_path(uri=uri), (two_hours_ago, two_hours_ago))
+        blob_store.load(uri=used_uri)
+
+        nb_evicted = blob_store.evict_expired_blobs()
+
+        assert nb_evicted == 1
+        assert not blob_store.has_blob(uri=expired_uri)
+        assert blob_store.has_blob(uri=used_uri)
+
+    def test_image_content_holds_blob_reference(self, tmp_path: Path, mocker: MockerFixture):
+        blob_store = LocalBlobStore(store_dir=str(tmp_path))
+        mocker.patch.object(payload_storage, "storage_provider", blob_store)
+        image = Image.new("RGB", (4, 4), color="red")
+
+        image_content = ImageContent.make_from_image(image=image)
+
+        assert image_content.base_64 is None
+        assert image_content.blob_uri is not None
+        assert image_content.url == image_content.blob_uri
+        # the serialized stuff holds no payload, only its reference
+        assert "base64" not in image_content.model_dump_json()
+        assert len(image_content.model_dump_json()) < 300
+        assert image_content.get_resolved_url().startswith("data:image/png;base64,")
+        assert f'src="{image_content.get_resolved_url()}"' in image_content.rendered_html()
+        image_bytes = image_content.get_bytes()
+        assert image_bytes is not None
+        assert image_bytes.startswith(b"\x89PNG")
+        assert image_content.get_base_64() is not None
+
+        image_content.save_to_directory(directory=str(tmp_path / "saved"))
+        assert (tmp_path / "saved" / "img.png").read_bytes() == image_bytes
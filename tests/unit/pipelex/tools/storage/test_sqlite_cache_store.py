@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from pipelex.tools.storage.sqlite_cache_store import SqliteCacheStore
+
+
+class TestSqliteCacheStore:
+    def test_set_get_delete(self, tmp_path: Path):
+        cache_store = SqliteCacheStore(db_path=str(tmp_path / "cache" / "store.sqlite"))
+        assert cache_store.get(key="key") is None
+        cache_store.set(key="key", value="value")
+        assert cache_store.get(key="key") == "value"
+        cache_store.set(key="key", value="new value")
+        assert cache_store.get(key="key") == "new value"
+        assert cache_store.nb_entries == 1
+        cache_store.delete(key="key")
+        assert cache_store.get(key="key") is None
+        cache_store.close()
+
+    def test_entries_persist_across_instances(self, tmp_path: Path):
+        db_path = str(tmp_path / "store.sqlite")
+        cache_store = SqliteCacheStore(db_path=db_path)
+        cache_store.set(key="key", value="value")
+        cache_store.close()
+        assert SqliteCacheStore(db_path=db_path).get(key="key") == "value"
+
+    def test_ttl_expiration(self, tmp_path: Path, mocker: MockerFixture):
+        mock_time = mocker.patch("pipelex.tools.storage.sqlite_cache_store.time.time", return_value=1000.0)
+        cache_store = SqliteCacheStore(db_path=str(tmp_path / "store.sqlite"), ttl_seconds=60)
+        cache_store.set(key="key", value="value")
+        mock_time.return_value = 1059.0
+        assert cache_store.get(key="key") == "value"
+        mock_time.return_value = 1061.0
+        assert cache_store.get(key="key") is None
+        assert cache_store.nb_entries == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path, mocker: MockerFixture):
+        mock_time = mocker.patch("pipelex.tools.storage.sqlite_cache_store.time.time", return_value=1000.0)
+        cache_store = SqliteCacheStore(db_path=str(tmp_path / "store.sqlite"), max_nb_entries=2)
+        cache_store.set(key="first", value="1")
+        mock_time.return_value = 1001.0
+        cache_store.set(key="second", value="2")
+        mock_time.return_value = 1002.0
+        assert cache_store.get(key="first") == "1"
+        mock_time.return_value = 1003.0
+        cache_store.set(key="third", value="3")
+        assert cache_store.nb_entries == 2
+        assert cache_store.get(key="second") is None
+        assert cache_store.get(key="first") == "1"
+        assert cache_store.get(key="third") == "3"
@@ -0,0 +1,116 @@
+from typing import Dict
+
+import pytest
+from jinja2 import TemplateSyntaxError
+from typing_extensions import override
+
+from pipelex.tools.templating.jinja2_template_cache import Jinja2TemplateCache
+from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
+from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
+
+
+class DictTemplateProvider(TemplateProviderAbstract):
+    def __init__(self, templates: Dict[str, str]):
+        self.templates = templates
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
+
+    @override
+    def get_template(self, template_name: str) -> str:
+        return self.templates[template_name]
+
+
+class TestJinja2TemplateCache:
+    @pytest.fixture
+    def template_provider(self) -> DictTemplateProvider:
+        return DictTemplateProvider(templates={"greeting": "Hello {{ name }}, welcome to {{ place }}"})
+
+    def test_hits_and_misses(self, template_provider: DictTemplateProvider):
+        cache = Jinja2TemplateCache()
+
+        first = cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            template_source="Hello {{ name }}",
+        )
+        second = cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            template_source="Hello {{ name }}",
+        )
+        cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.MARKDOWN,
+            template_provider=template_provider,
+            template_source="Hello {{ name }}",
+        )
+
+        assert second is first
+        assert first.undeclared_variables == frozenset({"name"})
+        assert cache.stats.nb_hits == 1
+        assert cache.stats.nb_misses == 2
+        assert cache.size == 2
+
+    def test_named_template_source(self, template_provider: DictTemplateProvider):
+        cache = Jinja2TemplateCache()
+
+        template_source = cache.get_template_source(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            jinja2_name="greeting",
+        )
+        compiled_template = cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            template_source=template_source,
+        )
+
+        assert compiled_template.undeclared_variables == frozenset({"name", "place"})
+
+    def test_size_bound_evicts_least_recently_used(self, template_provider: DictTemplateProvider):
+        cache = Jinja2TemplateCache(max_size=2)
+
+        for template_source in ["{{ a }}", "{{ b }}", "{{ a }}", "{{ c }}"]:
+            cache.get_compiled_template(
+                template_category=Jinja2TemplateCategory.LLM_PROMPT,
+                template_provider=template_provider,
+                template_source=template_source,
+            )
+        cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            template_source="{{ a }}",
+        )
+
+        assert cache.size == 2
+        assert cache.stats.nb_evictions == 1
+        assert cache.stats.nb_hits == 2
+
+    def test_syntax_error_is_not_cached(self, template_provider: DictTemplateProvider):
+        cache = Jinja2TemplateCache()
+
+        with pytest.raises(TemplateSyntaxError):
+            cache.get_compiled_template(
+                template_category=Jinja2TemplateCategory.LLM_PROMPT,
+                template_provider=template_provider,
+                template_source="{{ unclosed ",
+            )
+        assert cache.size == 0
+
+    def test_teardown(self, template_provider: DictTemplateProvider):
+        cache = Jinja2TemplateCache()
+        cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            template_source="{{ a }}",
+        )
+
+        cache.teardown()
+
+        assert cache.size == 0
+        assert cache.stats.nb_misses == 0